@@ -0,0 +1,160 @@
+"""
+감독-배우 전처리 벤치마크
+
+기존 방식(iterrows + 배우마다 dict/set 갱신)과 정수 코드 배열 집계 방식(factorize + bincount/unique)을
+실제 데이터의 분포(영화당 배우 수, 장르, 감독/배우 등장 빈도)를 따르는 합성 영화 데이터에서 비교합니다.
+실행: 프로젝트 루트에서 `python src/benchmark_preprocess.py [영화 수 ...]` (기본 100000)
+"""
+import io
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+
+from movie_dataset import DATASET_DIR, convert_csv, dataset_exists, load_movie_dataset, save_movie_dataset
+from preprocess_for_gephi import DirectorActorPreprocessor
+
+N_MOVIES = 100000
+RANDOM_SEED = 42
+ACTORS_PER_MOVIE_POOL = 2.0    # 배우 이름 수 = 영화 수 x 이 값
+MOVIES_PER_DIRECTOR = 3.0      # 감독 이름 수 = 영화 수 / 이 값
+ZIPF_EXPONENT = 1.1            # 소수의 배우/감독이 많은 영화에 등장하는 분포
+
+
+def _zipf_choice(rng, n_names, size):
+    weights = 1.0 / np.arange(1, n_names + 1) ** ZIPF_EXPONENT
+    return rng.choice(n_names, size=size, p=weights / weights.sum())
+
+
+def make_movies(n_movies, reference, seed=RANDOM_SEED):
+    """reference(실제 영화 데이터)의 배우 수/장르 분포로 수집 결과와 같은 형태의 합성 데이터를 만듭니다."""
+    rng = np.random.default_rng(seed)
+    actor_counts = rng.choice(reference['actor_count'].to_numpy(), size=n_movies)
+    genre_lists = reference['genre'].to_numpy()[rng.integers(len(reference), size=n_movies)]
+
+    n_actor_names = int(n_movies * ACTORS_PER_MOVIE_POOL)
+    actor_ids = _zipf_choice(rng, n_actor_names, int(actor_counts.sum()))
+    actor_names = np.array([f"배우{i}" for i in range(n_actor_names)], dtype=object)[actor_ids]
+    actors = np.split(actor_names, np.cumsum(actor_counts)[:-1])
+
+    n_directors = max(int(n_movies / MOVIES_PER_DIRECTOR), 1)
+    directors = np.array([f"감독{i}" for i in range(n_directors)], dtype=object)[_zipf_choice(rng, n_directors, n_movies)]
+
+    return pd.DataFrame({
+        'movie_cd': np.arange(n_movies) + 20000000,
+        'title': [f"영화{i}" for i in range(n_movies)],
+        'director': directors,
+        'actors': [names.tolist() for names in actors],
+        'actor_count': actor_counts,
+        'release_date': '',
+        'genre': list(genre_lists),
+        'genre_count': [len(genres) for genres in genre_lists],
+        'production_year': rng.integers(2019, 2025, size=n_movies),
+        'show_time': rng.integers(60, 180, size=n_movies),
+    })
+
+
+def legacy_nodes_edges(preprocessor):
+    """
+    기존 create_nodes/create_edges의 반복문 (배우 노드 순서는 집합 순서라 실행마다 다름)
+    이름으로 사람을 구분하므로 영화인 코드가 없는 합성 데이터에서만 집계 방식과 결과가 같습니다.
+    """
+    actor_id_map = dict(zip(preprocessor.actor_names, preprocessor.actor_node_ids))
+    director_id_map = dict(zip(preprocessor.director_names, preprocessor.director_node_ids))
+    actors = set()
+    actor_movies = {}
+    actor_genres = {}
+    for _, row in preprocessor.data.iterrows():
+        for actor in row['actors']:
+            actor = actor.strip()
+            actors.add(actor)
+            actor_movies[actor] = actor_movies.get(actor, 0) + 1
+            if actor not in actor_genres:
+                actor_genres[actor] = set()
+            actor_genres[actor].update(row['genre'])
+    nodes = pd.DataFrame({
+        'Id': [actor_id_map[a] for a in actors],
+        'Label': list(actors),
+        'Type': 'Actor',
+        'MovieCount': [actor_movies[a] for a in actors],
+        'Genres': [list(actor_genres[a]) for a in actors]
+    })
+
+    edges = []
+    for _, row in preprocessor.data.iterrows():
+        director_id = director_id_map[row['director']]
+        for actor in row['actors']:
+            edges.append({
+                'Source': director_id,
+                'Target': actor_id_map[actor.strip()],
+                'Type': 'Undirected',
+                'Weight': 1
+            })
+    edges = pd.DataFrame(edges).groupby(['Source', 'Target', 'Type'], as_index=False)['Weight'].sum()
+    return nodes, edges
+
+
+def vectorized_nodes_edges(preprocessor):
+    preprocessor.create_nodes()
+    preprocessor.create_edges()
+    return preprocessor.nodes[preprocessor.nodes['Type'] == 'Actor'], preprocessor.edges
+
+
+def _actor_nodes_csv(nodes):
+    """기존 방식의 배우 순서/장르 순서는 집합 순서라 정해져 있지 않으므로 정렬한 뒤 CSV 텍스트로 비교"""
+    nodes = nodes.assign(Genres=nodes['Genres'].map(sorted))
+    return nodes.sort_values('Id').to_csv(index=False)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run(n_movies, reference, workdir):
+    dataset_dir = f"{workdir}/movies_{n_movies}"
+    save_movie_dataset(make_movies(n_movies, reference), dataset_dir)
+    preprocessor = DirectorActorPreprocessor(dataset_dir=dataset_dir, output_dir=f"{workdir}/gephi")
+    with redirect_stdout(io.StringIO()):
+        _, load_sec = timed(preprocessor.load_and_filter_data)
+        (legacy_nodes, legacy_edges), legacy_sec = timed(legacy_nodes_edges, preprocessor)
+        (nodes, edges), vectorized_sec = timed(vectorized_nodes_edges, preprocessor)
+
+    same = (
+        _actor_nodes_csv(nodes) == _actor_nodes_csv(legacy_nodes)
+        and edges.to_csv(index=False) == legacy_edges.to_csv(index=False)
+    )
+    return {
+        'movies': n_movies,
+        'filtered': len(preprocessor.data),
+        'pairs': len(preprocessor.cast_actors),
+        'load_sec': load_sec,
+        'legacy_sec': legacy_sec,
+        'vectorized_sec': vectorized_sec,
+        'same': same,
+    }
+
+
+def main():
+    scales = [int(arg) for arg in sys.argv[1:]] or [N_MOVIES]
+    if not dataset_exists():
+        convert_csv()
+    reference = load_movie_dataset(DATASET_DIR)
+    print(f"실제 데이터 {len(reference)}편의 분포로 합성 데이터 생성: {', '.join(map(str, scales))}편")
+
+    print(f"\n{'영화 수':>10}{'필터 후':>10}{'출연 쌍':>12}{'로드(초)':>10}{'기존(초)':>10}{'집계(초)':>10}{'배율':>8}  결과")
+    with tempfile.TemporaryDirectory() as workdir:
+        for n_movies in scales:
+            result = run(n_movies, reference, workdir)
+            speedup = result['legacy_sec'] / result['vectorized_sec']
+            print(f"{result['movies']:>10}{result['filtered']:>10}{result['pairs']:>12}{result['load_sec']:>10.2f}"
+                  f"{result['legacy_sec']:>10.2f}{result['vectorized_sec']:>10.2f}{speedup:>7.1f}배  "
+                  f"{'동일' if result['same'] else '불일치'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+감독-배우 이분 네트워크의 단일 모드 투영 (배우-배우 공동 출연, 감독-감독 공유 배우)
+
+영화 x 사람 희소 연결 행렬 B를 만들고 B·Bᵀ 희소 행렬 곱 한 번으로 모든 쌍의 가중치를 계산합니다.
+출연진마다 배우 쌍을 반복문으로 만드는 방식과 달리 출연진이 수백 명인 영화도 희소 연산으로 처리합니다.
+
+가중치 방식 (WEIGHT_MODE)
+- "count": 함께한 영화(또는 공유 배우) 수
+- "newman": 영화마다 1/(출연 인원 - 1)씩 더함 (출연진이 많은 영화의 쌍일수록 약한 연결로 봄, Newman 2001)
+- "jaccard": 공유 수 / (두 사람 각각의 수 합 - 공유 수)
+
+실행: 프로젝트 루트에서 `python src/bipartite_projection.py`
+-> data/gephi/actor_actor_edges.csv, data/gephi/director_director_edges.csv (edges.csv와 같은 열, nodes.csv의 Id 사용)
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from preprocess_for_gephi import DirectorActorPreprocessor
+
+WEIGHT_MODE = "count"
+MIN_WEIGHT = {"count": 1, "newman": 0.0, "jaccard": 0.0}  # 이 값 이상인 쌍만 저장
+MAX_CAST = None  # 영화마다 출연 순서 앞쪽 몇 명만 사용할지 (None이면 전체)
+BLOCK_ROWS = 2000  # 한 번에 곱하는 행 수 (메모리 사용량 상한)
+
+
+def incidence_matrix(rows, cols, shape):
+    """(행, 열) 쌍으로 0/1 희소 연결 행렬을 만듭니다 (같은 쌍이 여러 번 나와도 1)."""
+    matrix = sparse.csr_matrix((np.ones(len(rows), dtype=np.float64), (rows, cols)), shape=shape)
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+    return matrix
+
+
+def project(incidence, weight=WEIGHT_MODE, min_weight=None, block_rows=BLOCK_ROWS):
+    """
+    행 노드끼리의 투영 B·Bᵀ를 계산합니다.
+    행을 block_rows개씩 나누어 곱하고 블록마다 위 삼각형과 하한 필터를 바로 적용하므로,
+    전체 곱을 한 번에 만들지 않고 블록 하나와 남길 쌍만큼의 메모리만 사용합니다.
+
+    Args:
+        incidence (csr_matrix): 행 노드(투영 대상) x 열 노드(공유 대상) 0/1 행렬
+        weight (str): "count", "newman", "jaccard"
+        min_weight (float): 이 값 이상인 쌍만 반환 (None이면 MIN_WEIGHT[weight])
+
+    Returns:
+        tuple: (행 번호 배열, 열 번호 배열, 가중치 배열) — 행 번호 < 열 번호인 쌍만
+    """
+    if weight not in MIN_WEIGHT:
+        raise ValueError(f"지원하지 않는 가중치 방식: {weight}")
+    min_weight = MIN_WEIGHT[weight] if min_weight is None else min_weight
+    incidence = incidence.tocsr()
+
+    right = incidence.T.tocsc()
+    if weight == "newman":
+        # 공유 대상(영화)마다 1/(인원 - 1): 혼자인 영화는 쌍을 만들지 않으므로 0
+        size = np.asarray(incidence.sum(axis=0)).ravel()
+        scale = np.divide(1.0, size - 1, out=np.zeros_like(size), where=size > 1)
+        right = (sparse.diags(scale) @ right).tocsc()
+    degree = np.asarray(incidence.sum(axis=1)).ravel()
+
+    parts = []
+    for start in range(0, incidence.shape[0], block_rows):
+        block = (incidence[start:start + block_rows] @ right).tocoo()
+        rows = block.row + start
+        # 대각선(자기 자신)과 아래 삼각형을 버리고 한 쌍을 한 번만 남김
+        upper = block.col > rows
+        rows, cols, values = rows[upper], block.col[upper], block.data[upper]
+        if weight == "jaccard":
+            values = values / (degree[rows] + degree[cols] - values)
+        keep = values >= min_weight
+        parts.append((rows[keep], cols[keep], values[keep]))
+
+    if not parts:
+        return np.array([], dtype=np.int32), np.array([], dtype=np.int32), np.array([])
+    rows, cols, values = (np.concatenate(arrays) for arrays in zip(*parts))
+    if weight == "count":
+        values = np.rint(values).astype(np.int64)
+    return rows, cols, values
+
+
+def edge_frame(rows, cols, weights, ids):
+    """투영 결과를 Gephi 엣지 목록(Source, Target, Type, Weight)으로 변환합니다 (Source, Target 순 정렬)."""
+    ids = np.asarray(ids, dtype=object)
+    edges = pd.DataFrame({
+        'Source': ids[rows],
+        'Target': ids[cols],
+        'Type': 'Undirected',
+        'Weight': weights,
+    })
+    return edges.sort_values(['Source', 'Target'], ignore_index=True)
+
+
+class BipartiteProjector:
+    """DirectorActorPreprocessor가 필터링한 영화로 배우-배우, 감독-감독 투영 엣지를 만듭니다."""
+
+    def __init__(self, preprocessor, max_cast=MAX_CAST):
+        """
+        Args:
+            preprocessor (DirectorActorPreprocessor): load_and_filter_data를 실행한 전처리기
+            max_cast (int): 영화마다 출연 순서 앞쪽 몇 명만 사용할지 (None이면 전체)
+        """
+        self.preprocessor = preprocessor
+        movies = preprocessor.cast_movies
+        actors = preprocessor.cast_actors
+        if max_cast is not None and len(movies):
+            # 출연 쌍은 영화 순서, 영화 안에서는 출연 순서대로 놓여 있음
+            starts = np.flatnonzero(np.r_[True, movies[1:] != movies[:-1]])
+            counts = np.diff(np.r_[starts, len(movies)])
+            billing = np.arange(len(movies)) - np.repeat(starts, counts)
+            movies, actors = movies[billing < max_cast], actors[billing < max_cast]
+        self.cast_movies = movies
+        self.cast_actors = actors
+        self.n_movies = len(preprocessor.data)
+        self.n_actors = len(preprocessor.actor_names)
+        self.n_directors = len(preprocessor.director_names)
+
+    def actor_incidence(self):
+        """배우 x 영화"""
+        return incidence_matrix(self.cast_actors, self.cast_movies, (self.n_actors, self.n_movies))
+
+    def director_incidence(self):
+        """감독 x 배우 (감독의 영화에 한 번이라도 출연한 배우)"""
+        directors = self.preprocessor.director_codes[self.cast_movies]
+        return incidence_matrix(directors, self.cast_actors, (self.n_directors, self.n_actors))
+
+    def actor_edges(self, weight=WEIGHT_MODE, min_weight=None):
+        """배우-배우 공동 출연 엣지"""
+        return edge_frame(*project(self.actor_incidence(), weight, min_weight), self.preprocessor.actor_node_ids)
+
+    def director_edges(self, weight=WEIGHT_MODE, min_weight=None):
+        """감독-감독 공유 배우 엣지"""
+        return edge_frame(*project(self.director_incidence(), weight, min_weight), self.preprocessor.director_node_ids)
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    preprocessor = DirectorActorPreprocessor()
+    preprocessor.load_and_filter_data()
+    projector = BipartiteProjector(preprocessor)
+
+    output_dir = Path(preprocessor.output_dir)
+    for name, edges in [
+        ('actor_actor_edges.csv', projector.actor_edges()),
+        ('director_director_edges.csv', projector.director_edges()),
+    ]:
+        edges.to_csv(output_dir / name, index=False, encoding='utf-8-sig')
+        print(f"{name}: 엣지 {len(edges)}개 (가중치 방식: {WEIGHT_MODE})")
+    print(f"파일 저장 완료: {output_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,25 +1,266 @@
 import os
 import json
 import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 import requests # type: ignore
 import pandas as pd
 from dotenv import load_dotenv
 
+from movie_dataset import DATASET_DIR, save_movie_dataset
+
 # .env 파일 로드
 load_dotenv()
 
+BASE_URL = "http://www.kobis.or.kr/kobisopenapi/webservice/rest"
+MAX_WORKERS = 8           # 상세 정보 동시 요청 수
+REQUESTS_PER_SECOND = 5   # 전체 요청 속도 상한 (기존 0.2초 간격과 같음)
+DAILY_QUOTA = None        # 이번 실행의 호출 수 상한 (KOBIS 키당 일일 한도는 3,000회, None이면 제한 없음)
+MAX_RETRIES = 3           # 시간 초과, 연결 오류, 429/5xx 응답의 재시도 횟수
+RETRY_BACKOFF = 1.0       # 첫 재시도 전 대기 시간 (초, 재시도마다 두 배)
+REQUEST_TIMEOUT = 10
+ITEMS_PER_PAGE = 100      # 영화 목록 페이지당 영화 수 (API 최대값)
+CACHE_DIR = "data/cache/kobis"                          # API 응답 캐시 (요청 인자별 JSON 파일)
+JOURNAL_FILE = "data/cache/kobis/progress.jsonl"        # 상세 정보 수집 완료 기록 (한 줄에 영화 하나)
+LIST_CACHE_TTL = 24 * 60 * 60  # 영화 목록 응답 캐시 유효 시간 (초, 새 영화가 등록되므로 만료)
+PEOPLE_PER_PAGE = 100     # 인물 검색 결과 최대 수 (동명이인 후보)
+RESOLVE_PEOPLE = False    # 상세 정보에 peopleCd가 없는 인물을 인물 검색으로 찾을지 (이름마다 호출 1회)
+
+
+class QuotaExceededError(Exception):
+    """KOBIS 일일 호출 한도를 모두 사용한 경우"""
+
+
+class RateLimiter:
+    """여러 스레드가 공유하는 요청 속도 제한 (요청 사이 최소 간격 + 호출 수 한도)"""
+
+    def __init__(self, requests_per_second=REQUESTS_PER_SECOND, quota=DAILY_QUOTA):
+        """
+        Args:
+            requests_per_second (float): 초당 최대 요청 수
+            quota (int): 이번 실행에서 보낼 수 있는 최대 요청 수 (None이면 제한 없음)
+        """
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.quota = quota
+        self.calls = 0
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """다음 요청 시각까지 기다립니다. 한도를 넘으면 QuotaExceededError를 발생시킵니다."""
+        with self._lock:
+            if self.quota is not None and self.calls >= self.quota:
+                raise QuotaExceededError(f"일일 호출 한도 {self.quota}회를 모두 사용했습니다")
+            self.calls += 1
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class ResponseCache:
+    """API 응답을 '엔드포인트 + 요청 인자(API 키 제외)'별 JSON 파일로 저장하는 캐시"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, endpoint, params):
+        name = endpoint.rsplit('/', 1)[-1].replace('.json', '')
+        key = json.dumps({k: str(v) for k, v in params.items() if k != 'key'}, sort_keys=True)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, name, f"{digest}.json")
+
+    def get(self, endpoint, params, max_age=None):
+        """캐시된 응답 (없거나 max_age초보다 오래되었으면 None)"""
+        path = self._path(endpoint, params)
+        if not os.path.exists(path):
+            return None
+        if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def put(self, endpoint, params, data):
+        """응답을 임시 파일에 쓴 뒤 교체합니다 (여러 스레드가 동시에 써도 파일이 깨지지 않음)."""
+        path = self._path(endpoint, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class ProgressJournal:
+    """
+    상세 정보 수집이 끝난 영화를 한 줄씩 덧붙이는 기록 파일 (JSON Lines).
+    다시 실행하면 기록된 영화는 건너뛰므로 중단된 지점부터 이어서 수집합니다.
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+        self.records = {}  # 영화 코드 -> 수집 결과 행
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 기록 도중 중단되어 잘린 마지막 줄
+                    self.records[entry['movie_cd']] = entry['record']
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def __contains__(self, movie_cd):
+        return movie_cd in self.records
+
+    def add(self, movie_cd, record):
+        """수집 결과 한 건을 기록합니다 (바로 디스크에 반영)."""
+        with self._lock:
+            self.records[movie_cd] = record
+            self._file.write(json.dumps({'movie_cd': movie_cd, 'record': record}, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
 class KobisDataCollector:
     """KOBIS Open API를 사용하여 영화 데이터를 수집하는 클래스"""
     
-    def __init__(self, api_key):
+    def __init__(self, api_key, base_url=BASE_URL, max_workers=MAX_WORKERS,
+                 requests_per_second=REQUESTS_PER_SECOND, quota=DAILY_QUOTA,
+                 cache_dir=CACHE_DIR, journal_path=JOURNAL_FILE):
         """
         Args:
             api_key (str): KOBIS Open API 키
+            base_url (str): API 주소 (테스트 시 로컬 모의 서버 주소로 교체 가능)
+            max_workers (int): 상세 정보 동시 요청 수 (1이면 순차 수집)
+            requests_per_second (float): 모든 스레드를 합친 초당 요청 수 상한
+            quota (int): 일일 호출 한도
+            cache_dir (str): 응답 캐시 폴더 (None이면 캐시 사용 안 함)
+            journal_path (str): 진행 기록 파일 (None이면 이어서 수집하지 않음)
         """
         self.api_key = api_key
-        self.base_url = "http://www.kobis.or.kr/kobisopenapi/webservice/rest"
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(requests_per_second, quota)
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.journal_path = journal_path
+        # 모든 요청이 연결(keep-alive)을 재사용하도록 세션 하나를 공유
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _request_json(self, endpoint, params, max_age=None):
+        """
+        속도 제한을 지키며 요청하고 JSON을 반환합니다.
+        캐시에 있으면 요청하지 않고, 정상 응답은 캐시에 저장합니다.
+        시간 초과, 연결 오류, 429/5xx 응답은 지수 백오프로 재시도합니다.
+
+        Args:
+            max_age (int): 캐시 유효 시간 (초, None이면 만료 없음)
+
+        Raises:
+            QuotaExceededError: 호출 한도 초과 (재시도하지 않음)
+            requests.RequestException: 재시도 후에도 실패한 경우
+        """
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, params, max_age)
+            if cached is not None:
+                return cached
+
+        for attempt in range(MAX_RETRIES + 1):
+            self.limiter.wait()
+            try:
+                response = self.session.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
+                if response.status_code == 429 or response.status_code >= 500:
+                    response.raise_for_status()
+                data = response.json()
+                break
+            except (requests.Timeout, requests.ConnectionError, requests.HTTPError):
+                if attempt == MAX_RETRIES:
+                    raise
+                time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+        # 잘못된 키, 한도 초과 등은 HTTP 200과 faultInfo로 응답
+        if 'faultInfo' in data:
+            message = data['faultInfo'].get('message', '')
+            if '한도' in message or '초과' in message or 'limit' in message.lower():
+                raise QuotaExceededError(message)
+            raise ValueError(message)
+        if self.cache is not None:
+            self.cache.put(endpoint, params, data)
+        return data
+        
+    def get_movie_list_page(self, start_date, end_date, cur_page):
+        """영화 목록 한 페이지 조회
         
+        Returns:
+            dict: movieListResult (totCnt: 전체 영화 수, movieList: 이 페이지의 영화 목록)
+        """
+        endpoint = f"{self.base_url}/movie/searchMovieList.json"
+        params = {
+            'key': self.api_key,
+            'openStartDt': start_date[:4],  # 개봉연도 시작
+            'openEndDt': end_date[:4],      # 개봉연도 끝
+            'itemPerPage': ITEMS_PER_PAGE,
+            'curPage': cur_page,
+            'repNationCd': '22041011'  # 한국 영화 코드
+        }
+        try:
+            data = self._request_json(endpoint, params, max_age=LIST_CACHE_TTL)
+            return data['movieListResult']
+        except Exception as e:
+            # 일부 페이지만 가진 목록을 완전한 목록처럼 쓰지 않도록 중단
+            print(f"영화 목록 조회 중 오류 발생 (페이지: {cur_page}): {e}")
+            raise
+
+    def iter_movie_list_pages(self, start_date, end_date, executor=None):
+        """영화 목록을 페이지 단위로 도착하는 대로 반환
+        
+        첫 페이지의 totCnt로 전체 페이지 수를 계산하여 나머지 페이지를 executor에 한꺼번에 맡기므로,
+        반환된 페이지의 상세 정보 조회와 남은 페이지 조회가 겹쳐서 진행됩니다.
+        totCnt가 없으면 빈 페이지가 나올 때까지 순서대로 조회합니다.
+        
+        Args:
+            executor (ThreadPoolExecutor): 나머지 페이지를 동시에 조회할 실행기 (None이면 순서대로 조회)
+            
+        Yields:
+            tuple: (페이지 번호, 전체 영화 수, 영화 목록)
+        """
+        first = self.get_movie_list_page(start_date, end_date, 1)
+        total = first.get('totCnt')
+        if total is None:
+            cur_page, movie_list = 1, first['movieList']
+            while movie_list:  # 더 이상 데이터가 없으면 종료
+                yield cur_page, None, movie_list
+                cur_page += 1
+                movie_list = self.get_movie_list_page(start_date, end_date, cur_page)['movieList']
+            return
+        
+        total = int(total)
+        n_pages = -(-total // ITEMS_PER_PAGE)
+        if executor is None:
+            yield 1, total, first['movieList']
+            for cur_page in range(2, n_pages + 1):
+                yield cur_page, total, self.get_movie_list_page(start_date, end_date, cur_page)['movieList']
+            return
+        
+        # 첫 페이지의 상세 정보 요청보다 목록 페이지 요청이 먼저 대기열에 들어가도록 먼저 제출
+        futures = {
+            executor.submit(self.get_movie_list_page, start_date, end_date, cur_page): cur_page
+            for cur_page in range(2, n_pages + 1)
+        }
+        yield 1, total, first['movieList']
+        for future in as_completed(futures):
+            yield futures[future], total, future.result()['movieList']
+
     def get_movie_list(self, start_date, end_date):
         """특정 기간 동안의 영화 목록을 조회
         
@@ -30,37 +271,13 @@ class KobisDataCollector:
         Returns:
             list: 영화 정보 목록
         """
-        endpoint = f"{self.base_url}/movie/searchMovieList.json"
-        movies = []
-        cur_page = 1
-        
-        while True:
-            params = {
-                'key': self.api_key,
-                'openStartDt': start_date[:4],  # 개봉연도 시작
-                'openEndDt': end_date[:4],      # 개봉연도 끝
-                'itemPerPage': 100,
-                'curPage': cur_page,
-                'repNationCd': '22041011'  # 한국 영화 코드
-            }
-            
-            try:
-                response = requests.get(endpoint, params=params)
-                data = response.json()
-                movie_list = data['movieListResult']['movieList']
-                
-                if not movie_list:  # 더 이상 데이터가 없으면 종료
-                    break
-                    
-                movies.extend(movie_list)
-                cur_page += 1
-                time.sleep(0.2)  # API 호출 간격 조절
-                
-            except Exception as e:
-                print(f"영화 목록 조회 중 오류 발생 (페이지: {cur_page}): {e}")
-                break
-        
-        return movies
+        if self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pages = list(self.iter_movie_list_pages(start_date, end_date, executor))
+        else:
+            pages = list(self.iter_movie_list_pages(start_date, end_date))
+        pages.sort(key=lambda page: page[0])
+        return [movie for _, _, movie_list in pages for movie in movie_list]
 
     def get_movie_info(self, movie_cd):
         """영화 상세 정보 조회
@@ -78,62 +295,213 @@ class KobisDataCollector:
         }
         
         try:
-            response = requests.get(endpoint, params=params)
-            data = response.json()
+            data = self._request_json(endpoint, params)
             return data['movieInfoResult']['movieInfo']
+        except QuotaExceededError:
+            raise
         except Exception as e:
             print(f"영화 상세 정보 조회 중 오류 발생 (영화코드: {movie_cd}): {e}")
             return None
 
-    def collect_movie_data(self, start_date, end_date):
+    def get_people_list(self, people_nm):
+        """이름으로 영화인 검색 (같은 이름의 모든 인물)
+        
+        Args:
+            people_nm (str): 영화인 이름
+            
+        Returns:
+            list: 인물 목록 (peopleCd, peopleNm, repRoleNm, filmoNames: '영화1|영화2|...')
+        """
+        endpoint = f"{self.base_url}/people/searchPeopleList.json"
+        params = {
+            'key': self.api_key,
+            'peopleNm': people_nm,
+            'itemPerPage': PEOPLE_PER_PAGE
+        }
+        data = self._request_json(endpoint, params)
+        return data['peopleListResult']['peopleList']
+
+    @staticmethod
+    def match_people_cd(candidates, title, role):
+        """동명이인 후보 중 필모그래피에 해당 영화가 있는 인물의 코드
+        
+        Args:
+            candidates (list): get_people_list 결과
+            title (str): 영화 제목
+            role (str): '감독' 또는 '배우' (필모그래피로 구분되지 않을 때 대표 역할로 구분)
+            
+        Returns:
+            int: 영화인 코드 (한 명으로 정해지지 않으면 None)
+        """
+        if len(candidates) == 1:
+            return int(candidates[0]['peopleCd'])
+        matched = [p for p in candidates if title in (p.get('filmoNames') or '').split('|')]
+        if len(matched) > 1:
+            matched = [p for p in matched if p.get('repRoleNm') == role]
+        return int(matched[0]['peopleCd']) if len(matched) == 1 else None
+
+    def resolve_people_codes(self, df):
+        """peopleCd가 비어 있는 감독/배우를 인물 검색 결과의 필모그래피로 채웁니다.
+        
+        검색은 이름마다 한 번만 하고(응답 캐시 사용), 동명이인은 출연작 제목으로 구분합니다.
+        
+        Args:
+            df (pd.DataFrame): collect_movie_data 결과 (director_cd, actor_cds 열)
+            
+        Returns:
+            pd.DataFrame: 코드를 채운 데이터프레임
+        """
+        missing = {d for d, cd in zip(df['director'], df['director_cd']) if cd is None or pd.isna(cd)}
+        for names, codes in zip(df['actors'], df['actor_cds']):
+            missing.update(name for name, cd in zip(names, codes) if cd is None)
+        missing.discard('정보없음')
+        if not missing:
+            return df
+        print(f"영화인 코드 조회: 이름 {len(missing)}개")
+        
+        def search(name):
+            # 검색에 실패한 이름(한도 초과 포함)은 코드를 비워 두고 나머지 결과는 그대로 사용
+            try:
+                return self.get_people_list(name)
+            except Exception as e:
+                print(f"영화인 검색 중 오류 발생 (이름: {name}): {e}")
+                return None
+        
+        search_names = sorted(missing)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = dict(zip(search_names, executor.map(search, search_names)))
+        people = {name: candidates for name, candidates in results.items() if candidates is not None}
+        if len(people) < len(results):
+            print(f"영화인 검색 실패: 이름 {len(results) - len(people)}개는 코드를 비워 둡니다")
+        
+        df = df.copy()
+        df['director_cd'] = pd.array([
+            cd if cd is not None and not pd.isna(cd) else
+            (self.match_people_cd(people[d], title, '감독') if d in people else None)
+            for d, cd, title in zip(df['director'], df['director_cd'], df['title'])
+        ], dtype='Int64')
+        df['actor_cds'] = [
+            [cd if cd is not None else
+             (self.match_people_cd(people[name], title, '배우') if name in people else None)
+             for name, cd in zip(names, codes)]
+            for names, codes, title in zip(df['actors'], df['actor_cds'], df['title'])
+        ]
+        return df
+
+    @staticmethod
+    def people_cd(person):
+        """인물 정보의 영화인 코드 (없거나 숫자가 아니면 None)"""
+        try:
+            return int(person['peopleCd'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def to_record(movie_info):
+        """영화 상세 정보를 수집 결과의 한 행으로 변환
+        
+        Args:
+            movie_info (dict): get_movie_info 결과
+            
+        Returns:
+            dict: 영화 정보 행
+        """
+        # 감독 정보 추출
+        directors = movie_info.get('directors', [])
+        director_name = directors[0]['peopleNm'] if directors else '정보없음'
+        director_cd = KobisDataCollector.people_cd(directors[0]) if directors else None
+        
+        # 배우 정보 추출 (모든 배우 포함, 동명이인 구분용 영화인 코드도 같은 순서로 저장)
+        actors = movie_info.get('actors', [])
+        actor_names = [actor['peopleNm'] for actor in actors]
+        actor_cds = [KobisDataCollector.people_cd(actor) for actor in actors]
+        
+        # 장르 정보 추출
+        genres = movie_info.get('genres', [])
+        genre_names = [genre['genreNm'] for genre in genres]
+        
+        return {
+            'movie_cd': movie_info['movieCd'],
+            'title': movie_info['movieNm'],
+            'director': director_name,
+            'actors': actor_names,
+            'actor_count': len(actor_names),
+            'release_date': movie_info.get('openDt', ''),
+            'genre': genre_names,
+            'genre_count': len(genre_names),
+            'production_year': movie_info.get('prdtYear', ''),
+            'show_time': movie_info.get('showTm', ''),
+            'director_cd': director_cd,
+            'actor_cds': actor_cds
+        }
+
+    def collect_movie_data(self, start_date, end_date, resolve_people=RESOLVE_PEOPLE):
         """영화 데이터 수집 및 DataFrame 생성
         
         Args:
             start_date (str): 시작일 (YYYYMMDD)
             end_date (str): 종료일 (YYYYMMDD)
+            resolve_people (bool): 영화인 코드가 없는 감독/배우를 인물 검색으로 찾을지
             
         Returns:
             pd.DataFrame: 수집된 영화 데이터
         """
-        movies = []
-        movie_list = self.get_movie_list(start_date, end_date)
-        total_movies = len(movie_list)
-        
-        print(f"총 {total_movies}개의 영화 데이터 수집 시작...")
+        # 이전 실행에서 이미 수집한 영화는 건너뜀 (기간이 겹치는 재실행도 새 영화만 요청)
+        journal = ProgressJournal(self.journal_path) if self.journal_path else None
+        print(f"영화 데이터 수집 시작... (이전 기록 {len(journal.records) if journal else 0}개, "
+              f"동시 요청 {self.max_workers}개)")
         
-        for idx, movie in enumerate(movie_list, 1):
-            print(f"처리 중: {idx}/{total_movies} - {movie['movieNm']}")
-            
+        def fetch(movie, position, total_movies):
+            print(f"처리 중: {position + 1}/{total_movies or '?'} - {movie['movieNm']}")
             movie_info = self.get_movie_info(movie['movieCd'])
-            if movie_info:
-                # 감독 정보 추출
-                directors = movie_info.get('directors', [])
-                director_name = directors[0]['peopleNm'] if directors else '정보없음'
-                
-                # 배우 정보 추출 (모든 배우 포함)
-                actors = movie_info.get('actors', [])
-                actor_names = [actor['peopleNm'] for actor in actors]
-                
-                # 장르 정보 추출
-                genres = movie_info.get('genres', [])
-                genre_names = [genre['genreNm'] for genre in genres]
-                
-                movies.append({
-                    'movie_cd': movie_info['movieCd'],
-                    'title': movie_info['movieNm'],
-                    'director': director_name,
-                    'actors': actor_names,
-                    'actor_count': len(actor_names),
-                    'release_date': movie_info.get('openDt', ''),
-                    'genre': genre_names,
-                    'genre_count': len(genre_names),
-                    'production_year': movie_info.get('prdtYear', ''),
-                    'show_time': movie_info.get('showTm', '')
-                })
-                
-                time.sleep(0.2)  # API 호출 간격 조절
-        
-        return pd.DataFrame(movies)
+            record = self.to_record(movie_info) if movie_info else None
+            # 조회에 실패한 영화는 기록하지 않아 다음 실행에서 다시 시도
+            if record is not None and journal is not None:
+                journal.add(movie['movieCd'], record)
+            return record
+        
+        listed = {}   # 목록 위치 -> 영화 (결과를 목록 순서로 정렬하는 데 사용)
+        fetched = {}  # 영화 코드 -> 수집 결과 행 (또는 Future)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers) if self.max_workers > 1 else None
+        try:
+            # 목록 페이지가 도착하는 대로 상세 정보 요청을 제출하여 두 단계를 겹쳐서 진행
+            for cur_page, total_movies, movie_list in self.iter_movie_list_pages(start_date, end_date, executor):
+                for offset, movie in enumerate(movie_list):
+                    position = (cur_page - 1) * ITEMS_PER_PAGE + offset
+                    listed[position] = movie
+                    if (journal is not None and movie['movieCd'] in journal) or movie['movieCd'] in fetched:
+                        continue
+                    if executor is not None:
+                        fetched[movie['movieCd']] = executor.submit(fetch, movie, position, total_movies)
+                    else:
+                        fetched[movie['movieCd']] = fetch(movie, position, total_movies)
+            if executor is not None:
+                fetched = {movie_cd: future.result() for movie_cd, future in fetched.items()}
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            if journal is not None:
+                journal.close()
+        
+        records = journal.records if journal is not None else {}
+        n_ok = sum(1 for record in fetched.values() if record is not None)
+        print(f"목록 {len(listed)}개 중 {n_ok}개 새로 조회, {len(fetched) - n_ok}개 조회 실패, "
+              f"{len(listed) - len(fetched)}개 기록 재사용")
+        movies = []
+        for position in sorted(listed):
+            movie_cd = listed[position]['movieCd']
+            record = fetched.get(movie_cd) or records.get(movie_cd)
+            if record:
+                # 영화인 코드를 저장하기 전에 기록된 행은 코드 없이 이름으로만 구분
+                record.setdefault('director_cd', None)
+                record.setdefault('actor_cds', [None] * len(record['actors']))
+                movies.append(record)
+        df = pd.DataFrame(movies)
+        if len(df):
+            df['director_cd'] = df['director_cd'].astype('Int64')
+        if resolve_people and len(df):
+            df = self.resolve_people_codes(df)
+        return df
 
     def save_to_csv(self, df, output_path):
         """데이터프레임을 CSV 파일로 저장
@@ -147,6 +515,16 @@ class KobisDataCollector:
         df.to_csv(output_path, index=False, encoding='utf-8-sig')
         print(f"데이터가 {output_path}에 저장되었습니다.")
 
+    def save_dataset(self, df, dataset_dir=DATASET_DIR):
+        """데이터프레임을 정규화된 Parquet 테이블(영화, 영화-배우, 영화-장르)로 저장
+        
+        Args:
+            df (pd.DataFrame): 저장할 데이터프레임
+            dataset_dir (str): 저장 폴더
+        """
+        save_movie_dataset(df, dataset_dir)
+        print(f"데이터셋이 {dataset_dir}에 저장되었습니다.")
+
 def main():
     """메인 실행 함수"""
     # API 키는 환경 변수에서 가져오기
@@ -164,6 +542,7 @@ def main():
     # 데이터 수집 및 저장
     df = collector.collect_movie_data(start_date, end_date)
     collector.save_to_csv(df, 'data/raw/movie_data.csv')
+    collector.save_dataset(df)
     
     # 수집 결과 요약 출력
     print("\n=== 데이터 수집 결과 ===")
@@ -0,0 +1,198 @@
+"""
+정규화된 영화 데이터셋 (열 기반 Parquet 테이블)
+
+movie_data.csv는 배우/장르 목록을 파이썬 리스트 문자열로 저장하여 읽을 때마다 ast.literal_eval로 해석해야 했습니다.
+데이터셋은 목록을 정수 ID 연결 테이블로 나누어 저장하므로 읽을 때 문자열을 해석하지 않습니다.
+
+data/raw/movie_dataset/
+- movies.parquet: movie_cd(정수), title, director, director_id, release_date(날짜), production_year, show_time
+- directors.parquet / actors.parquet: director_id / actor_id(정수), name, people_cd(KOBIS 영화인 코드, 없으면 결측)
+- genres.parquet: genre_id(정수), name
+- movie_actor.parquet: movie_cd, actor_id, position (출연 순서)
+- movie_genre.parquet: movie_cd, genre_id, position
+
+감독/배우 ID는 영화인 코드가 있으면 코드로, 없으면 이름으로 같은 사람을 판단하므로
+코드가 있는 동명이인은 서로 다른 ID를 받습니다.
+"""
+import ast
+import os
+
+import numpy as np
+import pandas as pd
+
+DATASET_DIR = "data/raw/movie_dataset"
+CSV_FILE = "data/raw/movie_data.csv"
+
+# 수집 결과(movie_data.csv)와 같은 열 순서
+COLUMNS = ['movie_cd', 'title', 'director', 'actors', 'actor_count', 'release_date',
+           'genre', 'genre_count', 'production_year', 'show_time', 'director_cd', 'actor_cds']
+# 로드할 때 함께 반환하는 데이터셋 정수 ID 열 (동명이인을 구분한 사람 단위)
+ID_COLUMNS = ['director_id', 'actor_ids']
+
+# 목록 열 -> (연결 테이블 이름, 이름 테이블 이름, ID 열 이름, 개수 열 이름, 영화인 코드 열 이름)
+LIST_COLUMNS = {
+    'actors': ('movie_actor', 'actors', 'actor_id', 'actor_count', 'actor_cds'),
+    'genre': ('movie_genre', 'genres', 'genre_id', 'genre_count', None),
+}
+TABLES = ['movies', 'directors', 'actors', 'genres', 'movie_actor', 'movie_genre']
+
+
+def _name_table(names, people_cds, id_column):
+    """
+    이름에 처음 나온 순서대로 0부터 ID를 매깁니다.
+    people_cds가 있으면 코드가 있는 항목은 코드로, 없는 항목은 (앞뒤 공백을 뺀) 이름으로 같은 대상을 판단합니다.
+
+    Returns:
+        tuple: (항목별 ID 배열, 이름 테이블)
+    """
+    names = pd.Series(names, dtype='string').str.strip()
+    keys = names.to_numpy(dtype=object)
+    if people_cds is not None:
+        people_cds = pd.to_numeric(pd.Series(people_cds, dtype=object), errors='coerce').astype('Int64')
+        known = people_cds.notna().to_numpy()
+        keys[known] = people_cds[known].to_numpy(dtype=np.int64)
+    ids, _ = pd.factorize(keys)
+    _, first = np.unique(ids, return_index=True)
+    table = pd.DataFrame({
+        id_column: np.arange(len(first), dtype='int32'),
+        'name': names.iloc[first].reset_index(drop=True),
+    })
+    if people_cds is not None:
+        table['people_cd'] = people_cds.iloc[first].reset_index(drop=True)
+    return ids.astype('int32'), table
+
+
+def _link_tables(movie_cds, lists, id_column, code_lists=None):
+    """목록 열을 (이름 테이블, 연결 테이블)로 나눕니다. code_lists는 목록과 같은 순서의 영화인 코드 리스트입니다."""
+    frame = pd.DataFrame({'movie_cd': movie_cds.to_numpy(), 'name': lists.to_numpy()})
+    if code_lists is not None:
+        frame['people_cd'] = code_lists.to_numpy()
+    exploded = frame.explode(list(frame.columns[1:]))
+    exploded = exploded.dropna(subset=['name'])
+    position = exploded.groupby(level=0).cumcount()
+    codes, names = _name_table(
+        exploded['name'].to_numpy(), exploded['people_cd'].to_numpy() if code_lists is not None else None, id_column)
+    links = pd.DataFrame({
+        'movie_cd': exploded['movie_cd'].to_numpy(dtype='int64'),
+        id_column: codes,
+        'position': position.to_numpy(dtype='int16'),
+    })
+    return names, links
+
+
+def build_tables(df):
+    """
+    수집 결과 DataFrame(actors/genre 열이 리스트)을 정규화된 테이블로 변환합니다.
+
+    Returns:
+        dict: 테이블 이름 -> DataFrame
+    """
+    df = df.reset_index(drop=True)
+    movie_cds = pd.to_numeric(df['movie_cd']).astype('int64')
+    # 영화인 코드를 저장하기 전의 수집 결과는 코드 없이 이름으로만 구분
+    if 'director_cd' not in df:
+        df['director_cd'] = None
+    if 'actor_cds' not in df:
+        df['actor_cds'] = df['actors'].map(lambda names: [None] * len(names))
+    director_ids, directors = _name_table(df['director'], df['director_cd'], 'director_id')
+    tables = {
+        'movies': pd.DataFrame({
+            'movie_cd': movie_cds,
+            'title': df['title'].astype('string'),
+            'director': df['director'].astype('string'),
+            'director_id': director_ids,
+            'release_date': pd.to_datetime(df['release_date'].astype('string'), format='%Y%m%d', errors='coerce'),
+            # 빈 값이 있을 수 있으므로 결측을 허용하는 정수형
+            'production_year': pd.to_numeric(df['production_year'], errors='coerce').astype('Int16'),
+            'show_time': pd.to_numeric(df['show_time'], errors='coerce').astype('Int32'),
+        }),
+        'directors': directors,
+    }
+    for column, (link_name, names_name, id_column, _, code_column) in LIST_COLUMNS.items():
+        code_lists = df[code_column] if code_column else None
+        tables[names_name], tables[link_name] = _link_tables(movie_cds, df[column], id_column, code_lists)
+    return tables
+
+
+def save_movie_dataset(df, dataset_dir=DATASET_DIR):
+    """수집 결과를 Parquet 테이블로 저장합니다."""
+    os.makedirs(dataset_dir, exist_ok=True)
+    for name, table in build_tables(df).items():
+        table.to_parquet(os.path.join(dataset_dir, f"{name}.parquet"), index=False)
+    return dataset_dir
+
+
+def dataset_exists(dataset_dir=DATASET_DIR):
+    """모든 테이블이 있는지 (이전 형식의 데이터셋은 없는 것으로 보고 다시 변환)"""
+    return all(os.path.exists(os.path.join(dataset_dir, f"{name}.parquet")) for name in TABLES)
+
+
+def _read_names(dataset_dir, names_name, id_column):
+    """ID 순서로 정렬한 이름 테이블 (ID는 0부터 연속이므로 행 위치가 곧 ID)"""
+    names = pd.read_parquet(os.path.join(dataset_dir, f"{names_name}.parquet"))
+    return names.sort_values(id_column, ignore_index=True)
+
+
+def load_link_table(dataset_dir, column):
+    """
+    목록 열 하나의 연결 테이블을 영화 코드, 출연 순서로 정렬하여 로드합니다.
+
+    Returns:
+        tuple: (영화 코드 배열, ID 배열, ID -> 이름 배열)
+    """
+    link_name, names_name, id_column, _, _ = LIST_COLUMNS[column]
+    links = pd.read_parquet(os.path.join(dataset_dir, f"{link_name}.parquet"))
+    movie_cds = links['movie_cd'].to_numpy()
+    order = np.lexsort((links['position'].to_numpy(), movie_cds))
+    # ID는 0부터 연속이므로 이름 배열에서 위치로 바로 꺼낼 수 있음
+    lookup = _read_names(dataset_dir, names_name, id_column)['name'].to_numpy(dtype=object)
+    return movie_cds[order], links[id_column].to_numpy()[order], lookup
+
+
+def load_movie_dataset(dataset_dir=DATASET_DIR):
+    """
+    데이터셋을 수집 결과와 같은 형태의 DataFrame으로 로드합니다.
+    actors/genre 열은 연결 테이블을 영화별로 나눈 이름 리스트입니다 (문자열 해석 없음).
+    director_id, actor_ids 열은 동명이인을 구분한 감독/배우 정수 ID입니다.
+    """
+    movies = pd.read_parquet(os.path.join(dataset_dir, 'movies.parquet'))
+    movie_cds = movies['movie_cd'].to_numpy()
+    directors = _read_names(dataset_dir, 'directors', 'director_id')
+    movies['director_cd'] = directors['people_cd'].to_numpy()[movies['director_id'].to_numpy()]
+    for column, (_, names_name, id_column, count_column, code_column) in LIST_COLUMNS.items():
+        link_cds, ids, lookup = load_link_table(dataset_dir, column)
+        # 정렬된 연결 테이블을 영화별 구간으로 자르고, 각 영화의 구간을 이진 탐색으로 찾음
+        unique_cds, starts, counts = np.unique(link_cds, return_index=True, return_counts=True)
+        pos = np.minimum(np.searchsorted(unique_cds, movie_cds), max(len(unique_cds) - 1, 0))
+        found = (unique_cds[pos] == movie_cds) if len(unique_cds) else np.zeros(len(movie_cds), dtype=bool)
+
+        def per_movie(values):
+            chunks = np.split(values, starts[1:]) if len(unique_cds) else []
+            return [chunks[p].tolist() if hit else [] for p, hit in zip(pos.tolist(), found.tolist())]
+
+        movies[column] = per_movie(lookup[ids])
+        movies[count_column] = np.where(found, counts[pos] if len(unique_cds) else 0, 0)
+        if code_column:
+            people_cds = _read_names(dataset_dir, names_name, id_column)['people_cd']
+            movies[code_column] = per_movie(people_cds.to_numpy(dtype=object, na_value=None)[ids])
+            movies[f"{id_column}s"] = per_movie(ids)
+    return movies[COLUMNS + ID_COLUMNS]
+
+
+def convert_csv(csv_path=CSV_FILE, dataset_dir=DATASET_DIR):
+    """
+    기존 movie_data.csv를 데이터셋으로 한 번 변환합니다.
+    리스트 문자열 해석(ast.literal_eval)은 이 변환에서만 사용합니다.
+    """
+    df = pd.read_csv(csv_path, encoding='utf-8-sig')
+    for column, (_, _, _, _, code_column) in LIST_COLUMNS.items():
+        df[column] = df[column].map(ast.literal_eval)
+        if code_column in df:
+            df[code_column] = df[code_column].map(ast.literal_eval)
+    save_movie_dataset(df, dataset_dir)
+    print(f"{csv_path} -> {dataset_dir} 변환 완료 (영화 {len(df)}개)")
+    return dataset_dir
+
+
+if __name__ == '__main__':
+    convert_csv()
@@ -1,23 +1,28 @@
 """
 영화 데이터를 감독-배우 네트워크 분석용 Gephi 데이터로 변환
 """
+import numpy as np
 import pandas as pd
-import ast
 from pathlib import Path
 
+from movie_dataset import DATASET_DIR, convert_csv, dataset_exists, load_movie_dataset
+
 class DirectorActorPreprocessor:
-    def __init__(self, input_file='data/raw/movie_data.csv'):
+    def __init__(self, input_file='data/raw/movie_data.csv', dataset_dir=DATASET_DIR, output_dir='data/gephi'):
         """
         초기화 함수
         
         Args:
-            input_file (str): 입력 CSV 파일 경로
+            input_file (str): 입력 CSV 파일 경로 (데이터셋이 없을 때 한 번 변환하는 데 사용)
+            dataset_dir (str): 정규화된 Parquet 데이터셋 폴더
+            output_dir (str): Gephi 파일 저장 폴더
         """
         self.input_file = input_file
-        self.output_dir = Path('data/gephi')
+        self.dataset_dir = dataset_dir
+        self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.actor_id_map = {}  # 배우 이름을 고유 ID로 매핑
-        self.director_id_map = {}  # 감독 이름을 고유 ID로 매핑
+        self.actor_id_map = {}  # 배우 정수 ID(데이터셋 actor_id)를 노드 ID로 매핑
+        self.director_id_map = {}  # 감독 정수 ID(데이터셋 director_id)를 노드 ID로 매핑
         
     def generate_unique_id(self, name, role, count=1):
         """
@@ -26,7 +31,7 @@ class DirectorActorPreprocessor:
         Args:
             name (str): 이름
             role (str): 'Actor' 또는 'Director'
-            count (int): 동명이인 구분용 카운터
+            count (int): 동명이인 구분용 카운터 (같은 이름의 몇 번째 사람인지)
         """
         # 한글 이름을 그대로 사용
         base_id = f"{name.strip()}_{role[:3]}_{count}"
@@ -39,80 +44,98 @@ class DirectorActorPreprocessor:
         - 출연 배우 3명 이상
         - 감독당 최소 2편 이상
         """
-        # 데이터 로드 시 인코딩 지정
-        df = pd.read_csv(self.input_file, encoding='utf-8')
-        
-        # 문자열 리스트를 실제 리스트로 변환
-        df['actors'] = df['actors'].apply(ast.literal_eval)
-        df['genre'] = df['genre'].apply(ast.literal_eval)
+        # 데이터셋이 없으면 기존 CSV를 한 번 변환 (배우/장르 목록은 연결 테이블에서 바로 리스트로 로드)
+        if not dataset_exists(self.dataset_dir):
+            convert_csv(self.input_file, self.dataset_dir)
+        df = load_movie_dataset(self.dataset_dir)
         
         # 2021년 이후 데이터만 필터링
-        df['production_year'] = pd.to_numeric(df['production_year'], errors='coerce')
         df = df[df['production_year'] >= 2021]
         
         # 배우가 3명 이상인 영화만 선택
-        df['actor_count'] = df['actors'].apply(len)
+        df = df.assign(actor_count=df['actors'].str.len())
         df = df[df['actor_count'] >= 3]
         
-        # 감독별 영화 수 계산
-        director_counts = df['director'].value_counts()
+        # 감독별 영화 수 계산 (이름이 아니라 사람 단위: 동명이인 감독의 영화를 합치지 않음)
+        director_counts = df['director_id'].value_counts()
         directors_with_multiple_films = director_counts[director_counts >= 2].index
         
         # 2편 이상 연출한 감독의 영화만 선택
-        df = df[df['director'].isin(directors_with_multiple_films)]
-        
-        # 감독 이름 정규화 및 ID 매핑 생성
-        for director in df['director'].unique():
-            if director not in self.director_id_map:
-                self.director_id_map[director] = self.generate_unique_id(director, 'Director')
-        
-        # 배우 이름 정규화 및 ID 매핑 생성
-        actor_counts = {}
-        for actors in df['actors']:
-            for actor in actors:
-                actor = actor.strip()
-                if actor not in actor_counts:
-                    actor_counts[actor] = 1
-                    self.actor_id_map[actor] = self.generate_unique_id(actor, 'Actor')
-                elif actor not in self.actor_id_map:
-                    actor_counts[actor] += 1
-                    self.actor_id_map[actor] = self.generate_unique_id(actor, 'Actor', actor_counts[actor])
+        df = df[df['director_id'].isin(directors_with_multiple_films)]
+        
+        # 감독/배우 정수 ID를 처음 나온 순서의 연속 코드로 바꿔 두고, 이후 집계는 코드 배열로 계산
+        self.director_codes, director_ids = pd.factorize(df['director_id'].to_numpy())
+        self.cast_movies = np.repeat(np.arange(len(df)), df['actor_count'].to_numpy())  # 출연 쌍의 영화 위치
+        cast_ids = np.concatenate(df['actor_ids'].to_numpy()) if len(df) else np.array([], dtype=np.int64)
+        self.cast_actors, actor_ids = pd.factorize(cast_ids.astype(np.int64))             # 출연 쌍의 배우 코드
+        
+        # 코드별 이름 (각 사람이 처음 나온 위치의 이름, 데이터셋에서 앞뒤 공백 제거됨)
+        _, first = np.unique(self.director_codes, return_index=True)
+        self.director_names = df['director'].str.strip().to_numpy(dtype=object)[first]
+        _, first = np.unique(self.cast_actors, return_index=True)
+        names = np.concatenate(df['actors'].to_numpy()) if len(df) else np.array([], dtype=object)
+        self.actor_names = names[first].astype(object)
+        
+        # 노드 ID: 이름마다 처음 나온 사람부터 1, 2, ... (동명이인이 없으면 모두 1)
+        self.director_node_ids = self._node_ids(self.director_names, 'Director')
+        self.actor_node_ids = self._node_ids(self.actor_names, 'Actor')
+        self.director_id_map = dict(zip(director_ids.tolist(), self.director_node_ids))
+        self.actor_id_map = dict(zip(actor_ids.tolist(), self.actor_node_ids))
         
         self.data = df
         print(f"필터링 후 영화 수: {len(df)}")
         
+    def _node_ids(self, names, role):
+        """코드 순서의 이름 배열 -> 노드 ID 배열 (문자열 생성은 사람마다 한 번)"""
+        homonym_counts = pd.Series(names, dtype=object).groupby(names, sort=False).cumcount() + 1
+        return np.array([self.generate_unique_id(name, role, count)
+                         for name, count in zip(names, homonym_counts.tolist())], dtype=object)
+        
+    def _actor_genres(self):
+        """배우별 출연작 장르 목록 (중복 없이 처음 나온 순서)"""
+        genre_lists = self.data['genre'].to_numpy()
+        genre_counts = np.fromiter(map(len, genre_lists), dtype=np.int64, count=len(genre_lists))
+        genre_codes, genre_names = pd.factorize(pd.Series(
+            np.concatenate(genre_lists) if genre_counts.sum() else [], dtype=object))
+        # 영화 위치 -> 그 영화의 장르 코드 구간
+        starts = np.concatenate([[0], np.cumsum(genre_counts)[:-1]]) if len(genre_counts) else genre_counts
+        
+        # (출연 쌍, 장르) 쌍을 모두 펼침: 출연 쌍마다 그 영화의 장르 수만큼 반복
+        per_pair = genre_counts[self.cast_movies]
+        pair_actor = np.repeat(self.cast_actors, per_pair)
+        offsets = np.arange(per_pair.sum()) - np.repeat(np.cumsum(per_pair) - per_pair, per_pair)
+        pair_genre = genre_codes[np.repeat(starts[self.cast_movies], per_pair) + offsets]
+        
+        # (배우, 장르) 첫 등장만 남기고 배우별로 처음 나온 순서대로 정렬
+        keys = pair_actor.astype(np.int64) * max(len(genre_names), 1) + pair_genre
+        _, first = np.unique(keys, return_index=True)
+        first.sort()
+        actors = pair_actor[first]
+        order = np.argsort(actors, kind='stable')
+        genres = np.asarray(genre_names, dtype=object)[pair_genre[first][order]]
+        bounds = np.searchsorted(actors[order], np.arange(len(self.actor_names) + 1))
+        return [genres[bounds[i]:bounds[i + 1]].tolist() for i in range(len(self.actor_names))]
+        
     def create_nodes(self):
         """
         노드(감독, 배우) 데이터 생성
+        감독/배우 모두 처음 나온 순서로 정렬하고, 배우의 장르 목록도 처음 나온 순서를 유지합니다.
         """
         # 감독 노드
         directors = pd.DataFrame({
-            'Id': [self.director_id_map[d] for d in self.data['director'].unique()],
-            'Label': self.data['director'].unique(),
+            'Id': self.director_node_ids,
+            'Label': self.director_names,
             'Type': 'Director',
-            'MovieCount': self.data['director'].value_counts()
+            'MovieCount': np.bincount(self.director_codes, minlength=len(self.director_names))
         })
         
-        # 배우 노드
-        actors = set()
-        actor_movies = {}
-        actor_genres = {}
-        
-        for _, row in self.data.iterrows():
-            for actor in row['actors']:
-                actor = actor.strip()
-                actors.add(actor)
-                actor_movies[actor] = actor_movies.get(actor, 0) + 1
-                if actor not in actor_genres:
-                    actor_genres[actor] = set()
-                actor_genres[actor].update(row['genre'])
-        
+        # 배우 노드: 출연 영화 수와 출연작 장르 집합을 코드 배열 집계로 계산
         actors = pd.DataFrame({
-            'Id': [self.actor_id_map[a] for a in actors],
-            'Label': list(actors),
+            'Id': self.actor_node_ids,
+            'Label': self.actor_names,
             'Type': 'Actor',
-            'MovieCount': [actor_movies[a] for a in actors],
-            'Genres': [list(actor_genres[a]) for a in actors]
+            'MovieCount': np.bincount(self.cast_actors, minlength=len(self.actor_names)),
+            'Genres': self._actor_genres()
         })
         
         # 노드 통합
@@ -122,24 +145,23 @@ class DirectorActorPreprocessor:
     def create_edges(self):
         """
         엣지(감독-배우 협업) 데이터 생성
+        같은 감독-배우 쌍이 함께한 영화 수를 가중치로 합산하고 (Source, Target) ID 순으로 정렬합니다.
         """
-        edges = []
-        for _, row in self.data.iterrows():
-            director = row['director']
-            director_id = self.director_id_map[director]
-            for actor in row['actors']:
-                actor = actor.strip()
-                actor_id = self.actor_id_map[actor]
-                edges.append({
-                    'Source': director_id,
-                    'Target': actor_id,
-                    'Type': 'Undirected',
-                    'Weight': 1
-                })
-        
-        # 엣지 통합 및 가중치 계산
-        self.edges = pd.DataFrame(edges)
-        self.edges = self.edges.groupby(['Source', 'Target', 'Type'], as_index=False)['Weight'].sum()
+        n_actors = max(len(self.actor_names), 1)
+        keys = self.director_codes[self.cast_movies].astype(np.int64) * n_actors + self.cast_actors
+        pairs, weights = np.unique(keys, return_counts=True)
+        director_ids, actor_ids = self.director_node_ids, self.actor_node_ids
+        # ID 문자열 순서로 정렬 (이름 수만큼만 문자열 정렬하고 쌍은 정수 순위로 정렬)
+        director_rank = np.argsort(np.argsort(director_ids, kind='stable'), kind='stable')
+        actor_rank = np.argsort(np.argsort(actor_ids, kind='stable'), kind='stable')
+        sources, targets = pairs // n_actors, pairs % n_actors
+        order = np.lexsort((actor_rank[targets], director_rank[sources]))
+        self.edges = pd.DataFrame({
+            'Source': director_ids[sources[order]],
+            'Target': actor_ids[targets[order]],
+            'Type': 'Undirected',
+            'Weight': weights[order]
+        })
         print(f"총 엣지 수: {len(self.edges)}")
         
     def save_gephi_files(self):
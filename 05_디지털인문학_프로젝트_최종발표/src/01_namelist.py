@@ -1,7 +1,13 @@
 import requests
 from bs4 import BeautifulSoup
+import soupsieve as sv
 import csv
+import os
 import re
+import hashlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
 
 century_urls = {
     "BC": "https://en.wikipedia.org/wiki/List_of_philosophers_born_in_the_centuries_BC",
@@ -14,96 +20,167 @@ century_urls = {
     "20th": "https://en.wikipedia.org/wiki/List_of_philosophers_born_in_the_20th_century"
 }
 
-all_philosophers = []
+# 파일 경로를 data/raw/ 폴더로 변경
+OUTPUT_FILE = "data/raw/philosophers_by_century.csv"
+LIST_CACHE_DIR = "data/cache/list_pages"  # 목록 페이지 HTML 캐시 (요청 실패 시 사용)
+
+HEADERS = {
+    "User-Agent": "Digital_Humanities philosopher network research (https://github.com/IISweetHeartII/Digital_Humanities)"
+}
+TIMEOUT = 30
+MAX_WORKERS = 8  # 동시에 요청할 목록 페이지 수
+LIST_TITLE_KEYWORD = "List of philosophers"  # 실제 철학자 목록 페이지인지 확인하는 제목 문구
+
+# 목록 항목 한 개: 이름, 날짜(괄호 안 텍스트), 세기 구분, 위키피디아 링크
+PhilosopherRecord = namedtuple("PhilosopherRecord", ["name", "date", "century", "wikipedia_link"])
 
-# 위키피디아 메뉴 링크 패턴
+# 위키피디아 메뉴 링크 패턴 (링크마다 반복문 대신 하나의 정규식으로 검사)
 wikipedia_menu_patterns = [
     "Main_Page", "Wikipedia:", "Portal:", "Special:", "Help:", "File:", "Template:", "Category:",
     "Talk:", "User:"
 ]
+MENU_LINK_PATTERN = re.compile("|".join(re.escape(pattern) for pattern in wikipedia_menu_patterns))
+# 실제 철학자 항목인지 판별 (괄호 안에 년도 정보가 있는지)
+YEAR_PATTERN = re.compile(r'\(.*?(\d{1,4}(?:–| – | to |–|-)?\d{0,4}).*?\)')
+
+# 다양한 구조의 페이지에 맞춘 선택자 (미리 컴파일)
+COLUMN_ITEMS = sv.compile("div.div-col li, div.column-width li, div.columns li")
+LIST_ITEMS = sv.compile("ul li")
+FIRST_HEADING = sv.compile("h1#firstHeading")
+MAIN_CONTENT = sv.compile("div#mw-content-text")
+
+
+def cache_path(url):
+    """목록 페이지 URL에 해당하는 캐시 파일 경로"""
+    return os.path.join(LIST_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+
+
+def fetch_list_page(session, url):
+    """
+    목록 페이지 HTML을 가져옵니다. 성공하면 캐시에 저장하고,
+    요청이 실패하면 캐시된 HTML을 사용합니다. 둘 다 없으면 None.
+    """
+    path = cache_path(url)
+    try:
+        res = session.get(url, headers=HEADERS, timeout=TIMEOUT)
+        res.raise_for_status()
+        os.makedirs(LIST_CACHE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(res.text)
+        return res.text
+    except requests.exceptions.RequestException as e:
+        if os.path.exists(path):
+            print(f"요청 실패, 캐시 사용: {url} ({e})")
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        print(f"요청 실패: {url} ({e})")
+        return None
+
+
+def iter_list_items(main_content):
+    """본문의 목록 항목(li)을 순서대로 반환합니다."""
+    lis = COLUMN_ITEMS.select(main_content)
+    if lis:
+        return lis
+    # 다른 형태의 목록 찾기 (탐색 메뉴가 아닌 내용 목록만 포함)
+    return [
+        li for li in LIST_ITEMS.select(main_content)
+        if not li.find_parent("div", {"id": "toc"}) and not li.find_parent("div", {"class": "navbox"})
+    ]
+
+
+def extract_records(century, url, html, title_keyword=LIST_TITLE_KEYWORD):
+    """목록 페이지 HTML에서 철학자 항목을 PhilosopherRecord로 하나씩 반환합니다."""
+    soup = BeautifulSoup(html, "html.parser")
 
-for century, url in century_urls.items():
-    print(f"Processing {century} century: {url}")
-    res = requests.get(url)
-    soup = BeautifulSoup(res.text, "html.parser")
-    
-    philosophers_in_century = 0
-    
     # 페이지 제목 확인 (실제 철학자 목록 페이지인지)
-    page_title = soup.find("h1", {"id": "firstHeading"})
-    if page_title and "List of philosophers" in page_title.text:
-        # 실제 철학자 정보가 있는 부분 찾기
-        main_content = soup.find("div", {"id": "mw-content-text"})
-        if main_content:
-            # 세기별 섹션 찾기 또는 일반 목록 항목 찾기
-            lis = []
-            
-            # 다양한 구조의 페이지에 맞춰 선택자 적용
-            divs = main_content.select("div.div-col, div.column-width, div.columns")
-            if divs:
-                for div in divs:
-                    lis.extend(div.select("li"))
-            
-            # 다른 형태의 목록 찾기
-            if not lis:
-                lists = main_content.select("ul")
-                for ul in lists:
-                    # 탐색 메뉴가 아닌 내용 목록만 포함
-                    if not ul.find_parent("div", {"id": "toc"}) and not ul.find_parent("div", {"class": "navbox"}):
-                        lis.extend(ul.select("li"))
-                        
-            for li in lis:
-                if not li.text.strip():
+    page_title = FIRST_HEADING.select_one(soup)
+    if title_keyword and not (page_title and title_keyword in page_title.text):
+        return
+    # 실제 철학자 정보가 있는 부분 찾기
+    main_content = MAIN_CONTENT.select_one(soup)
+    if not main_content:
+        return
+
+    for li in iter_list_items(main_content):
+        text = li.get_text().strip()
+        if not text:
+            continue
+
+        # 메뉴 항목 제외
+        link_tag = li.find("a")
+        href = link_tag.get("href") if link_tag else None
+        if href and MENU_LINK_PATTERN.search(href):
+            continue
+
+        try:
+            # 이름과 날짜 파싱
+            if "(" in text and YEAR_PATTERN.search(text):
+                # 이름에서 쉼표 제거
+                name = text.split('(')[0].strip().replace(",", "").strip()
+                date_match = text.split('(')[-1].replace(')', '').strip()
+
+                # 너무 짧은 이름 제외 (1-2글자는 아마도 오류)
+                if len(name) <= 2:
                     continue
-                
-                # 메뉴 항목 제외
-                link_tag = li.find("a")
-                if link_tag and "href" in link_tag.attrs:
-                    # 위키피디아 메뉴 항목 판별
-                    href = link_tag["href"]
-                    skip = False
-                    for pattern in wikipedia_menu_patterns:
-                        if pattern in href:
-                            skip = True
-                            break
-                    if skip:
-                        continue
-                
-                try:
-                    # 텍스트 파싱
-                    text = li.get_text().strip()
-                    
-                    # 실제 철학자 항목인지 판별 (괄호 안에 년도 정보가 있는지)
-                    year_pattern = re.search(r'\(.*?(\d{1,4}(?:–| – | to |–|-)?\d{0,4}).*?\)', text)
-                    
-                    # 이름과 날짜 파싱
-                    if "(" in text and year_pattern:
-                        name = text.split('(')[0].strip()
-                        date_match = text.split('(')[-1].replace(')', '').strip()
-                        
-                        # 이름에서 쉼표 제거
-                        name = name.replace(",", "").strip()
-                        
-                        # 너무 짧은 이름 제외 (1-2글자는 아마도 오류)
-                        if len(name) <= 2:
-                            continue
-                            
-                        link = "https://en.wikipedia.org" + link_tag["href"] if link_tag and "href" in link_tag.attrs else ""
-                        all_philosophers.append([name, date_match, century, link])
-                        philosophers_in_century += 1
-                
-                except Exception as e:
-                    print(f"Error processing philosopher: {li.get_text()[:50]}..., Error: {e}")
-    
-    print(f"Found {philosophers_in_century} philosophers in {century} century")
-    
-print(f"Total philosophers found: {len(all_philosophers)}")
-
-# CSV 저장
-# 파일 경로를 data/raw/ 폴더로 변경
-with open("data/raw/philosophers_by_century.csv", "w", encoding="utf-8", newline="") as f:
-    writer = csv.writer(f)
-    writer.writerow(["Name", "Date", "Century", "Wikipedia_Link"])
-    writer.writerows(all_philosophers)
 
-print("Data saved to data/raw/philosophers_by_century.csv")
+                link = urljoin(url, href) if href else ""
+                yield PhilosopherRecord(name, date_match, century, link)
+
+        except Exception as e:
+            print(f"Error processing philosopher: {text[:50]}..., Error: {e}")
+
+
+def stream_philosophers(urls, max_workers=MAX_WORKERS):
+    """
+    모든 목록 페이지를 공유 세션으로 동시에 요청하고, 입력 순서대로 파싱하여
+    PhilosopherRecord를 스트리밍으로 반환합니다.
+
+    Args:
+        urls (dict): 구분(세기 등) -> 목록 페이지 URL
+
+    Raises:
+        RuntimeError: 요청도 실패하고 캐시도 없는 목록 페이지가 있을 때 (일부만 저장하지 않도록)
+    """
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        pages = executor.map(lambda url: fetch_list_page(session, url), urls.values())
+        for (century, url), html in zip(urls.items(), pages):
+            print(f"Processing {century} century: {url}")
+            if html is None:
+                raise RuntimeError(f"목록 페이지를 가져올 수 없습니다 (캐시 없음): {url}")
+            count = 0
+            for record in extract_records(century, url, html):
+                count += 1
+                yield record
+            print(f"Found {count} philosophers in {century} century")
+
+
+def main():
+    total = 0
+    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+    # CSV 저장 (항목을 모아 두지 않고 임시 파일에 바로 기록, 모든 페이지가 성공한 뒤에만 기존 파일을 교체)
+    temp_file = OUTPUT_FILE + ".tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Name", "Date", "Century", "Wikipedia_Link"])
+            for record in stream_philosophers(century_urls):
+                writer.writerow(record)
+                total += 1
+    except Exception:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        print(f"오류: 목록 수집이 중단되어 기존 {OUTPUT_FILE}을 그대로 둡니다.")
+        raise
+    os.replace(temp_file, OUTPUT_FILE)
+
+    print(f"Total philosophers found: {total}")
+    print(f"Data saved to {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,225 +1,459 @@
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from collections import defaultdict
 import time
 import random
 import os
 import glob
 
-# CSV 파일 확인
+from crawler_metrics import MAX_RETRY_RUNS, CrawlerMonitor, RetryQueue
+from mention_context import MentionContextBuilder
+from mention_matcher import SubstringNameMatcher, build_matcher, build_name_set, load_redirects
+from run_report import NULL_REPORT, RunReport
+from text_normalize import normalize_text
+from wiki_api import fetch_pages
+from wiki_pages import PageCache, TitleIndex, normalize_title, parse_page, wikitext_to_text
+
 # 파일 경로를 data/raw/ 폴더로 변경
-csv_path = "data/raw/philosophers_by_century.csv"
-if not os.path.exists(csv_path):
-    print(f"오류: {csv_path} 파일이 존재하지 않습니다.")
-    exit(1)
-
-# CSV 파일 읽기
-print("철학자 데이터 로딩 중...")
-try:
-    # 다양한 인코딩 시도
-    encodings = ['utf-8', 'cp1252', 'latin1', 'iso-8859-1']
-    df = None
-    
-    for encoding in encodings:
-        try:
-            df = pd.read_csv(csv_path, encoding=encoding)
-            print(f"성공: {encoding} 인코딩으로 파일 로드됨")
-            break
-        except UnicodeDecodeError:
-            continue
-    
-    if df is None:
-        print("오류: 지원되는 인코딩으로 파일을 읽을 수 없습니다")
+CSV_PATH = "data/raw/philosophers_by_century.csv"
+CHECKPOINT_DIR = "data/checkpoints"
+PROCESSED_DIR = "data/processed"
+
+# 언급 매칭 방식
+# "alias": 별칭 테이블(성, 리다이렉트, 관용 표기) 기반 한 번 스캔 매칭
+# "substring": 기존 방식 (전체 이름의 소문자 부분 문자열 검색)
+MATCH_MODE = "alias"
+
+# 엣지 추출 방식
+# "mention": 본문 텍스트에서 철학자 이름 검색
+# "link": 본문의 하이퍼링크(<a href>)가 가리키는 철학자 문서
+# "both": 두 방식을 같은 페이지에서 함께 추출 (16_compare_edge_sources.py로 비교)
+EDGE_MODE = "mention"
+
+# 문서 수집 방식
+# "html": 철학자마다 위키피디아 HTML 페이지를 하나씩 요청
+# "api": MediaWiki API로 50개 문서씩 묶어 위키텍스트와 링크를 받아 로컬 캐시(data/cache/pages)에 저장 후 사용
+FETCH_MODE = "html"
+
+# 언급 문장 위치 색인 저장 (data/processed/mention_contexts, MATCH_MODE="alias"에서만 사용)
+# mention_context.py로 (출발, 대상) 엣지의 근거 문장을 다시 수집하지 않고 조회할 수 있음
+RECORD_CONTEXTS = True
+
+# 실행 보고서 (data/reports/에 단계별 시간, 카운터, 페이지별 지연 시간 분포 저장)
+# None: 시간/카운터만 기록, "cprofile": 함수별 프로파일 포함, "tracemalloc": 단계별 최대 메모리 포함
+PROFILE_MODE = None
+
+# 크롤러 실시간 상태: data/checkpoints/crawler_status.json을 주기적으로 갱신
+# 포트를 지정하면 http://127.0.0.1:<포트>/metrics 에서 Prometheus 형식으로도 제공 (예: 9108)
+METRICS_PORT = None
+
+# 엣지 종류별 출력 파일 이름 (엣지 리스트, 중심성 목록)
+OUTPUT_FILES = {
+    "mention": ("mention_edges", "centrality_raw"),
+    "link": ("link_edges", "centrality_raw_link"),
+}
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+BATCH_SIZE = 50  # 진행 상황 표시 주기
+CHECKPOINT_SIZE = 100  # 중간 결과 저장 주기
+MAX_RETRIES = 3  # 시간 초과, 연결 오류, 429/5xx 응답의 재시도 횟수
+RETRY_BACKOFF = 2.0  # 첫 재시도 전 대기 시간 (초, 재시도마다 두 배)
+
+
+class FetchError(Exception):
+    """재시도 후에도 페이지를 가져오지 못한 경우 (reason 예: 'ReadTimeout', 'HTTP 404')"""
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def load_philosophers(csv_path=CSV_PATH):
+    """철학자 목록을 로드하고 중복 이름을 제거하여 (이름 목록, 링크 목록)을 반환합니다."""
+    if not os.path.exists(csv_path):
+        print(f"오류: {csv_path} 파일이 존재하지 않습니다.")
         exit(1)
-    
-    names = df["Name"].tolist()
-    wiki_links = df["Wikipedia_Link"].tolist()
-    print(f"총 {len(names)}명의 철학자 데이터 로드 완료")
-except Exception as e:
-    print(f"CSV 파일 읽기 오류: {e}")
-    exit(1)
-
-# 중복 이름 확인 및 제거
-name_set = set()
-unique_names = []
-unique_links = []
-
-for i, name in enumerate(names):
-    if name not in name_set and isinstance(name, str):
-        name_set.add(name)
-        unique_names.append(name)
-        unique_links.append(wiki_links[i])
-
-print(f"중복 제거 후 {len(unique_names)}명의 철학자 데이터 사용")
-
-# 테스트 모드 (주석 처리하여 비활성화)
-# test_limit = 10  # 테스트 모드
-# unique_names, unique_links = unique_names[:test_limit], unique_links[:test_limit]
-
-# 체크포인트 로딩
-start_index = 0
-mention_counts = defaultdict(int)
-edges = []
-
-# 최신 체크포인트 파일 찾기 (data/checkpoints 폴더 내에서 검색)
-checkpoint_files = glob.glob("data/checkpoints/centrality_raw_checkpoint_*.csv")
-latest_checkpoint = None
-latest_index = 0
-
-for cf in checkpoint_files:
+
+    print("철학자 데이터 로딩 중...")
     try:
-        # 파일 이름에서 인덱스 추출 (예: centrality_raw_checkpoint_1300.csv)
-        index_str = cf.split("_")[-1].split(".")[0]
-        index = int(index_str)
-        if index > latest_index:
-            latest_index = index
-            latest_checkpoint = cf
-    except:
-        continue
-
-if latest_checkpoint:
-    print(f"체크포인트 로딩 중: {latest_checkpoint}")
+        # 다양한 인코딩 시도
+        encodings = ['utf-8', 'cp1252', 'latin1', 'iso-8859-1']
+        df = None
+
+        for encoding in encodings:
+            try:
+                df = pd.read_csv(csv_path, encoding=encoding)
+                print(f"성공: {encoding} 인코딩으로 파일 로드됨")
+                break
+            except UnicodeDecodeError:
+                continue
+
+        if df is None:
+            print("오류: 지원되는 인코딩으로 파일을 읽을 수 없습니다")
+            exit(1)
+
+        names = df["Name"].tolist()
+        wiki_links = df["Wikipedia_Link"].tolist()
+        print(f"총 {len(names)}명의 철학자 데이터 로드 완료")
+    except Exception as e:
+        print(f"CSV 파일 읽기 오류: {e}")
+        exit(1)
+
+    # 중복 이름 확인 및 제거
+    name_set = set()
+    unique_names = []
+    unique_links = []
+
+    for i, name in enumerate(names):
+        if name not in name_set and isinstance(name, str):
+            name_set.add(name)
+            unique_names.append(name)
+            unique_links.append(wiki_links[i])
+
+    print(f"중복 제거 후 {len(unique_names)}명의 철학자 데이터 사용")
+    return unique_names, unique_links
+
+
+def load_checkpoint(kind):
+    """
+    엣지 종류별 최신 체크포인트를 로드합니다.
+
+    Returns:
+        tuple: (시작 인덱스, 언급 횟수 dict, 엣지 리스트)
+    """
+    edges_prefix, centrality_prefix = OUTPUT_FILES[kind]
+    mention_counts = defaultdict(int)
+    edges = []
+
+    # 최신 체크포인트 파일 찾기 (data/checkpoints 폴더 내에서 검색)
+    checkpoint_files = glob.glob(f"{CHECKPOINT_DIR}/{centrality_prefix}_checkpoint_*.csv")
+    latest_checkpoint = None
+    latest_index = 0
+
+    for cf in checkpoint_files:
+        try:
+            # 파일 이름에서 인덱스 추출 (예: centrality_raw_checkpoint_1300.csv)
+            index = int(cf.split("_")[-1].split(".")[0])
+            if index > latest_index:
+                latest_index = index
+                latest_checkpoint = cf
+        except ValueError:
+            continue
+
+    if not latest_checkpoint:
+        print(f"[{kind}] 체크포인트 파일이 없습니다. 처음부터 시작합니다.")
+        return 0, mention_counts, edges
+
+    print(f"[{kind}] 체크포인트 로딩 중: {latest_checkpoint}")
     try:
-        # 체크포인트 파일 읽기
         checkpoint_df = pd.read_csv(latest_checkpoint)
-        
-        # mention_counts 로드
-        for index, row in checkpoint_df.iterrows():
-            mention_counts[row["Name"]] = row["RawCentrality"]
-            
+        for name, count in zip(checkpoint_df["Name"], checkpoint_df["RawCentrality"]):
+            mention_counts[name] = count
+
         # 해당 체크포인트까지 처리된 엣지 파일 로드
-        edge_checkpoint_file = f"data/checkpoints/mention_edges_checkpoint_{latest_index}.csv"
+        edge_checkpoint_file = f"{CHECKPOINT_DIR}/{edges_prefix}_checkpoint_{latest_index}.csv"
         if os.path.exists(edge_checkpoint_file):
             edge_df = pd.read_csv(edge_checkpoint_file)
             edges = list(zip(edge_df["Source"], edge_df["Target"]))
             print(f"엣지 데이터 로드 완료: {len(edges)}개")
-            
-        start_index = latest_index
-        print(f"체크포인트 로딩 완료. {start_index}부터 시작합니다.")
-        
+
+        print(f"체크포인트 로딩 완료. {latest_index}부터 시작합니다.")
+        return latest_index, mention_counts, edges
+
     except Exception as e:
         print(f"체크포인트 로딩 오류: {e}")
         # 오류 발생 시 처음부터 다시 시작
-        start_index = 0
-        mention_counts = defaultdict(int)
-        edges = []
         print("체크포인트 로딩 실패. 처음부터 다시 시작합니다.")
+        return 0, defaultdict(int), []
 
-else:
-    print("체크포인트 파일이 없습니다. 처음부터 시작합니다.")
-
-
-# 언급 횟수 카운트 준비 (체크포인트 로드 후 초기화)
-# mention_counts = defaultdict(int) # 이미 위에서 로드 또는 초기화
-# edges = [] # 이미 위에서 로드 또는 초기화
-
-# 진행 상황 표시를 위한 변수
-total = len(unique_names)
-# batch_size = max(1, min(50, (total - start_index) // 20))  # 진행 상황 업데이트 빈도 (남은 항목 기준)
-batch_size = 50 # 고정 배치 사이즈로 변경
-checkpoint_size = 100  # 중간 결과 저장 주기
-
-print("위키피디아 데이터 수집 시작...")
-# 루프를 start_index부터 시작
-for i in range(start_index, total):
-    source_name = unique_names[i]
-    url = unique_links[i]
-    
-    # 진행 상황 표시
-    if (i + 1) % batch_size == 0 or i == total - 1:
-        print(f"진행 중: {i+1}/{total} ({(i+1)/total*100:.1f}%)")
-    
-    # 빈 URL이면 건너뛰기
-    if not isinstance(url, str) or not url.startswith("http"):
-        print(f"건너뛰기: {source_name} - 유효하지 않은 URL: {url}")
-        continue
-    
-    try:
+
+def save_results(kind, names, mention_counts, edges, checkpoint_index=None):
+    """중심성 목록과 엣지 리스트를 저장합니다. checkpoint_index가 있으면 체크포인트로 저장합니다."""
+    edges_prefix, centrality_prefix = OUTPUT_FILES[kind]
+    if checkpoint_index is None:
+        centrality_path = f"{PROCESSED_DIR}/{centrality_prefix}.csv"
+        edges_path = f"{PROCESSED_DIR}/{edges_prefix}.csv"
+    else:
+        # 파일 이름을 현재까지 처리된 항목 수로 저장하여 중복 방지 및 순차적 저장
+        centrality_path = f"{CHECKPOINT_DIR}/{centrality_prefix}_checkpoint_{checkpoint_index}.csv"
+        edges_path = f"{CHECKPOINT_DIR}/{edges_prefix}_checkpoint_{checkpoint_index}.csv"
+
+    centrality_list = [{"Name": name, "RawCentrality": mention_counts.get(name, 0)} for name in names]
+    centrality_df = pd.DataFrame(centrality_list)
+    centrality_df = centrality_df.sort_values(by="RawCentrality", ascending=False)  # 중심성 기준 정렬
+    centrality_df.to_csv(centrality_path, index=False)
+
+    if edges or checkpoint_index is None:
+        edges_df = pd.DataFrame(edges, columns=["Source", "Target"])
+        edges_df.to_csv(edges_path, index=False)
+    return centrality_df, centrality_path, edges_path
+
+
+def fetch_html(source_name, url, report=NULL_REPORT):
+    """
+    페이지 HTML을 요청합니다. 시간 초과, 연결 오류, 429/5xx 응답은 대기 시간을 늘려 가며 재시도하고,
+    끝내 실패하면 FetchError를 발생시킵니다. 오류 종류, HTTP 상태, 재시도 횟수는 report 카운터에 기록합니다.
+    """
+    reason = None
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt > 0:
+            report.count("retries")
+            time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
         # 위키피디아 서버에 과부하 방지를 위한 대기
-        time.sleep(random.uniform(0.5, 1.5)) # 대기 시간 조금 늘림
-        
-        # 페이지 요청
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        res = requests.get(url, headers=headers, timeout=15) # 타임아웃 시간 늘림
-        
-        # 응답 코드 확인
-        if res.status_code != 200:
-            print(f"경고: {source_name} 페이지 응답 코드 {res.status_code}")
+        time.sleep(random.uniform(0.5, 1.5))
+        try:
+            res = requests.get(url, headers=HEADERS, timeout=15)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            reason = type(e).__name__
+            report.count(f"errors_{reason}")
+            print(f"{'타임아웃' if isinstance(e, requests.exceptions.Timeout) else '연결 오류'}: {source_name}")
             continue
-            
-        # HTML 파싱
-        soup = BeautifulSoup(res.text, "html.parser")
-        
-        # 본문 내용만 추출 (관련 없는 메뉴, 푸터 등 제외)
-        main_content = soup.find("div", {"id": "mw-content-text"})
-        if main_content:
-            text = main_content.get_text().lower()
+        except requests.exceptions.RequestException as e:
+            report.count(f"errors_{type(e).__name__}")
+            raise FetchError(type(e).__name__)
+
+        # 응답 코드 확인
+        report.count(f"http_{res.status_code}")
+        if res.status_code == 200:
+            report.count("bytes_fetched", len(res.content))
+            return res.text
+        reason = f"HTTP {res.status_code}"
+        print(f"경고: {source_name} 페이지 응답 코드 {res.status_code}")
+        if res.status_code != 429 and res.status_code < 500:
+            break  # 404 등은 다시 시도해도 같은 결과
+    raise FetchError(reason)
+
+
+def get_page(source_name, url, cache=None, report=NULL_REPORT):
+    """
+    문서의 본문 텍스트와 링크 목록을 구합니다. cache가 있으면 API로 미리 받아 둔 캐시를 사용합니다.
+    HTML 요청이 끝내 실패하면 FetchError가 발생합니다.
+
+    Returns:
+        tuple: (본문 텍스트, 링크 목록) 또는 API에서 찾을 수 없는 문서면 None
+    """
+    if cache is not None:
+        title = normalize_title(url)
+        with report.stage("fetch"):
+            record = cache.get(title) if title else None
+        if record is None or record.get("missing"):
+            print(f"경고: {source_name} 문서를 API에서 찾을 수 없습니다")
+            return None
+        with report.stage("parse"):
+            return wikitext_to_text(record["wikitext"]), record["links"]
+
+    with report.stage("fetch"):
+        html = fetch_html(source_name, url, report)
+    # 본문 텍스트와 본문 링크를 한 번의 파싱으로 추출 (메뉴, 푸터 등 제외)
+    with report.stage("parse"):
+        return parse_page(html)
+
+
+def build_extractors(names, wiki_links, kinds, contexts=None):
+    """
+    엣지 종류별 추출 함수를 만듭니다.
+
+    Args:
+        contexts (MentionContextBuilder): 있으면 언급 매칭 중에 언급 위치도 기록 (alias 모드)
+
+    Returns:
+        dict: 엣지 종류 -> 함수(출발 이름, 본문 텍스트, 링크 목록) -> 대상 철학자 이름 목록 (출발 철학자 자신은 제외)
+    """
+    extractors = {}
+    if "mention" in kinds:
+        if MATCH_MODE == "alias":
+            matcher, ambiguous_surnames = build_matcher(names)
+            print(f"별칭 매처 생성 완료 (모호하여 제외한 성: {len(ambiguous_surnames)}개)")
+            if contexts is not None:
+                def extract_with_contexts(source_name, page_text, hrefs):
+                    mentions = matcher.find_mention_spans(page_text, exclude=source_name)
+                    contexts.add_page(source_name, page_text, mentions)
+                    return sorted({name for name, _, _ in mentions}, key=matcher.ids.__getitem__)
+
+                extractors["mention"] = extract_with_contexts
+            else:
+                # 페이지당 한 번 정규화(casefold, 발음 구별 기호 제거, 토큰화) 후 토큰 경계 기준으로 매칭
+                extractors["mention"] = lambda source_name, page_text, hrefs: matcher.find_mentions(
+                    normalize_text(page_text), exclude=source_name)
         else:
-            text = soup.get_text().lower()
-        
-        # 다른 철학자 이름 검색
-        mentions_in_page = 0
-        for target_name in unique_names:
-            # 이름 길이가 너무 짧으면 건너뛰기 (False positive 줄임)
-            if len(target_name) <= 2:
-                continue
-                
-            if target_name == source_name:  # 자기 자신은 제외
-                continue
-                
-            # 대소문자 구분 없이 이름 검색
-            if isinstance(target_name, str) and target_name.lower() in text:
-                mention_counts[target_name] += 1
-                edges.append((source_name, target_name))
-                mentions_in_page += 1
-        
-        if mentions_in_page > 0:
-            print(f"  - {source_name} 페이지에서 {mentions_in_page}명의 철학자 언급 발견")
-                
-    except requests.exceptions.Timeout:
-        print(f"타임아웃: {source_name}")
-    except requests.exceptions.ConnectionError:
-        print(f"연결 오류: {source_name}")
-        time.sleep(10)  # 연결 오류 시 더 오래 대기
-    except Exception as e:
-        print(f"오류 발생 ({source_name}): {e}")
-    
-    # 중간 결과 저장
-    # 저장 파일 이름에 현재까지 처리된 총 항목 수를 사용 (i+1)
-    if (i + 1) % checkpoint_size == 0 or i == total - 1:
-        print(f"중간 결과 저장 중... ({i+1}/{total}개 처리 완료)")
-        
-        # 중심성 목록 저장 (data/checkpoints 폴더에 저장)
-        centrality_list = [{"Name": name, "RawCentrality": mention_counts.get(name, 0)} for name in unique_names]
-        centrality_df = pd.DataFrame(centrality_list)
-        centrality_df = centrality_df.sort_values(by="RawCentrality", ascending=False)
-        centrality_df.to_csv(f"data/checkpoints/centrality_raw_checkpoint_{i+1}.csv", index=False)
-        
-        # 엣지 리스트 저장 (data/checkpoints 폴더에 저장)
-        if edges:
-            edges_df = pd.DataFrame(edges, columns=["Source", "Target"])
-            # 파일 이름을 현재 인덱스(i+1)로 저장하여 중복 방지 및 순차적 저장
-            edges_df.to_csv(f"data/checkpoints/mention_edges_checkpoint_{i+1}.csv", index=False)
-
-print("데이터 수집 완료. 결과 저장 중...")
-
-# 최종 결과 저장 (data/processed 폴더에 저장)
-# 중심성 목록 저장
-centrality_list = [{"Name": name, "RawCentrality": mention_counts.get(name, 0)} for name in unique_names]
-centrality_df = pd.DataFrame(centrality_list)
-centrality_df = centrality_df.sort_values(by="RawCentrality", ascending=False)  # 중심성 기준 정렬
-centrality_df.to_csv("data/processed/centrality_raw.csv", index=False)
-print(f"중심성 데이터 저장 완료: data/processed/centrality_raw.csv (총 {len(centrality_list)}개 항목)")
-
-# 엣지 리스트 저장 (네트워크 구성용)
-edges_df = pd.DataFrame(edges, columns=["Source", "Target"])
-edges_df.to_csv("data/processed/mention_edges.csv", index=False)
-print(f"엣지 데이터 저장 완료: data/processed/mention_edges.csv (총 {len(edges)}개 연결)")
-
-# 상위 중심성 결과 출력
-print("\n상위 20명의 언급 횟수:")
-for i, row in centrality_df.head(20).iterrows():
-    print(f"{row['Name']}: {row['RawCentrality']}회 언급")
+            # 기존 방식: 길이/중복/소문자 변환은 이름 집합을 만들 때 한 번만 처리
+            name_set = build_name_set(names)
+            print(f"이름 집합 생성 완료: {len(name_set.names)}개 사용 (짧은 이름 {len(name_set.skipped)}개, "
+                  f"일반 단어 {len(name_set.common)}개, 소문자 표기 중복 {len(name_set.ambiguous)}개 제외)")
+            matcher = SubstringNameMatcher(name_set)
+            extractors["mention"] = lambda source_name, page_text, hrefs: matcher.find_mentions(page_text, exclude=source_name)
+    if "link" in kinds:
+        title_index = TitleIndex(names, wiki_links, load_redirects())
+        print(f"문서 제목 인덱스 생성 완료: {len(title_index)}개 제목")
+        # 링크 수에 비례하는 해시 조회만 수행
+        extractors["link"] = lambda source_name, page_text, hrefs: title_index.link_targets(hrefs, exclude=source_name)
+    return extractors
+
+
+def main():
+    report = RunReport("02_search_name_from_wiki", profile=PROFILE_MODE).start()
+    with report.stage("load"):
+        unique_names, unique_links = load_philosophers()
+
+    # 테스트 모드 (주석 처리하여 비활성화)
+    # test_limit = 10  # 테스트 모드
+    # unique_names, unique_links = unique_names[:test_limit], unique_links[:test_limit]
+
+    kinds = ["mention", "link"] if EDGE_MODE == "both" else [EDGE_MODE]
+
+    # 체크포인트 로딩 (엣지 종류별로 저장되므로 가장 덜 진행된 지점부터 재개)
+    state = {kind: load_checkpoint(kind) for kind in kinds}
+    done_index = {kind: state[kind][0] for kind in kinds}
+    mention_counts = {kind: state[kind][1] for kind in kinds}
+    edges = {kind: state[kind][2] for kind in kinds}
+    start_index = min(done_index.values())
+
+    contexts = None
+    if RECORD_CONTEXTS and "mention" in kinds and MATCH_MODE == "alias":
+        # 체크포인트에서 재개하면 저장된 문맥 색인에 이어서 기록
+        contexts = MentionContextBuilder(unique_names, resume=start_index > 0)
+    with report.stage("build_extractors"):
+        extractors = build_extractors(unique_names, unique_links, kinds, contexts)
+
+    total = len(unique_names)
+
+    cache = None
+    if FETCH_MODE == "api":
+        # 남은 문서를 50개씩 묶어 한 번에 받아 두고, 아래 루프에서는 캐시만 읽음
+        cache = PageCache()
+        titles = [normalize_title(url) for url in unique_links[start_index:]]
+        with report.stage("prefetch"):
+            n_requests = fetch_pages([title for title in titles if title], cache=cache)
+        report.count("api_requests", n_requests)
+        print(f"API 요청 {n_requests}회로 문서 {len(titles)}개 준비 완료")
+
+    monitor = CrawlerMonitor(report, total=total - start_index, port=METRICS_PORT).start()
+
+    # 이전 실행에서 가져오지 못한 URL: 이번 실행 범위에 다시 포함된 문서는 본 루프에서, 나머지는 루프 뒤에 다시 시도
+    # 항목은 성공할 때까지 대기열에 남겨 두므로, 중간에 중단되어도 체크포인트의 대기열 파일에서 빠지지 않음
+    retry_queue = RetryQueue()
+    previous_failures = retry_queue.entries()
+    attempts = {entry["Name"]: entry["Attempts"] for entry in previous_failures}
+    names_this_run = set(unique_names[start_index:])
+    known_names = set(unique_names)
+    retries_pending = [
+        entry for entry in previous_failures
+        if entry["Name"] not in names_this_run and entry["Name"] in known_names and entry["Attempts"] < MAX_RETRY_RUNS
+    ]
+    dropped = [
+        entry["Name"] for entry in previous_failures
+        if entry["Attempts"] >= MAX_RETRY_RUNS or entry["Name"] not in known_names
+    ]
+    for name in dropped:
+        retry_queue.discard(name)
+    n_given_up = sum(1 for entry in previous_failures if entry["Attempts"] >= MAX_RETRY_RUNS)
+    if n_given_up:
+        print(f"{MAX_RETRY_RUNS}회 실행 동안 계속 실패한 문서 {n_given_up}개는 재시도 대기열에서 제외합니다.")
+    monitor.total += len(retries_pending)
+
+    def process_page(source_name, url, done_kinds=()):
+        """페이지 하나를 가져와 엣지를 추가합니다. 가져오지 못하면 재시도 대기열에 넣습니다."""
+        page_start = time.perf_counter()
+        try:
+            page = get_page(source_name, url, cache, report)
+        except FetchError as e:
+            page = None
+            retry_queue.add(source_name, url, e.reason, attempts.get(source_name, 0))
+        if page is None:
+            report.count("pages_failed")
+        else:
+            report.count("pages_ok")
+            retry_queue.discard(source_name)
+            try:
+                page_text, hrefs = page
+                targets = {}
+                for kind, extract in extractors.items():
+                    with report.stage(f"match_{kind}"):
+                        targets[kind] = extract(source_name, page_text, hrefs)
+
+                for kind, target_names in targets.items():
+                    if kind in done_kinds:  # 이미 체크포인트에 반영된 페이지
+                        continue
+                    # 대상 목록은 추출 단계에서 자기 자신을 이미 제외함
+                    counts = mention_counts[kind]
+                    for target_name in target_names:
+                        counts[target_name] += 1
+                    edges[kind].extend((source_name, target_name) for target_name in target_names)
+                    found = len(target_names)
+                    report.count(f"edges_{kind}", found)
+                    if found > 0:
+                        print(f"  - [{kind}] {source_name} 페이지에서 {found}명의 철학자 언급 발견")
+
+            except Exception as e:
+                report.count("pages_error")
+                print(f"오류 발생 ({source_name}): {e}")
+        report.observe("page_latency", time.perf_counter() - page_start)
+        monitor.maybe_write_status()
+
+    print("위키피디아 데이터 수집 시작...")
+    for i in range(start_index, total):
+        source_name = unique_names[i]
+        url = unique_links[i]
+
+        # 진행 상황 표시
+        if (i + 1) % BATCH_SIZE == 0 or i == total - 1:
+            print(f"진행 중: {i+1}/{total} ({(i+1)/total*100:.1f}%) - {monitor.progress_line()}")
+
+        # 빈 URL이면 건너뛰기
+        if not isinstance(url, str) or not url.startswith("http"):
+            print(f"건너뛰기: {source_name} - 유효하지 않은 URL: {url}")
+            continue
+
+        process_page(source_name, url, {kind for kind in kinds if i < done_index[kind]})
+
+        # 중간 결과 저장
+        if (i + 1) % CHECKPOINT_SIZE == 0 or i == total - 1:
+            print(f"중간 결과 저장 중... ({i+1}/{total}개 처리 완료)")
+            with report.stage("checkpoint"):
+                for kind in kinds:
+                    save_results(kind, unique_names, mention_counts[kind], edges[kind], checkpoint_index=i + 1)
+                if contexts is not None:
+                    contexts.save()
+                retry_queue.save()
+
+    if retries_pending:
+        print(f"이전 실행에서 가져오지 못한 문서 {len(retries_pending)}개 다시 시도 중...")
+        for entry in retries_pending:
+            process_page(entry["Name"], entry["URL"])
+        # 재시도로 얻은 엣지를 마지막 체크포인트에 반영한 뒤에 대기열을 줄여 저장
+        # (순서가 바뀌면 다음 실행이 체크포인트에서 재개할 때 이 엣지들이 사라짐)
+        with report.stage("checkpoint"):
+            for kind in kinds:
+                save_results(kind, unique_names, mention_counts[kind], edges[kind], checkpoint_index=total)
+            if contexts is not None:
+                contexts.save()
+    retry_queue.save()
+    if len(retry_queue):
+        print(f"가져오지 못한 문서 {len(retry_queue)}개를 재시도 대기열에 저장: {retry_queue.path}")
+    monitor.close()
+
+    print("데이터 수집 완료. 결과 저장 중...")
+    if contexts is not None:
+        print(f"언급 문맥 색인 저장 완료: {contexts.save()}")
+        contexts.close()
+
+    # 최종 결과 저장 (data/processed 폴더에 저장)
+    for kind in kinds:
+        with report.stage("save"):
+            centrality_df, centrality_path, edges_path = save_results(kind, unique_names, mention_counts[kind], edges[kind])
+        print(f"중심성 데이터 저장 완료: {centrality_path} (총 {len(centrality_df)}개 항목)")
+        print(f"엣지 데이터 저장 완료: {edges_path} (총 {len(edges[kind])}개 연결)")
+
+        # 상위 중심성 결과 출력
+        print(f"\n[{kind}] 상위 20명의 언급 횟수:")
+        for _, row in centrality_df.head(20).iterrows():
+            print(f"{row['Name']}: {row['RawCentrality']}회 언급")
+
+    json_path, text_path = report.finish()
+    print(f"\n실행 보고서 저장 완료: {json_path}, {text_path}")
+
+
+if __name__ == "__main__":
+    main()
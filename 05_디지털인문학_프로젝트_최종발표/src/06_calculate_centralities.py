@@ -1,12 +1,17 @@
 import pandas as pd
 import networkx as nx
 import os
+from run_report import RunReport
 
 # 파일 경로 설정
 CENTRALITY_RAW_FILE = "data/processed/centrality_raw.csv"
 EDGES_FILE = "data/processed/mention_edges.csv"
 OUTPUT_FILE = "data/processed/centralities.csv"
 
+# 실행 보고서 (data/reports/에 지표별 계산 시간 저장)
+# None: 시간만 기록, "cprofile": 함수별 프로파일 포함, "tracemalloc": 단계별 최대 메모리 포함
+PROFILE_MODE = None
+
 def load_csv(filepath, file_description):
     """CSV 파일을 로드하고 기본 정보를 출력"""
     if not os.path.exists(filepath):
@@ -38,8 +43,10 @@ def load_csv(filepath, file_description):
 
 # 1. 데이터 파일 로드 및 그래프 생성 (src/05_create_network_graph.py 로직 포함)
 print("--- 데이터 로드 및 네트워크 그래프 생성 중 ---")
-centrality_df = load_csv(CENTRALITY_RAW_FILE, "중심성 원본 데이터")
-edges_df = load_csv(EDGES_FILE, "엣지 데이터")
+report = RunReport("06_calculate_centralities", profile=PROFILE_MODE).start()
+with report.stage("load"):
+    centrality_df = load_csv(CENTRALITY_RAW_FILE, "중심성 원본 데이터")
+    edges_df = load_csv(EDGES_FILE, "엣지 데이터")
 
 # 파일 로드 실패 시 종료
 if centrality_df is None or edges_df is None:
@@ -55,11 +62,12 @@ if "Name" not in centrality_df.columns:
     exit(1)
     
 # RawCentrality 값을 노드의 속성으로 추가
-for index, row in centrality_df.iterrows():
-    name = row["Name"]
-    raw_centrality = row["RawCentrality"]
-    if pd.notna(name):
-        G.add_node(name, raw_centrality=raw_centrality)
+with report.stage("graph_build"):
+    for index, row in centrality_df.iterrows():
+        name = row["Name"]
+        raw_centrality = row["RawCentrality"]
+        if pd.notna(name):
+            G.add_node(name, raw_centrality=raw_centrality)
 
 print(f"그래프에 {G.number_of_nodes()}개의 노드 추가 완료")
 
@@ -71,7 +79,8 @@ if "Source" not in edges_df.columns or "Target" not in edges_df.columns:
 edges = edges_df.dropna(subset=["Source", "Target"])
 
 # NetworkX의 from_pandas_edgelist 함수 사용
-nx.from_pandas_edgelist(edges, source='Source', target='Target', create_using=G)
+with report.stage("graph_build"):
+    nx.from_pandas_edgelist(edges, source='Source', target='Target', create_using=G)
 print(f"그래프에 {G.number_of_edges()}개의 엣지 추가 완료")
 
 print("네트워크 그래프 생성 완료.")
@@ -80,18 +89,21 @@ print("네트워크 그래프 생성 완료.")
 print("\n--- 중심성 지표 계산 중 ---")
 
 # In-Degree Centrality 계산 (다른 노드로부터 받은 연결 수)
-in_degree_centrality = nx.in_degree_centrality(G)
+with report.stage("in_degree"):
+    in_degree_centrality = nx.in_degree_centrality(G)
 print("In-Degree Centrality 계산 완료")
 
 # Out-Degree Centrality 계산 (다른 노드에게 보낸 연결 수)
-out_degree_centrality = nx.out_degree_centrality(G)
+with report.stage("out_degree"):
+    out_degree_centrality = nx.out_degree_centrality(G)
 print("Out-Degree Centrality 계산 완료")
 
 # Closeness Centrality 계산
 # 연결되지 않은 그래프의 경우 에러 발생 가능 -> subgraphs 확인 또는 연결 요소별 계산 필요
 # 여기서는 간단하게 처리하며, 필요시 예외 처리 또는 연결된 컴포넌트만 계산
 try:
-    closeness_centrality = nx.closeness_centrality(G)
+    with report.stage("closeness"):
+        closeness_centrality = nx.closeness_centrality(G)
     print("Closeness Centrality 계산 완료")
 except nx.NetworkXPointlessConcept:
     print("경고: 그래프가 연결되어 있지 않아 Closeness Centrality를 계산할 수 없습니다.")
@@ -103,14 +115,16 @@ except nx.NetworkXPointlessConcept:
 # 여기서는 모든 노드로 계산 (작은 규모의 그래프라고 가정)
 # 만약 느리면 k 값을 설정하여 근사 계산으로 변경할 수 있습니다.
 print("Betweenness Centrality 계산 중... (시간 소요될 수 있음)")
-betweenness_centrality = nx.betweenness_centrality(G, k=None, normalized=True, endpoints=False)
+with report.stage("betweenness"):
+    betweenness_centrality = nx.betweenness_centrality(G, k=None, normalized=True, endpoints=False)
 print("Betweenness Centrality 계산 완료")
 
 # Eigenvector Centrality 계산
 # 수렴하지 않을 경우 에러 발생 가능 -> max_iter 증가 또는 tol 조정 필요
 # 여기서는 기본 설정 사용
 try:
-    eigenvector_centrality = nx.eigenvector_centrality(G)
+    with report.stage("eigenvector"):
+        eigenvector_centrality = nx.eigenvector_centrality(G)
     print("Eigenvector Centrality 계산 완료")
 except nx.PowerIterationFailedConvergence:
     print("경고: Eigenvector Centrality 계산이 수렴하지 않았습니다. 결과를 신뢰할 수 없습니다.")
@@ -152,8 +166,12 @@ centrality_results['Calculated_In_Degree_Count'] = centrality_results['Name'].ma
 # 예: assert (centrality_results['RawCentrality'] == centrality_results['Calculated_In_Degree_Count']).all()
 
 # 결과 파일을 data/processed/ 폴더에 저장
-centrality_results.to_csv(OUTPUT_FILE, index=False, encoding='utf-8')
+with report.stage("save"):
+    centrality_results.to_csv(OUTPUT_FILE, index=False, encoding='utf-8')
 
 print(f"중심성 계산 결과 저장 완료: {OUTPUT_FILE} ({len(centrality_results)}개 항목)")
 
+json_path, text_path = report.finish()
+print(f"실행 보고서 저장 완료: {json_path}, {text_path}")
+
 print("스크립트 실행 완료.") 
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
 import os
-import re
+from name_index import build_default_index, extract_parenthesized
 
 # 파일 경로 설정
 CENTRALITIES_FILE = "data/processed/centralities.csv"
@@ -11,6 +11,11 @@ GEMINI_LIST_FILE = "data/processed/gemini_philosophers_list.csv"
 # 출력 파일 경로 (각 비교별)
 OUTPUT_DIR = "data/processed/" # 모든 비교 CSV가 저장될 디렉토리
 
+# 이 값보다 신뢰도가 낮은 이름 해석 결과는 확인 목록으로 출력
+LOW_CONFIDENCE_SCORE = 0.8
+
+_name_index = None
+
 def load_csv(filepath, file_description):
     """CSV 파일을 로드하고 기본 정보를 출력"""
     if not os.path.exists(filepath):
@@ -75,123 +80,45 @@ def get_ai_list_philosophers(df, n=50):
     ai_list_df['AI_List_Rank'] = range(1, len(ai_list_df) + 1)
     return ai_list_df[['Name', 'AI_List_Rank']]
 
+def get_name_index():
+    """
+    철학자 목록 전체(약 3.4천 명)에 대한 이름 해석 인덱스를 반환합니다.
+    처음 호출할 때 한 번만 생성하고 이후에는 재사용합니다.
+    """
+    global _name_index
+    if _name_index is None:
+        _name_index = build_default_index()
+    return _name_index
+
+
 def clean_ai_name(name):
     """
     AI 생성 목록의 철학자 이름을 정제합니다.
-    - 괄호 안의 영문 이름을 추출합니다.
-    - 약어나 다른 표기를 통일합니다.
+    - 괄호 안의 영문 이름, 이니셜, 성만 있는 표기, 발음 구별 기호 차이 등을 name_index로 해석합니다.
+    - 해석되지 않으면 괄호 안의 이름(없으면 원래 이름)을 반환합니다.
     """
     if not isinstance(name, str):
         return name
 
-    original_name = name
-    # 괄호 안의 이름 추출 (e.g., "소크라테스 (Socrates)" -> "Socrates")
-    match = re.search(r'\((.*?)\)', name)
-    if match:
-        name = match.group(1).strip()
-
-    # AI 리스트의 이름과 중심성 데이터의 이름을 매핑
-    name_map = {
-        # 이니셜 및 축약형
-        'T. Aquinas': 'Thomas Aquinas',
-        'J.-J. Rousseau': 'Jean-Jacques Rousseau',
-        'G. W. F. Hegel': 'Georg Wilhelm Friedrich Hegel',
-        'S. Kierkegaard': 'Søren Kierkegaard',
-        'F. Nietzsche': 'Friedrich Nietzsche',
-        'L. Wittgenstein': 'Ludwig Wittgenstein',
-        'S. de Beauvoir': 'Simone de Beauvoir',
-        'W. V. O. Quine': 'Willard Van Orman Quine',
-        'C. S. Peirce': 'Charles Sanders Peirce',
-        'G. Leibniz': 'Gottfried Leibniz',
-        'F. de Saussure': 'Ferdinand de Saussure',
-        'Descartes': 'René Descartes',
-        'Kant': 'Immanuel Kant',
-        'Hegel': 'Georg Wilhelm Friedrich Hegel',
-        'Marx': 'Karl Marx',
-        'Nietzsche': 'Friedrich Nietzsche',
-        'Heidegger': 'Martin Heidegger',
-        'Sartre': 'Jean-Paul Sartre',
-        'Locke': 'John Locke',
-        'Hume': 'David Hume',
-        'Russell': 'Bertrand Russell',
-        'Popper': 'Karl Popper',
-        'Kuhn': 'Thomas Kuhn',
-        'Aquinas': 'Thomas Aquinas',
-        'Arendt': 'Hannah Arendt',
-        'Peirce': 'Charles Sanders Peirce',
-        'Dewey': 'John Dewey',
-        'Rorty': 'Richard Rorty',
-        'Gadamer': 'Hans-Georg Gadamer',
-        'Foucault': 'Michel Foucault',
-        'Deleuze': 'Gilles Deleuze',
-        'Derrida': 'Jacques Derrida',
-        'Rawls': 'John Rawls',
-        
-        # 한국어 이름 매핑
-        '소크라테스': 'Socrates',
-        '플라톤': 'Plato',
-        '아리스토텔레스': 'Aristotle',
-        '공자': 'Confucius',
-        '노자': 'Laozi',
-        '헤겔': 'Georg Wilhelm Friedrich Hegel',
-        '마르크스': 'Karl Marx',
-        '니체': 'Friedrich Nietzsche',
-        '하이데거': 'Martin Heidegger',
-        '사르트르': 'Jean-Paul Sartre',
-        '데카르트': 'René Descartes',
-        '루소': 'Jean-Jacques Rousseau',
-        '홉스': 'Thomas Hobbes',
-        '존 로크': 'John Locke',
-        '버클리': 'George Berkeley',
-        '흄': 'David Hume',
-        '스피노자': 'Baruch Spinoza',
-        '라이프니츠': 'Gottfried Leibniz',
-        '푸코': 'Michel Foucault',
-        '들뢰즈': 'Gilles Deleuze',
-        '데리다': 'Jacques Derrida',
-        '비트겐슈타인': 'Ludwig Wittgenstein',
-        '러셀': 'Bertrand Russell',
-        '프레게': 'Gottlob Frege',
-        '밀': 'John Stuart Mill',
-        '벤담': 'Jeremy Bentham',
-        '키에르케고르': 'Søren Kierkegaard',
-        '쇼펜하우어': 'Arthur Schopenhauer',
-        '아퀴나스': 'Thomas Aquinas',
-        '아우구스티누스': 'Augustine of Hippo',
-        '이븐 시나': 'Avicenna',
-        '이븐 루시드': 'Averroes',
-        '모이세 마이모니데스': 'Moses Maimonides',
-        '알 키디': 'Al-Kindi',
-        '나가르주나': 'Nagarjuna',
-        '찬드라키르티': 'Candrakīrti',
-        '장자': 'Zhuangzi',
-        '한나 아렌트': 'Hannah Arendt',
-        '시몬 드 보부아르': 'Simone de Beauvoir',
-        '주디스 버틀러': 'Judith Butler',
-        '찰스 퍼스': 'Charles Sanders Peirce',
-        '윌리엄 제임스': 'William James',
-        '존 듀이': 'John Dewey',
-        '리차드 로티': 'Richard Rorty',
-        '가다머': 'Hans-Georg Gadamer',
-        '칼 포퍼': 'Karl Popper',
-        '토마스 쿤': 'Thomas Kuhn',
-        '아이리스 머독': 'Iris Murdoch',
-        '코넬 웨스트': 'Cornel West'
-    }
-    
-    # This part of the logic is improved to handle names with and without parentheses
-    base_name = original_name.split('(')[0].strip()
-    
-    # Check for a direct match in the map first (for full names or already clean names)
-    if original_name in name_map:
-        return name_map[original_name]
-    # Check for a match of the base name (e.g., "소크라테스" from "소크라테스 (Socrates)")
-    if base_name in name_map:
-        return name_map[base_name]
+    match = get_name_index().resolve(name)
+    if match.name is not None:
+        return match.name
+    return extract_parenthesized(name)
+
+def standardize_ai_names(df, list_name):
+    """
+    AI 목록의 'Name' 컬럼을 표준 이름으로 변환하고, 해석되지 않은 이름과 신뢰도가 낮은 이름을 보고합니다.
+    """
+    matches, unresolved = get_name_index().resolve_many(df['Name'].tolist())
+    df['Name'] = [m.name if m.name is not None else clean_ai_name(m.query) for m in matches]
 
-    # If no mapping is found, return the name extracted from parentheses if it exists,
-    # otherwise return the original name.
-    return name
+    low_confidence = [m for m in matches if m.name is not None and m.score < LOW_CONFIDENCE_SCORE]
+    print(f"{list_name}: {len(matches) - len(unresolved)}/{len(matches)}명 이름 해석 완료")
+    for m in low_confidence:
+        print(f"  - 확인 필요 (신뢰도 {m.score:.2f}, {m.method}): {m.query} -> {m.name}")
+    for query in unresolved:
+        print(f"  - 해석 실패: {query}")
+    return df
 
 def perform_and_save_comparison(df1_top_n, df2_top_n, df1_name, df2_name, output_filename):
     """
@@ -242,9 +169,9 @@ if __name__ == "__main__":
 
     # AI 리스트 이름 정제
     if chatgpt_list_df is not None:
-        chatgpt_list_df['Name'] = chatgpt_list_df['Name'].apply(clean_ai_name)
+        chatgpt_list_df = standardize_ai_names(chatgpt_list_df, "ChatGPT 목록")
     if gemini_list_df is not None:
-        gemini_list_df['Name'] = gemini_list_df['Name'].apply(clean_ai_name)
+        gemini_list_df = standardize_ai_names(gemini_list_df, "Gemini 목록")
 
     # 필요한 DataFrame이 모두 로드되었는지 확인
     if any(df is None for df in [centralities_df, adjusted_centralities_df, chatgpt_list_df, gemini_list_df]):
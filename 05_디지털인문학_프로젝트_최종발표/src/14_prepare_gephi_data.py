@@ -1,54 +1,157 @@
 import pandas as pd
+import numpy as np
 import os
+import re
 
-def prepare_gephi_files():
+from graph_export import CHUNK_SIZE, write_gexf, write_graphml
+from graph_layout import compute_layout, render_png
+from subgraph import CsrGraph, align_table, edge_frame, select_nodes
+
+# 파일 경로 설정 (프로젝트 루트에서 실행)
+DATA_DIR = "data/processed"
+ADJUSTED_CENTRALITIES_FILE = "data/processed/adjusted_centralities.csv"
+CENTRALITY_RAW_FILE = "data/processed/centrality_raw.csv"
+TOP_50_FILE = "data/processed/top_50_in-degree-centralities_standard.csv"
+EDGES_FILE = "data/processed/mention_edges.csv"
+PHILOSOPHERS_FILE = "data/raw/philosophers_by_century.csv"
+GEPHI_DIR = "data/gephi"
+VIEWS_DIR = "data/gephi/views"
+LAYOUT_FILE = "data/gephi/philosopher_network_layout.csv"  # 전체 네트워크 좌표 (다음 실행의 시작 좌표)
+IMAGES_DIR = "images/networks"
+
+# 레이아웃: 이전 실행의 좌표(LAYOUT_FILE, 뷰 노드 CSV의 x, y)가 있으면 그 위치에서 이어서 계산
+LAYOUT_WARM_START = True
+PNG_SIZE_COLUMN = 'In-Degree Centrality'  # PNG 노드 크기 기준 열
+
+# 한 번에 만들 부분 그래프 뷰: 이름 -> select_nodes 조건 (names, top, ego, century, direction)
+# 뷰마다 VIEWS_DIR/<이름>_nodes.csv(x, y 좌표 포함), <이름>_edges.csv, <이름>.gexf와 IMAGES_DIR/<이름>.png를 저장
+VIEWS = {
+    'top50_standard': {'top': ('In-Degree Centrality', 50)},
+    'top50_adjusted': {'top': ('Adjusted_In_Degree_Centrality', 50)},
+    'top50_pagerank': {'top': ('PageRank', 50)},
+    'kant_ego_1hop': {'ego': (['Immanuel Kant'], 1)},
+    'top30_20th_century': {'century': ['20th'], 'top': ('In-Degree Centrality', 30)},
+}
+
+# 활동 연도 열 후보 (08은 Year, 예전 출력은 ActivityYear/Activity Year, 먼저 있는 열 사용)
+# temp_fix_08.py의 Activity Year는 세기 숫자(18 = 18세기)이므로 값이 모두 MAX_CENTURY 이하이면 세기 시작 연도로 바꿈
+YEAR_COLUMNS = ['Year', 'ActivityYear', 'Activity Year']
+MAX_CENTURY = 21
+BC_START_YEAR = -600  # 'BC' 세기의 시간 구간 시작 연도 (기원전은 음수)
+
+DESCRIPTION = "철학자 언급 네트워크 (노드 시간 구간: 활동 연도 또는 세기 시작 연도부터)"
+
+def century_start(label):
+    """세기 이름의 시작 연도 ('18th' -> 1700, '11th??4th' -> 1000, 'BC' -> BC_START_YEAR, 알 수 없으면 None)"""
+    if str(label).strip() == 'BC':
+        return BC_START_YEAR
+    match = re.search(r'(\d+)(?:st|nd|rd|th)', str(label))
+    return (int(match.group(1)) - 1) * 100 if match else None
+
+def read_csv_any_encoding(filepath):
+    """05, 06 스크립트와 같은 순서로 인코딩을 바꿔 가며 CSV를 로드"""
+    for encoding in ['utf-8', 'cp1252', 'latin1']:
+        try:
+            return pd.read_csv(filepath, encoding=encoding)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"지원되는 인코딩으로 파일을 읽을 수 없습니다: {filepath}")
+
+def load_node_table():
     """
-    Gephi 시각화를 위해 상위 50명 철학자 기준으로 노드와 엣지 파일을 생성합니다.
+    전체 철학자 노드 표: 모든 중심성 열(표준, 시간 보정), 세기, 시간 구간 시작 연도(Year)
+    Year는 활동 연도(YEAR_COLUMNS 중 먼저 있는 열)를 쓰고, 값이나 열이 없으면 세기의 시작 연도를 씁니다.
     """
-    # 경로 설정 (스크립트의 위치를 기준으로)
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(base_dir, 'data', 'processed')
+    nodes = pd.read_csv(ADJUSTED_CENTRALITIES_FILE, encoding='utf-8')
+    nodes = nodes.dropna(subset=['Name']).drop_duplicates(subset=['Name']).dropna(axis=1, how='all')
+    centuries = read_csv_any_encoding(PHILOSOPHERS_FILE).drop_duplicates(subset=['Name'])
+    nodes['Century'] = nodes['Name'].map(centuries.set_index('Name')['Century'])
 
+    year_col = next((c for c in YEAR_COLUMNS if c in nodes.columns), None)
+    year = pd.to_numeric(nodes[year_col], errors='coerce') if year_col else pd.Series(np.nan, index=nodes.index)
+    if year.abs().max() <= MAX_CENTURY:
+        year = (year - 1) * 100
+    year = year.round()
+    nodes['Year'] = year.fillna(nodes['Century'].map(century_start))
+    nodes.insert(1, 'Label', nodes['Name'])
+    return nodes.rename(columns={'Name': 'Id'})
+
+def load_graph():
+    """
+    언급 엣지로 정수 ID CSR 그래프를 만들고, 그래프 순서에 맞춘 노드 표에 PageRank 열을 추가합니다.
+
+    Returns:
+        tuple: (CsrGraph, 노드 표)
+    """
+    nodes = load_node_table()
+    graph = CsrGraph.from_edge_frame(pd.read_csv(EDGES_FILE, encoding='utf-8'), names=nodes['Id'])
+    table = align_table(graph, nodes)
+    table['Label'] = table['Label'].fillna(table['Id'])
+    table['PageRank'] = graph.pagerank()
+    print(f"그래프 로드 완료: {graph.n_nodes}개 노드, {graph.n_edges}개 엣지")
+    return graph, table
+
+def edges_with_years(graph, edges, years):
+    """엣지 표에 시작 연도(두 철학자 중 나중에 활동한 쪽의 연도, 정수 ID로 연도 배열에서 바로 찾음)를 붙입니다."""
+    return edge_frame(graph, edges).assign(Year=np.fmax(years[graph.sources[edges]], years[graph.targets[edges]]))
+
+def edge_chunks(graph, edges, years):
+    """엣지 위치 배열을 CHUNK_SIZE개씩 엣지 표 조각으로 만듭니다."""
+    for start in range(0, len(edges), CHUNK_SIZE):
+        yield edges_with_years(graph, edges[start:start + CHUNK_SIZE], years)
+
+def add_layout(graph, table, previous_file=None):
+    """
+    그래프 좌표를 계산하여 노드 표에 x, y 열을 붙입니다.
+    LAYOUT_WARM_START이면 previous_file(Id, x, y 열이 있는 CSV)의 이전 좌표에서 이어서 계산합니다.
+    """
+    previous = None
+    if LAYOUT_WARM_START and previous_file and os.path.exists(previous_file):
+        previous = pd.read_csv(previous_file, encoding='utf-8')
+    table = table.reset_index(drop=True).drop(columns=['x', 'y'], errors='ignore')
+    return pd.concat([table, compute_layout(graph, previous)], axis=1)
+
+def render_network(graph, table, name):
+    """노드 표의 x, y 좌표로 PNG를 저장합니다 (크기: PNG_SIZE_COLUMN, 이름: Label)."""
+    path = render_png(os.path.join(IMAGES_DIR, f"{name}.png"), graph, table[['x', 'y']].to_numpy(),
+                      sizes=table.get(PNG_SIZE_COLUMN), labels=table['Label'].to_numpy(), title=name)
+    if path:
+        print(f"성공: 네트워크 이미지 저장 -> {path}")
+
+def prepare_gephi_files(graph):
+    """
+    Gephi 시각화를 위해 상위 50명 철학자 기준으로 노드와 엣지 파일을 생성합니다.
+    (기존 nodes_gephi.csv / edges_gephi.csv 형식, 엣지는 CSR 그래프의 유도 부분 그래프)
+    """
     try:
         # 1. Top 50 철학자 목록 추출
-        top_50_df = pd.read_csv(os.path.join(data_dir, 'top_50_in-degree-centralities_standard.csv'))
-        top_50_names = set(top_50_df['Name'].unique())
+        top_50_df = pd.read_csv(TOP_50_FILE)
+        top_50_names = list(top_50_df['Name'].unique())
         print(f"추출된 Top 50 철학자 수: {len(top_50_names)}명")
 
         # 2. 노드 파일 생성 (nodes_gephi.csv)
-        all_nodes_df = pd.read_csv(os.path.join(data_dir, 'centrality_raw.csv'))
-        
+        all_nodes_df = pd.read_csv(CENTRALITY_RAW_FILE)
+
         # Top 50에 해당하는 노드만 필터링
         gephi_nodes_df = all_nodes_df[all_nodes_df['Name'].isin(top_50_names)].copy()
-        
+
         # Gephi 형식에 맞게 컬럼명 변경 및 추가
         gephi_nodes_df.rename(columns={'Name': 'Id', 'RawCentrality': 'Weight'}, inplace=True)
         gephi_nodes_df['Label'] = gephi_nodes_df['Id']
-        
+
         # 필요한 컬럼만 선택하여 순서 지정
         gephi_nodes_df = gephi_nodes_df[['Id', 'Label', 'Weight']]
 
-        nodes_output_path = os.path.join(data_dir, 'nodes_gephi.csv')
+        nodes_output_path = os.path.join(DATA_DIR, 'nodes_gephi.csv')
         gephi_nodes_df.to_csv(nodes_output_path, index=False, encoding='utf-8')
         print(f"성공: Gephi 노드 파일 생성 완료 -> {nodes_output_path} ({len(gephi_nodes_df)}개 노드)")
 
 
         # 3. 엣지 파일 생성 (edges_gephi.csv)
-        all_edges_df = pd.read_csv(os.path.join(data_dir, 'mention_edges.csv'))
-
-        # Source와 Target이 모두 Top 50 목록에 있는 엣지만 필터링
-        gephi_edges_df = all_edges_df[
-            all_edges_df['Source'].isin(top_50_names) & 
-            all_edges_df['Target'].isin(top_50_names)
-        ].copy()
+        # Source와 Target이 모두 Top 50 목록에 있는 엣지: 선택한 노드의 나가는 엣지만 확인 (원래 엣지 순서)
+        gephi_edges_df = edge_frame(graph, graph.induced_edges(graph.ids(top_50_names)))
 
-        # Weight가 없는 경우 1로 채우기 (기본값)
-        if 'Weight' not in gephi_edges_df.columns:
-            gephi_edges_df['Weight'] = 1
-        else:
-            gephi_edges_df['Weight'].fillna(1, inplace=True)
-
-        edges_output_path = os.path.join(data_dir, 'edges_gephi.csv')
+        edges_output_path = os.path.join(DATA_DIR, 'edges_gephi.csv')
         gephi_edges_df.to_csv(edges_output_path, index=False, encoding='utf-8')
         print(f"성공: Gephi 엣지 파일 생성 완료 -> {edges_output_path} ({len(gephi_edges_df)}개 엣지)")
 
@@ -57,5 +160,57 @@ def prepare_gephi_files():
     except Exception as e:
         print(f"오류: 데이터 처리 중 예외 발생 - {e}")
 
+def export_graph_files(graph, table):
+    """
+    전체 네트워크와 상위 50명 네트워크를 GEXF(시간 구간, 레이아웃 좌표 포함)/GraphML 파일로 저장합니다.
+    엣지는 CHUNK_SIZE개씩 표로 만들어 바로 쓰므로 전체 엣지 표를 한 번에 만들지 않습니다.
+    """
+    os.makedirs(GEPHI_DIR, exist_ok=True)
+    years = table['Year'].to_numpy(dtype=float)
+    all_edges = np.arange(graph.n_edges)
+    table = add_layout(graph, table, LAYOUT_FILE)
+    table[['Id', 'x', 'y']].to_csv(LAYOUT_FILE, index=False, encoding='utf-8')
+    writer = write_gexf(os.path.join(GEPHI_DIR, 'philosopher_network.gexf'), table,
+                        edge_chunks(graph, all_edges, years), start_column='Year', edge_start_column='Year',
+                        position_columns=('x', 'y'), description=DESCRIPTION)
+    write_graphml(os.path.join(GEPHI_DIR, 'philosopher_network.graphml'), table,
+                  edge_chunks(graph, all_edges, years), description=DESCRIPTION)
+    print(f"성공: 전체 네트워크 GEXF/GraphML 생성 완료 -> {GEPHI_DIR} "
+          f"({graph.n_nodes}개 노드, {writer.written_edges}개 엣지)")
+    render_network(graph, table, 'philosopher_network')
+    
+    top_ids = np.sort(graph.ids(pd.read_csv(TOP_50_FILE)['Name'].unique()))
+    top_graph, top_edges = graph.subgraph(top_ids)
+    top_table = add_layout(top_graph, table.iloc[top_ids])
+    writer = write_gexf(os.path.join(GEPHI_DIR, 'top50_network.gexf'), top_table,
+                        edges_with_years(graph, top_edges, years), start_column='Year', edge_start_column='Year',
+                        position_columns=('x', 'y'), description=DESCRIPTION)
+    print(f"성공: 상위 50명 네트워크 GEXF 생성 완료 ({len(top_ids)}개 노드, {writer.written_edges}개 엣지)")
+
+def export_views(graph, table, views=VIEWS):
+    """
+    뷰마다 부분 그래프를 추출하여 CSV(노드, 엣지), GEXF, PNG로 저장합니다.
+    그래프와 노드 표는 한 번만 로드하고, 각 뷰의 엣지는 선택한 노드의 CSR 구간에서만 찾습니다.
+    레이아웃은 지난번 뷰 노드 CSV의 좌표에서 이어서 계산합니다.
+    """
+    os.makedirs(VIEWS_DIR, exist_ok=True)
+    years = table['Year'].to_numpy(dtype=float)
+    for name, spec in views.items():
+        nodes = select_nodes(graph, table, **spec)
+        view_graph, edges = graph.subgraph(nodes)
+        prefix = os.path.join(VIEWS_DIR, name)
+        view_nodes = add_layout(view_graph, table.iloc[nodes], f"{prefix}_nodes.csv")
+        view_edges = edges_with_years(graph, edges, years)
+
+        view_nodes.to_csv(f"{prefix}_nodes.csv", index=False, encoding='utf-8')
+        view_edges.to_csv(f"{prefix}_edges.csv", index=False, encoding='utf-8')
+        write_gexf(f"{prefix}.gexf", view_nodes, view_edges, start_column='Year', edge_start_column='Year',
+                   position_columns=('x', 'y'), description=f"{DESCRIPTION} - {name}")
+        print(f"성공: 뷰 '{name}' 생성 완료 ({len(view_nodes)}개 노드, {len(view_edges)}개 엣지)")
+        render_network(view_graph, view_nodes, name)
+
 if __name__ == '__main__':
-    prepare_gephi_files() 
\ No newline at end of file
+    graph, table = load_graph()
+    prepare_gephi_files(graph)
+    export_graph_files(graph, table)
+    export_views(graph, table)
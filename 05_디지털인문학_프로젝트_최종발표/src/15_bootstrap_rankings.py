@@ -0,0 +1,349 @@
+import pandas as pd
+import numpy as np
+import os
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+
+# 파일 경로 설정
+EDGES_FILE = "data/processed/mention_edges.csv"
+ADJUSTED_CENTRALITIES_FILE = "data/processed/adjusted_centralities.csv"
+CHATGPT_LIST_FILE = "data/processed/chatgpt_philosophers_list.csv"
+GEMINI_LIST_FILE = "data/processed/gemini_philosophers_list.csv"
+
+# 출력 파일 경로
+RANK_INTERVALS_FILE = "data/processed/bootstrap_rank_intervals.csv"
+OVERLAP_DISTRIBUTION_FILE = "data/processed/bootstrap_overlap_distribution.csv"
+OVERLAP_SUMMARY_FILE = "data/processed/bootstrap_overlap_summary.csv"
+PERMUTATION_FILE = "data/processed/ranking_permutation_tests.csv"
+
+# 리샘플링 설정
+N_REPLICATES = 10000      # 부트스트랩 반복 횟수
+N_PERMUTATIONS = 10000    # 순열 검정 반복 횟수
+SHARD_SIZE = 250          # 프로세스 하나가 한 번에 처리하는 반복 수
+BATCH_SIZE = 50           # 한 번에 벡터화하여 계산하는 반복 수 (메모리 사용량 조절)
+N_WORKERS = os.cpu_count() or 1
+RANDOM_SEED = 42
+TOP_N = 50
+TRACK_TOP_N = 100         # 순위 분포를 기록할 철학자 범위 (기준 순위 상위 N명)
+CI_LEVEL = 0.95
+CURRENT_YEAR = 2024       # 08_calculate_adjusted_centrality.py와 동일한 기준 연도
+# 시간 보정 가중치에 쓰는 연도 열 (먼저 있는 열 사용)
+# 08_calculate_adjusted_centrality.py는 'Year'(활동 연도), temp_fix_08.py는 'Activity Year'(세기 숫자)를 씀
+# 부트스트랩 기준 순위가 파일의 Adjusted_In_Degree_Centrality와 같아지도록 값을 변환하지 않고 그대로 사용
+YEAR_COLUMNS = ['Year', 'Activity Year', 'ActivityYear']
+
+# 워커 프로세스에서 공유하는 데이터 (initializer에서 한 번만 설정)
+_shared = {}
+
+
+def load_edges_and_weights():
+    """
+    엣지와 노드별 시간 보정 가중치를 정수 인덱스 배열로 로드합니다.
+    노드 순서는 adjusted_centralities.csv(= 그래프 노드 목록)를 따릅니다.
+    """
+    edges_df = pd.read_csv(EDGES_FILE, encoding='utf-8').dropna(subset=['Source', 'Target'])
+    nodes_df = pd.read_csv(ADJUSTED_CENTRALITIES_FILE, encoding='utf-8')
+    nodes_df = nodes_df.dropna(subset=['Name']).drop_duplicates(subset=['Name'])
+
+    names = nodes_df['Name'].to_numpy()
+    name_to_idx = pd.Index(names)
+    targets = name_to_idx.get_indexer(edges_df['Target'])
+    if (targets < 0).any():
+        print(f"경고: 노드 목록에 없는 Target {(targets < 0).sum()}개는 제외합니다.")
+        targets = targets[targets >= 0]
+
+    # 08_calculate_adjusted_centrality.py와 같은 보정식: 1 / log2(1 + (기준 연도 - 활동 연도))
+    year_col = next((c for c in YEAR_COLUMNS if c in nodes_df.columns), None)
+    if year_col is None:
+        raise ValueError(f"{ADJUSTED_CENTRALITIES_FILE}에 연도 열({', '.join(YEAR_COLUMNS)})이 없습니다. "
+                         "08_calculate_adjusted_centrality.py를 먼저 실행하세요.")
+    print(f"시간 보정 가중치 연도 열: '{year_col}'")
+    years = pd.to_numeric(nodes_df[year_col], errors='coerce').to_numpy(dtype=float)
+    time_diff = CURRENT_YEAR - years
+    with np.errstate(invalid='ignore', divide='ignore'):
+        weights = np.where(time_diff > 0, 1.0 / np.log2(1 + time_diff), np.nan)
+
+    return names, targets, weights
+
+
+def load_ai_list(filepath, clean_ai_name):
+    """AI 철학자 목록을 로드하고 이름을 정제하여 순서대로 반환합니다."""
+    if not os.path.exists(filepath):
+        print(f"경고: AI 목록 파일이 없습니다: {filepath}")
+        return []
+    df = pd.read_csv(filepath, encoding='utf-8')
+    if '이름' in df.columns:
+        df.rename(columns={'이름': 'Name'}, inplace=True)
+    return [clean_ai_name(name) for name in df['Name'].head(TOP_N)]
+
+
+def rank_matrix(scores):
+    """
+    (반복 수, 노드 수) 점수 행렬의 각 행에 대해 내림차순 순위(1부터)와 정렬 순서를 반환합니다.
+    동점은 노드 인덱스 순서로 처리하며, NaN 점수는 항상 최하위가 됩니다.
+    """
+    keyed = np.where(np.isnan(scores), -np.inf, scores)
+    order = np.argsort(-keyed, axis=1, kind='stable')
+    ranks = np.empty_like(order)
+    rows = np.arange(scores.shape[0])[:, None]
+    ranks[rows, order] = np.arange(1, scores.shape[1] + 1)
+    return ranks, order
+
+
+def top_n_mask(order, n_nodes):
+    """정렬 순서에서 상위 TOP_N 소속 여부를 (반복 수, 노드 수) 불리언 행렬로 만듭니다."""
+    mask = np.zeros((order.shape[0], n_nodes), dtype=bool)
+    rows = np.arange(order.shape[0])[:, None]
+    mask[rows, order[:, :TOP_N]] = True
+    return mask
+
+
+def _init_worker(shared):
+    """워커 프로세스 초기화: 공유 배열을 전역 변수에 보관합니다."""
+    _shared.update(shared)
+
+
+def _run_shard(args):
+    """
+    하나의 샤드(여러 부트스트랩 반복)를 계산합니다.
+
+    엣지를 복원 추출하는 것은 각 노드의 피언급 횟수를 다항분포
+    Multinomial(엣지 수, 노드별 피언급 비율)에서 뽑는 것과 같으므로,
+    엣지 목록 대신 다항분포 표본으로 In-Degree를 한 번에 재계산합니다.
+    """
+    seed_seq, n_reps = args
+    rng = np.random.default_rng(seed_seq)
+    probs = _shared['probs']
+    weights = _shared['weights']
+    tracked = _shared['tracked']
+    n_edges = _shared['n_edges']
+    n_nodes = len(probs)
+    norm = max(n_nodes - 1, 1)
+
+    std_ranks, adj_ranks, overlaps = [], [], []
+    for start in range(0, n_reps, BATCH_SIZE):
+        batch = min(BATCH_SIZE, n_reps - start)
+        in_degree = rng.multinomial(n_edges, probs, size=batch).astype(float) / norm
+
+        std_rank, std_order = rank_matrix(in_degree)
+        adj_rank, adj_order = rank_matrix(in_degree * weights)
+        std_top = top_n_mask(std_order, n_nodes)
+        adj_top = top_n_mask(adj_order, n_nodes)
+
+        std_ranks.append(std_rank[:, tracked].astype(np.int32))
+        adj_ranks.append(adj_rank[:, tracked].astype(np.int32))
+
+        metrics = {
+            'Standard_vs_Adjusted_Overlap': (std_top & adj_top).sum(axis=1),
+            'Standard_Baseline_Jaccard': jaccard(std_top, _shared['base_std_top']),
+            'Adjusted_Baseline_Jaccard': jaccard(adj_top, _shared['base_adj_top']),
+        }
+        for ref_name, ref_mask in _shared['references'].items():
+            metrics[f'Standard_vs_{ref_name}_Overlap'] = std_top[:, ref_mask].sum(axis=1)
+            metrics[f'Adjusted_vs_{ref_name}_Overlap'] = adj_top[:, ref_mask].sum(axis=1)
+        overlaps.append(pd.DataFrame(metrics))
+
+    return np.vstack(std_ranks), np.vstack(adj_ranks), pd.concat(overlaps, ignore_index=True)
+
+
+def jaccard(mask, base_mask):
+    """각 반복의 상위 집합과 기준 상위 집합 간 Jaccard 유사도"""
+    inter = (mask & base_mask).sum(axis=1)
+    union = (mask | base_mask).sum(axis=1)
+    return inter / np.maximum(union, 1)
+
+
+def run_bootstrap(shared, n_replicates=N_REPLICATES, n_workers=N_WORKERS, seed=RANDOM_SEED):
+    """부트스트랩 반복을 샤드로 나누어 프로세스 풀에서 병렬 실행합니다."""
+    shard_sizes = [SHARD_SIZE] * (n_replicates // SHARD_SIZE)
+    if n_replicates % SHARD_SIZE:
+        shard_sizes.append(n_replicates % SHARD_SIZE)
+    # 샤드마다 독립적인 시드를 부여하여 워커 수와 관계없이 재현 가능하게 함
+    seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+    tasks = list(zip(seeds, shard_sizes))
+
+    if n_workers <= 1:
+        _init_worker(shared)
+        results = [_run_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(shared,)) as executor:
+            results = list(executor.map(_run_shard, tasks))
+
+    std_ranks = np.vstack([r[0] for r in results])
+    adj_ranks = np.vstack([r[1] for r in results])
+    overlaps = pd.concat([r[2] for r in results], ignore_index=True)
+    return std_ranks, adj_ranks, overlaps
+
+
+def summarize_ranks(names, weights, tracked, base_std_rank, base_adj_rank, std_ranks, adj_ranks):
+    """추적 대상 철학자별 순위 신뢰구간, 상위 N 포함 확률, 순위 차이 검정 결과를 정리합니다."""
+    alpha = (1 - CI_LEVEL) / 2
+    q = [alpha * 100, 50, (1 - alpha) * 100]
+    std_q = np.percentile(std_ranks, q, axis=0)
+    adj_q = np.percentile(adj_ranks, q, axis=0)
+
+    # 순위 차이 (양수 = 시간 보정 후 순위 상승)
+    diff = std_ranks - adj_ranks
+    diff_q = np.percentile(diff, [q[0], q[2]], axis=0)
+    # 부트스트랩 양측 p-value: 순위 차이의 부호가 뒤집히는 비율
+    p_value = np.minimum(1.0, 2 * np.minimum((diff <= 0).mean(axis=0), (diff >= 0).mean(axis=0)))
+
+    result = pd.DataFrame({
+        'Name': names[tracked],
+        'Standard_Rank': base_std_rank[tracked],
+        'Standard_Rank_Median': std_q[1],
+        'Standard_Rank_CI_Low': std_q[0],
+        'Standard_Rank_CI_High': std_q[2],
+        'Standard_Top50_Prob': (std_ranks <= TOP_N).mean(axis=0),
+        'Adjusted_Rank': base_adj_rank[tracked],
+        'Adjusted_Rank_Median': adj_q[1],
+        'Adjusted_Rank_CI_Low': adj_q[0],
+        'Adjusted_Rank_CI_High': adj_q[2],
+        'Adjusted_Top50_Prob': (adj_ranks <= TOP_N).mean(axis=0),
+        'Rank_Diff': base_std_rank[tracked] - base_adj_rank[tracked],
+        'Rank_Diff_CI_Low': diff_q[0],
+        'Rank_Diff_CI_High': diff_q[1],
+        'Rank_Diff_P_Value': p_value,
+    })
+    # 활동 연도가 없어 시간 보정 점수가 없는 철학자는 보정 순위 관련 값을 비워 둠
+    no_weight = np.isnan(weights[tracked])
+    adjusted_cols = [col for col in result.columns if col.startswith(('Adjusted_', 'Rank_Diff'))]
+    result[adjusted_cols] = result[adjusted_cols].astype(float)
+    result.loc[no_weight, adjusted_cols] = np.nan
+    return result.sort_values(by='Standard_Rank').reset_index(drop=True)
+
+
+def summarize_overlaps(overlaps, baseline):
+    """겹침 지표별 기준값, 평균, 신뢰구간을 정리합니다."""
+    alpha = (1 - CI_LEVEL) / 2
+    rows = []
+    for column in overlaps.columns:
+        values = overlaps[column].to_numpy(dtype=float)
+        rows.append({
+            'Metric': column,
+            'Baseline': baseline.get(column),
+            'Mean': values.mean(),
+            'Std': values.std(ddof=1) if len(values) > 1 else 0.0,
+            'CI_Low': np.quantile(values, alpha),
+            'CI_High': np.quantile(values, 1 - alpha),
+        })
+    return pd.DataFrame(rows)
+
+
+def spearman_permutation_test(data_ranks, ai_ranks, n_permutations=N_PERMUTATIONS, seed=RANDOM_SEED):
+    """
+    공통 철학자에 대해 데이터 순위와 AI 순위의 스피어만 상관을 계산하고,
+    AI 순위를 무작위로 섞는 순열 검정으로 단측 p-value를 구합니다.
+    """
+    n = len(data_ranks)
+    if n < 3:
+        return np.nan, np.nan
+    x = pd.Series(data_ranks).rank().to_numpy()
+    y = pd.Series(ai_ranks).rank().to_numpy()
+    x = (x - x.mean()) / x.std()
+    y = (y - y.mean()) / y.std()
+    observed = float((x * y).mean())
+
+    rng = np.random.default_rng(seed)
+    # 순열 행렬을 한 번에 만들어 벡터화 (n은 최대 TOP_N이므로 메모리 부담이 작음)
+    perms = rng.permuted(np.tile(y, (n_permutations, 1)), axis=1)
+    null = (perms * x).mean(axis=1)
+    p_value = (np.sum(null >= observed) + 1) / (n_permutations + 1)
+    return observed, p_value
+
+
+if __name__ == "__main__":
+    # 1. 데이터 로드
+    print("--- 엣지 및 노드 데이터 로드 중 ---")
+    names, targets, weights = load_edges_and_weights()
+    n_nodes = len(names)
+    n_edges = len(targets)
+    print(f"노드 {n_nodes}개, 엣지 {n_edges}개 로드 완료")
+
+    # AI 목록의 이름 정제는 10_compare_centrality_rankings.py의 규칙을 그대로 사용
+    compare_module = importlib.import_module("10_compare_centrality_rankings")
+    ai_lists = {
+        'ChatGPT': load_ai_list(CHATGPT_LIST_FILE, compare_module.clean_ai_name),
+        'Gemini': load_ai_list(GEMINI_LIST_FILE, compare_module.clean_ai_name),
+    }
+    name_to_idx = pd.Index(names)
+    references = {}
+    for ref_name, ref_names in ai_lists.items():
+        mask = np.zeros(n_nodes, dtype=bool)
+        idx = name_to_idx.get_indexer(ref_names)
+        mask[idx[idx >= 0]] = True
+        references[ref_name] = mask
+        print(f"{ref_name} 목록: {len(ref_names)}명 중 {mask.sum()}명이 네트워크 노드와 일치")
+
+    # 2. 기준(원본) 순위 계산
+    base_counts = np.bincount(targets, minlength=n_nodes).astype(float)
+    base_in_degree = base_counts / max(n_nodes - 1, 1)
+    base_std_rank, base_std_order = rank_matrix(base_in_degree[None, :])
+    base_adj_rank, base_adj_order = rank_matrix((base_in_degree * weights)[None, :])
+    base_std_top = top_n_mask(base_std_order, n_nodes)
+    base_adj_top = top_n_mask(base_adj_order, n_nodes)
+
+    baseline = {
+        'Standard_vs_Adjusted_Overlap': int((base_std_top & base_adj_top).sum()),
+        'Standard_Baseline_Jaccard': 1.0,
+        'Adjusted_Baseline_Jaccard': 1.0,
+    }
+    for ref_name, ref_mask in references.items():
+        baseline[f'Standard_vs_{ref_name}_Overlap'] = int(base_std_top[0, ref_mask].sum())
+        baseline[f'Adjusted_vs_{ref_name}_Overlap'] = int(base_adj_top[0, ref_mask].sum())
+
+    # 순위 분포를 기록할 대상: 두 기준 순위의 상위 TRACK_TOP_N명 + AI 목록 철학자
+    tracked_mask = (base_std_rank[0] <= TRACK_TOP_N) | (base_adj_rank[0] <= TRACK_TOP_N)
+    for ref_mask in references.values():
+        tracked_mask |= ref_mask
+    tracked = np.flatnonzero(tracked_mask)
+
+    # 3. 부트스트랩 실행
+    print(f"\n--- 부트스트랩 {N_REPLICATES}회 실행 중 (워커 {N_WORKERS}개) ---")
+    shared = {
+        'probs': base_counts / n_edges,
+        'weights': weights,
+        'tracked': tracked,
+        'n_edges': n_edges,
+        'base_std_top': base_std_top,
+        'base_adj_top': base_adj_top,
+        'references': references,
+    }
+    std_ranks, adj_ranks, overlaps = run_bootstrap(shared)
+    print("부트스트랩 완료.")
+
+    # 4. 결과 정리 및 저장
+    rank_intervals = summarize_ranks(names, weights, tracked, base_std_rank[0], base_adj_rank[0], std_ranks, adj_ranks)
+    rank_intervals.to_csv(RANK_INTERVALS_FILE, index=False, encoding='utf-8')
+    print(f"철학자별 순위 신뢰구간 저장 완료: {RANK_INTERVALS_FILE} ({len(rank_intervals)}명)")
+
+    overlaps.to_csv(OVERLAP_DISTRIBUTION_FILE, index=False, encoding='utf-8')
+    overlap_summary = summarize_overlaps(overlaps, baseline)
+    overlap_summary.to_csv(OVERLAP_SUMMARY_FILE, index=False, encoding='utf-8')
+    print(f"겹침 지표 분포 저장 완료: {OVERLAP_DISTRIBUTION_FILE}, {OVERLAP_SUMMARY_FILE}")
+    print(overlap_summary.to_string(index=False))
+
+    # 5. 순열 검정: 데이터 기반 순위와 AI 순위의 상관
+    print("\n--- 순열 검정 (스피어만 상관) ---")
+    permutation_rows = []
+    data_rankings = {'Standard': base_std_rank[0], 'Adjusted': base_adj_rank[0]}
+    for data_name, data_rank in data_rankings.items():
+        for ref_name, ref_names in ai_lists.items():
+            idx = name_to_idx.get_indexer(ref_names)
+            ai_rank = np.arange(1, len(ref_names) + 1)
+            # 데이터 상위 N과 AI 목록에 모두 포함된 철학자만 비교
+            common = (idx >= 0) & (data_rank[np.maximum(idx, 0)] <= TOP_N)
+            rho, p_value = spearman_permutation_test(data_rank[idx[common]], ai_rank[common])
+            permutation_rows.append({
+                'Data_Ranking': data_name,
+                'AI_List': ref_name,
+                'Common_Count': int(common.sum()),
+                'Spearman_Rho': rho,
+                'Permutation_P_Value': p_value,
+            })
+    permutation_df = pd.DataFrame(permutation_rows)
+    permutation_df.to_csv(PERMUTATION_FILE, index=False, encoding='utf-8')
+    print(permutation_df.to_string(index=False))
+    print(f"순열 검정 결과 저장 완료: {PERMUTATION_FILE}")
+
+    print("스크립트 실행 완료.")
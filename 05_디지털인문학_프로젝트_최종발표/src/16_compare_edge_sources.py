@@ -0,0 +1,91 @@
+import pandas as pd
+import os
+
+# 파일 경로 설정
+# 02_search_name_from_wiki.py를 EDGE_MODE = "both"로 실행하면 두 엣지 파일이 함께 생성됩니다.
+MENTION_EDGES_FILE = "data/processed/mention_edges.csv"  # 본문 이름 검색 엣지
+LINK_EDGES_FILE = "data/processed/link_edges.csv"        # 본문 하이퍼링크 엣지
+COMPARISON_FILE = "data/processed/edge_source_comparison.csv"
+DEGREE_COMPARISON_FILE = "data/processed/edge_source_in_degree_comparison.csv"
+TOP_N = 50
+
+
+def load_edges(filepath, description):
+    """엣지 리스트를 로드하고 중복 엣지를 제거합니다."""
+    if not os.path.exists(filepath):
+        print(f"오류: {description} 파일이 존재하지 않습니다: {filepath}")
+        return None
+    df = pd.read_csv(filepath, encoding='utf-8').dropna(subset=["Source", "Target"])
+    df = df.drop_duplicates(subset=["Source", "Target"])
+    print(f"{description}: {len(df)}개 엣지, 출발 문서 {df['Source'].nunique()}개")
+    return df
+
+
+def compare_edges(mention_df, link_df):
+    """두 엣지 집합을 한 표로 합쳐 각 엣지가 어느 방식에서 추출되었는지 표시합니다."""
+    merged = pd.merge(
+        mention_df[["Source", "Target"]].assign(Mention=True),
+        link_df[["Source", "Target"]].assign(Link=True),
+        on=["Source", "Target"], how="outer",
+    )
+    merged[["Mention", "Link"]] = merged[["Mention", "Link"]].fillna(False).astype(bool)
+
+    both = int((merged["Mention"] & merged["Link"]).sum())
+    mention_only = int((merged["Mention"] & ~merged["Link"]).sum())
+    link_only = int((~merged["Mention"] & merged["Link"]).sum())
+    print("\n--- 엣지 비교 ---")
+    print(f"공통 엣지: {both}개")
+    print(f"텍스트 언급에서만: {mention_only}개")
+    print(f"하이퍼링크에서만: {link_only}개")
+    print(f"자카드 유사도: {both / len(merged):.3f}")
+    # 하이퍼링크를 기준으로 본 텍스트 언급 엣지의 정밀도/재현율
+    print(f"텍스트 언급 엣지 중 링크로도 확인된 비율: {both / max(1, both + mention_only):.3f}")
+    print(f"링크 엣지 중 텍스트 언급으로도 잡힌 비율: {both / max(1, both + link_only):.3f}")
+    return merged
+
+
+def compare_in_degrees(merged):
+    """방식별 내차수(받은 엣지 수)와 순위를 비교합니다."""
+    degrees = pd.DataFrame({
+        "Mention_In_Degree": merged[merged["Mention"]].groupby("Target").size(),
+        "Link_In_Degree": merged[merged["Link"]].groupby("Target").size(),
+    }).fillna(0).astype(int)
+    degrees.index.name = "Name"
+    degrees["Mention_Rank"] = degrees["Mention_In_Degree"].rank(ascending=False, method="min").astype(int)
+    degrees["Link_Rank"] = degrees["Link_In_Degree"].rank(ascending=False, method="min").astype(int)
+    degrees = degrees.sort_values("Mention_In_Degree", ascending=False)
+
+    rho = degrees["Mention_In_Degree"].corr(degrees["Link_In_Degree"], method="spearman")
+    top_mention = set(degrees.nsmallest(TOP_N, "Mention_Rank").index)
+    top_link = set(degrees.nsmallest(TOP_N, "Link_Rank").index)
+    print("\n--- 내차수 비교 ---")
+    print(f"스피어만 순위 상관계수: {rho:.3f}")
+    print(f"상위 {TOP_N}명 공통: {len(top_mention & top_link)}명")
+    return degrees.reset_index()
+
+
+def main():
+    mention_df = load_edges(MENTION_EDGES_FILE, "텍스트 언급 엣지")
+    link_df = load_edges(LINK_EDGES_FILE, "하이퍼링크 엣지")
+    if mention_df is None or link_df is None:
+        print("02_search_name_from_wiki.py를 EDGE_MODE = \"both\"로 먼저 실행하세요.")
+        return
+
+    # 두 방식 모두 처리한 출발 문서만 비교 (한쪽만 수집된 문서의 엣지가 차이로 잡히지 않도록)
+    common_sources = set(mention_df["Source"]) & set(link_df["Source"])
+    mention_df = mention_df[mention_df["Source"].isin(common_sources)]
+    link_df = link_df[link_df["Source"].isin(common_sources)]
+    print(f"비교 대상 출발 문서: {len(common_sources)}개")
+
+    merged = compare_edges(mention_df, link_df)
+    merged.sort_values(["Source", "Target"]).to_csv(COMPARISON_FILE, index=False, encoding='utf-8')
+    print(f"\n엣지 비교 결과 저장 완료: {COMPARISON_FILE}")
+
+    degrees = compare_in_degrees(merged)
+    degrees.to_csv(DEGREE_COMPARISON_FILE, index=False, encoding='utf-8')
+    print(f"내차수 비교 결과 저장 완료: {DEGREE_COMPARISON_FILE}")
+    print(degrees.head(20).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+언급 매칭 처리량 벤치마크
+
+기존 방식(이름마다 `name.lower() in text` 부분 문자열 검색)과
+정규화 + 토큰 경계 매칭(text_normalize + MentionMatcher)을 같은 합성 페이지에서 비교합니다.
+02_search_name_from_wiki.py의 기본 설정(RECORD_CONTEXTS = True)에서 쓰는 문맥 위치 기록 경로
+(find_mention_spans + MentionContextBuilder, 임시 폴더에 저장)도 함께 잽니다.
+실행: 프로젝트 루트에서 `python src/benchmark_matching.py`
+"""
+import random
+import tempfile
+import time
+
+from mention_context import MentionContextBuilder
+from mention_matcher import build_matcher
+from name_index import load_canonical_names
+from text_normalize import normalize_text
+
+N_PAGES = 200
+WORDS_PER_PAGE = 8000      # 위키피디아 철학자 문서 본문 평균 수준
+MENTIONS_PER_PAGE = 40
+RANDOM_SEED = 42
+
+# 부분 문자열 검색에서 짧은 이름이 걸리는 일반 단어 (예: 'Ion' -> 'religion', 'Mani' -> 'manifest')
+FILLER_WORDS = (
+    "the of and in to a is was that his philosophy religion manifest work which as by he for "
+    "with on it from this be are an at or theory natural reason knowledge ethics metaphysics "
+    "logic mind world human nature political state argued later influence school idea concept"
+).split()
+
+
+def make_pages(names, n_pages=N_PAGES, words_per_page=WORDS_PER_PAGE, mentions_per_page=MENTIONS_PER_PAGE, seed=RANDOM_SEED):
+    """일반 단어 사이에 철학자 이름을 섞은 합성 페이지를 만듭니다."""
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(n_pages):
+        words = rng.choices(FILLER_WORDS, k=words_per_page)
+        for name in rng.sample(names, mentions_per_page):
+            words.insert(rng.randrange(len(words)), name)
+        pages.append(" ".join(words))
+    return pages
+
+
+def substring_loop(pages, names):
+    """02_search_name_from_wiki.py의 기존 매칭 루프"""
+    results = []
+    for page in pages:
+        text = page.lower()
+        results.append([name for name in names if len(name) > 2 and name.lower() in text])
+    return results
+
+
+def token_matcher(pages, matcher):
+    """페이지당 한 번 정규화한 뒤 토큰 열에서 별칭 매칭"""
+    return [matcher.find_mentions(normalize_text(page)) for page in pages]
+
+
+def context_matcher(pages, matcher, names):
+    """02의 문맥 기록 추출 함수와 같은 경로: 원문 위치와 함께 매칭하고 문장 위치 색인을 기록/저장"""
+    results = []
+    with tempfile.TemporaryDirectory() as context_dir:
+        contexts = MentionContextBuilder(names, context_dir=context_dir)
+        for source_name, page in zip(names, pages):
+            mentions = matcher.find_mention_spans(page)
+            contexts.add_page(source_name, page, mentions)
+            results.append(sorted({name for name, _, _ in mentions}, key=matcher.ids.__getitem__))
+        contexts.save()
+        contexts.close()
+    return results
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    names = load_canonical_names()
+    pages = make_pages(names)
+    total_mb = sum(len(page) for page in pages) / 1e6
+    print(f"합성 페이지 {len(pages)}개 ({total_mb:.1f}MB), 철학자 이름 {len(names)}개")
+
+    matcher, _ = build_matcher(names)
+    baseline, baseline_sec = timed(substring_loop, pages, names)
+    matched, matched_sec = timed(token_matcher, pages, matcher)
+    with_contexts, contexts_sec = timed(context_matcher, pages, matcher, names)
+
+    print(f"\n{'방식':<22}{'시간(초)':>10}{'페이지/초':>12}{'MB/초':>10}{'매칭 수':>10}")
+    for label, result, seconds in [("부분 문자열 루프", baseline, baseline_sec), ("정규화 + 토큰 매칭", matched, matched_sec),
+                                   ("토큰 매칭 + 문맥 기록", with_contexts, contexts_sec)]:
+        n_matches = sum(len(r) for r in result)
+        print(f"{label:<22}{seconds:>10.2f}{len(pages) / seconds:>12.1f}{total_mb / seconds:>10.2f}{n_matches:>10}")
+
+    # 부분 문자열 방식에서만 나온 매칭 중 단어 내부에 걸린 경우 (오탐)
+    inside_word = sum(
+        1 for page, result in zip(pages, baseline)
+        for name in result if f" {name.lower()} " not in f" {page.lower()} "
+    )
+    print(f"\n부분 문자열 방식의 단어 내부 오탐: {inside_word}건")
+    for label, seconds in [("토큰 매칭", matched_sec), ("토큰 매칭 + 문맥 기록 (02 기본 설정)", contexts_sec)]:
+        speedup = baseline_sec / seconds
+        print(f"처리량 비율 ({label} / 부분 문자열): {speedup:.1f}배 {'(회귀 없음)' if speedup >= 1 else '(회귀)'}")
+    print(f"문맥 기록 추가 비용: 토큰 매칭 대비 {contexts_sec / matched_sec:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
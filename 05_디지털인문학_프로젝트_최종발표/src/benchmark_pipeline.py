@@ -0,0 +1,392 @@
+"""
+파이프라인 단계별 성능 벤치마크 (합성 데이터, 현재 규모의 1배/10배/100배)
+
+실제 철학자 목록의 이름 길이(토큰 수, 토큰 표기)와 날짜 표기, 실제 엣지 리스트의 Out-Degree 분포를
+따라 합성 철학자 목록과 엣지 리스트를 만들고, 임시 작업 폴더에서 각 단계를 실행해 시간과 최대 메모리를 잽니다.
+
+- matching: 02_search_name_from_wiki.py의 언급 추출 함수 (RECORD_CONTEXTS가 켜져 있으면 문맥 위치 기록 포함,
+  합성 페이지 표본으로 처리량 측정 후 전체 시간 추정)
+- graph_build: 05_create_network_graph.py
+- centrality:<지표>: 06과 같은 NetworkX 호출을 지표별로 따로 실행
+- centrality_script: 06_calculate_centralities.py 전체
+- adjustment: 08_calculate_adjusted_centrality.py
+- comparison: 10_compare_centrality_rankings.py
+- export: 14_prepare_gephi_data.py
+
+단계마다 새 프로세스(spawn)에서 실행하므로 최대 메모리(ru_maxrss)가 단계별로 분리되고,
+STAGE_TIMEOUT을 넘는 단계는 중단 후 'timeout'으로 기록합니다. 결과는 data/benchmarks/에 JSON으로 저장되어
+02, 06, 10 등을 수정하기 전후의 결과를 compare 명령으로 비교할 수 있습니다.
+
+실행: 프로젝트 루트에서
+    `python src/benchmark_pipeline.py [배율 ...]`            (기본: 1 10 100)
+    `python src/benchmark_pipeline.py compare 이전.json 이후.json`
+"""
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import random
+import resource
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from benchmark_matching import MENTIONS_PER_PAGE, WORDS_PER_PAGE, make_pages
+from name_index import PHILOSOPHERS_FILE, load_canonical_names
+
+SCALES = [1, 10, 100]
+BENCHMARK_DIR = "data/benchmarks"
+REAL_EDGES_FILE = "data/processed/mention_edges.csv"  # Out-Degree 분포 참고용 (없으면 기본값 사용)
+
+STAGE_TIMEOUT = 900        # 단계별 제한 시간 (초)
+MATCH_SAMPLE_PAGES = 100   # 매칭 처리량 측정에 쓰는 합성 페이지 수 (전체 시간은 처리량으로 추정)
+MEAN_OUT_DEGREE = 18       # 실제 엣지 파일이 없을 때의 평균 Out-Degree
+ZIPF_EXPONENT = 0.9        # 언급 대상 선택의 쏠림 정도 (소수의 철학자가 많이 언급되는 분포)
+AI_LIST_SIZE = 50
+RANDOM_SEED = 42
+
+CENTRALITY_METRICS = ["in_degree", "out_degree", "closeness", "betweenness", "eigenvector"]
+
+
+# ---------------------------------------------------------------------------
+# 합성 데이터
+# ---------------------------------------------------------------------------
+
+def load_reference():
+    """실제 철학자 목록과 Out-Degree 분포를 합성 데이터의 기준으로 로드합니다."""
+    names = load_canonical_names(PHILOSOPHERS_FILE)
+    for encoding in ['utf-8', 'cp1252', 'latin1', 'iso-8859-1']:
+        try:
+            rows = pd.read_csv(PHILOSOPHERS_FILE, encoding=encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    rows = rows.dropna(subset=["Name"]).drop_duplicates(subset=["Name"])
+
+    if os.path.exists(REAL_EDGES_FILE):
+        out_degrees = pd.read_csv(REAL_EDGES_FILE)["Source"].value_counts().reindex(names, fill_value=0).to_numpy()
+    else:
+        out_degrees = np.random.default_rng(RANDOM_SEED).geometric(1 / MEAN_OUT_DEGREE, size=len(names))
+    return names, rows[["Date", "Century"]].reset_index(drop=True), out_degrees
+
+
+def make_names(reference_names, n_names, seed=RANDOM_SEED):
+    """
+    실제 이름의 토큰 수와 위치별 토큰 표기를 섞어 서로 다른 합성 이름 n_names개를 만듭니다.
+    (예: 'Immanuel Kant' + 'David Hume' -> 'David Kant')
+    """
+    rng = random.Random(seed)
+    split = [name.split() for name in reference_names if name.split()]
+    firsts = [tokens[0] for tokens in split]
+    middles = [token for tokens in split for token in tokens[1:-1]] or firsts
+    lasts = [tokens[-1] for tokens in split if len(tokens) > 1] or firsts
+
+    names = list(dict.fromkeys(reference_names))[:n_names]
+    seen = set(names)
+    while len(names) < n_names:
+        size = len(rng.choice(split))
+        if size == 1:
+            tokens = [rng.choice(firsts) + rng.choice(lasts).lower()]
+        else:
+            tokens = [rng.choice(firsts)] + [rng.choice(middles) for _ in range(size - 2)] + [rng.choice(lasts)]
+        name = " ".join(tokens)
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def make_edges(n_names, out_degrees, seed=RANDOM_SEED):
+    """실제 Out-Degree 분포에서 출발 문서별 언급 수를 뽑고, 대상은 Zipf 분포로 골라 엣지를 만듭니다."""
+    rng = np.random.default_rng(seed)
+    degrees = rng.choice(out_degrees, size=n_names)
+    weights = 1.0 / np.arange(1, n_names + 1) ** ZIPF_EXPONENT
+    popularity = rng.permutation(n_names)  # 인기 순위와 목록 순서는 무관하게
+    sources = np.repeat(np.arange(n_names), degrees)
+    targets = popularity[rng.choice(n_names, size=len(sources), p=weights / weights.sum())]
+    edges = pd.DataFrame({"Source": sources, "Target": targets})
+    edges = edges[edges["Source"] != edges["Target"]].drop_duplicates()
+    return edges.sort_values("Source", kind="stable")
+
+
+def build_workspace(scale, reference, src_dir):
+    """
+    배율에 맞는 합성 입력 파일을 임시 작업 폴더에 만들고 src를 복사합니다.
+    앞 단계가 시간 초과로 끝나도 다음 단계가 실행될 수 있도록 각 단계의 입력 파일을 미리 모두 만듭니다.
+
+    Returns:
+        tuple: (작업 폴더 경로, 데이터 규모 dict)
+    """
+    reference_names, reference_rows, out_degrees = reference
+    n_names = len(reference_names) * scale
+    names = make_names(reference_names, n_names)
+    edge_ids = make_edges(n_names, out_degrees)
+
+    workspace = tempfile.mkdtemp(prefix=f"benchmark_{scale}x_")
+    shutil.copytree(src_dir, os.path.join(workspace, "src"), ignore=shutil.ignore_patterns("__pycache__"))
+    raw_dir = os.path.join(workspace, "data", "raw")
+    processed_dir = os.path.join(workspace, "data", "processed")
+    century_dir = os.path.join(processed_dir, "by_century")
+    for path in (raw_dir, century_dir):
+        os.makedirs(path, exist_ok=True)
+    # 14_prepare_gephi_data.py는 스크립트 폴더 기준 data/processed를 읽음
+    os.symlink(os.path.join(workspace, "data"), os.path.join(workspace, "src", "data"))
+
+    rows = reference_rows.sample(n=n_names, replace=True, random_state=RANDOM_SEED).reset_index(drop=True)
+    philosophers = pd.DataFrame({
+        "Name": names,
+        "Date": rows["Date"],
+        "Century": rows["Century"],
+        "Wikipedia_Link": ["https://en.wikipedia.org/wiki/" + name.replace(" ", "_") for name in names],
+    })
+    philosophers.to_csv(os.path.join(raw_dir, "philosophers_by_century.csv"), index=False, encoding="utf-8")
+    for century, group in philosophers.groupby("Century"):
+        safe_century = "".join(c if c.isalnum() else "_" for c in str(century))
+        group.to_csv(os.path.join(century_dir, f"philosophers_{safe_century}.csv"), index=False, encoding="utf-8")
+
+    name_array = np.array(names, dtype=object)
+    edges = pd.DataFrame({"Source": name_array[edge_ids["Source"]], "Target": name_array[edge_ids["Target"]]})
+    edges.to_csv(os.path.join(processed_dir, "mention_edges.csv"), index=False)
+    in_degree = edges["Target"].value_counts().reindex(names, fill_value=0)
+    pd.DataFrame({"Name": names, "RawCentrality": in_degree.to_numpy()}).sort_values(
+        by="RawCentrality", ascending=False
+    ).to_csv(os.path.join(processed_dir, "centrality_raw.csv"), index=False)
+
+    # 06, 08, 07의 출력 대신 쓰는 간이 결과 (In-Degree만 계산, 나머지 지표는 0)
+    out_degree = edges["Source"].value_counts().reindex(names, fill_value=0)
+    centralities = pd.DataFrame({
+        "Name": names,
+        "In-Degree Centrality": in_degree.to_numpy() / max(n_names - 1, 1),
+        "Out-Degree Centrality": out_degree.to_numpy() / max(n_names - 1, 1),
+        "Closeness Centrality": 0.0,
+        "Betweenness Centrality": 0.0,
+        "Eigenvector Centrality": 0.0,
+        "RawCentrality": in_degree.to_numpy(),
+        "Calculated_In_Degree_Count": in_degree.to_numpy(),
+    })
+    centralities.to_csv(os.path.join(processed_dir, "centralities.csv"), index=False, encoding="utf-8")
+    centralities.assign(
+        Adjusted_In_Degree_Centrality=centralities["In-Degree Centrality"]
+    ).to_csv(os.path.join(processed_dir, "adjusted_centralities.csv"), index=False, encoding="utf-8")
+    top_names = in_degree.sort_values(ascending=False).index[:AI_LIST_SIZE]
+    centralities[centralities["Name"].isin(top_names)].to_csv(
+        os.path.join(processed_dir, "top_50_in-degree-centralities_standard.csv"), index=False, encoding="utf-8"
+    )
+
+    # AI 목록: 상위 철학자를 섞은 '한국어 (영문)' 형식
+    rng = random.Random(RANDOM_SEED)
+    for list_name in ("chatgpt", "gemini"):
+        picked = rng.sample(list(top_names), len(top_names))
+        pd.DataFrame({"번호": range(1, len(picked) + 1), "이름": [f"철학자 ({name})" for name in picked]}).to_csv(
+            os.path.join(processed_dir, f"{list_name}_philosophers_list.csv"), index=False, encoding="utf-8"
+        )
+
+    size = {"scale": scale, "names": n_names, "edges": len(edges), "mean_out_degree": round(len(edges) / n_names, 2)}
+    return workspace, size
+
+
+# ---------------------------------------------------------------------------
+# 단계 (작업 폴더 안의 별도 프로세스에서 실행)
+# ---------------------------------------------------------------------------
+
+def run_script(script):
+    """src의 단계 스크립트를 그대로 실행합니다."""
+    runpy.run_path(os.path.join("src", script), run_name="__main__")
+
+
+def match_pages(n_pages):
+    """02의 언급 추출 함수로 합성 페이지 표본을 처리하고 처리량과 전체 문서 처리 시간 추정치를 반환합니다."""
+    import importlib
+    crawler = importlib.import_module("02_search_name_from_wiki")
+    names, wiki_links = crawler.load_philosophers()
+
+    # 02의 기본 설정과 같이 문맥 위치 기록을 켠 경우에는 그 경로(언급 위치 매칭 + 색인 저장)를 잼
+    contexts = None
+    if crawler.RECORD_CONTEXTS and crawler.MATCH_MODE == "alias":
+        from mention_context import MentionContextBuilder
+        contexts = MentionContextBuilder(names)
+
+    start = time.perf_counter()
+    extract = crawler.build_extractors(names, wiki_links, ["mention"], contexts)["mention"]
+    build_seconds = time.perf_counter() - start
+
+    pages = make_pages(names, n_pages=n_pages, words_per_page=WORDS_PER_PAGE, mentions_per_page=MENTIONS_PER_PAGE)
+    start = time.perf_counter()
+    n_matches = sum(len(extract(source, page, [])) for source, page in zip(names, pages))
+    if contexts is not None:
+        contexts.save()
+        contexts.close()
+    match_seconds = time.perf_counter() - start
+    pages_per_sec = n_pages / match_seconds
+    return {
+        "seconds": build_seconds + match_seconds,
+        "matcher_build_seconds": round(build_seconds, 3),
+        "pages_per_sec": round(pages_per_sec, 2),
+        "estimated_full_seconds": round(build_seconds + len(names) / pages_per_sec, 1),
+        "sample_pages": n_pages,
+        "matches": n_matches,
+        "record_contexts": contexts is not None,
+    }
+
+
+def centrality_metric(metric):
+    """06_calculate_centralities.py와 같은 방식으로 그래프를 만들고 지표 하나만 계산합니다."""
+    import networkx as nx
+    centrality_df = pd.read_csv("data/processed/centrality_raw.csv")
+    edges_df = pd.read_csv("data/processed/mention_edges.csv")
+    G = nx.DiGraph()
+    G.add_nodes_from(centrality_df["Name"].dropna())
+    nx.from_pandas_edgelist(edges_df.dropna(subset=["Source", "Target"]), source="Source", target="Target", create_using=G)
+
+    functions = {
+        "in_degree": nx.in_degree_centrality,
+        "out_degree": nx.out_degree_centrality,
+        "closeness": nx.closeness_centrality,
+        "betweenness": lambda graph: nx.betweenness_centrality(graph, k=None, normalized=True, endpoints=False),
+        "eigenvector": nx.eigenvector_centrality,
+    }
+    start = time.perf_counter()
+    functions[metric](G)
+    return {"seconds": time.perf_counter() - start}
+
+
+STAGES = (
+    [("matching", match_pages, (MATCH_SAMPLE_PAGES,)),
+     ("graph_build", run_script, ("05_create_network_graph.py",))]
+    + [(f"centrality:{metric}", centrality_metric, (metric,)) for metric in CENTRALITY_METRICS]
+    + [("centrality_script", run_script, ("06_calculate_centralities.py",)),
+       ("adjustment", run_script, ("08_calculate_adjusted_centrality.py",)),
+       ("comparison", run_script, ("10_compare_centrality_rankings.py",)),
+       ("export", run_script, ("14_prepare_gephi_data.py",))]
+)
+
+
+def _peak_rss_mb():
+    # Linux의 ru_maxrss 단위는 KB, macOS는 바이트
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _stage_worker(results, workspace, target, args):
+    os.chdir(workspace)
+    sys.path.insert(0, os.path.join(workspace, "src"))
+    import networkx  # noqa: F401  (라이브러리 로딩 시간은 측정에서 제외)
+    baseline_mb = _peak_rss_mb()
+
+    record = {"status": "ok"}
+    start = time.perf_counter()
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            record.update(target(*args) or {})
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            record["status"] = f"exit {e.code}"
+    except Exception as e:
+        record["status"] = f"error: {type(e).__name__}: {e}"
+    record.setdefault("seconds", time.perf_counter() - start)
+    record["seconds"] = round(record["seconds"], 3)
+    record["peak_rss_mb"] = _peak_rss_mb()
+    record["baseline_rss_mb"] = baseline_mb
+    results.put(record)
+
+
+def run_stage(workspace, target, args, timeout=STAGE_TIMEOUT):
+    """단계 하나를 새 프로세스에서 실행하고 시간/메모리 기록을 반환합니다."""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_stage_worker, args=(results, workspace, target, args))
+    process.start()
+    try:
+        record = results.get(timeout=timeout)
+    except queue.Empty:
+        process.terminate()
+        record = {"status": "timeout", "seconds": timeout}
+    process.join()
+    return record
+
+
+# ---------------------------------------------------------------------------
+# 실행과 비교
+# ---------------------------------------------------------------------------
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_benchmark(scales, timeout=STAGE_TIMEOUT):
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    reference = load_reference()
+    report = {"environment": environment(), "timeout": timeout, "scales": []}
+    for scale in scales:
+        print(f"\n=== {scale}배 규모: 합성 데이터 생성 중 ===")
+        workspace, size = build_workspace(scale, reference, src_dir)
+        print(f"철학자 {size['names']}명, 엣지 {size['edges']}개 (평균 Out-Degree {size['mean_out_degree']})")
+        stages = {}
+        try:
+            for stage_name, target, args in STAGES:
+                record = run_stage(workspace, target, args, timeout)
+                stages[stage_name] = record
+                print(f"  {stage_name:<26}{record['status']:<10}{record['seconds']:>10.2f}초"
+                      f"{record.get('peak_rss_mb', float('nan')):>10.1f}MB")
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
+        report["scales"].append({**size, "stages": stages})
+    return report
+
+
+def compare(before_path, after_path):
+    """두 벤치마크 JSON의 단계별 시간과 최대 메모리를 비교하여 출력합니다."""
+    with open(before_path, encoding="utf-8") as f:
+        before = {entry["scale"]: entry["stages"] for entry in json.load(f)["scales"]}
+    with open(after_path, encoding="utf-8") as f:
+        after = {entry["scale"]: entry["stages"] for entry in json.load(f)["scales"]}
+
+    print(f"{'배율':<6}{'단계':<26}{'이전(초)':>10}{'이후(초)':>10}{'배속':>8}{'이전(MB)':>10}{'이후(MB)':>10}")
+    for scale in sorted(set(before) & set(after)):
+        for stage_name in after[scale]:
+            old, new = before[scale].get(stage_name), after[scale][stage_name]
+            if old is None:
+                continue
+            if old["status"] != "ok" or new["status"] != "ok":
+                print(f"{scale:<6}{stage_name:<26}{old['status']:>10}{new['status']:>10}")
+                continue
+            speedup = old["seconds"] / new["seconds"] if new["seconds"] else float("inf")
+            print(f"{scale:<6}{stage_name:<26}{old['seconds']:>10.2f}{new['seconds']:>10.2f}{speedup:>7.2f}x"
+                  f"{old['peak_rss_mb']:>10.1f}{new['peak_rss_mb']:>10.1f}")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "compare":
+        compare(sys.argv[2], sys.argv[3])
+        return
+    scales = [int(arg) for arg in sys.argv[1:]] or SCALES
+
+    report = run_benchmark(scales)
+    os.makedirs(BENCHMARK_DIR, exist_ok=True)
+    output_path = os.path.join(BENCHMARK_DIR, f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n벤치마크 결과 저장 완료: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
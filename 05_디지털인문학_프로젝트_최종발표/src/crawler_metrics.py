@@ -0,0 +1,205 @@
+"""
+크롤러 실시간 관측 (처리량, 오류 종류, 지연 시간, ETA)과 재시도 대기열
+
+- CrawlerMonitor: RunReport에 쌓이는 카운터/페이지 지연 시간 분포를 읽어
+  페이지/초, 바이트/초, 지연 시간 백분위수, 오류 종류·HTTP 상태별 건수, 재시도 수, ETA를 계산하고
+  일정 간격으로 상태 파일(data/checkpoints/crawler_status.json)에 기록합니다.
+  port를 지정하면 http://localhost:<port>/metrics 에서 Prometheus 텍스트 형식으로도 제공합니다.
+- RetryQueue: 끝내 가져오지 못한 URL을 data/checkpoints/retry_queue.csv에 저장하고,
+  다음 실행이 다시 시도하여 성공한 항목만 대기열에서 뺍니다 (중단되어도 항목이 사라지지 않음).
+
+RunReport 카운터 이름 규칙: pages_ok, pages_failed, pages_error, bytes_fetched, retries,
+errors_<예외 클래스>, http_<상태 코드>
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from run_report import HISTOGRAM_BOUNDS_MS
+
+STATUS_FILE = "data/checkpoints/crawler_status.json"
+RETRY_QUEUE_FILE = "data/checkpoints/retry_queue.csv"
+STATUS_INTERVAL = 10      # 상태 파일 기록 간격 (초)
+MAX_RETRY_RUNS = 3        # 대기열 항목을 다시 시도할 최대 실행 횟수 (넘으면 대기열에서 제외)
+LATENCY_HISTOGRAM = "page_latency"
+
+_DONE_COUNTERS = ("pages_ok", "pages_failed", "pages_error")
+
+
+class CrawlerMonitor:
+    """RunReport를 읽어 크롤러 상태를 계산하고 상태 파일/메트릭 엔드포인트로 내보냅니다."""
+
+    def __init__(self, report, total, status_file=STATUS_FILE, port=None, interval=STATUS_INTERVAL):
+        """
+        Args:
+            report (RunReport): 02의 실행 보고서 (카운터와 page_latency 분포를 기록 중인 것)
+            total (int): 이번 실행에서 처리할 페이지 수 (ETA 계산용)
+            port (int): 지정하면 Prometheus 텍스트 엔드포인트를 엶
+        """
+        self.report = report
+        self.total = total
+        self.status_file = status_file
+        self.port = port
+        self.interval = interval
+        self._started = time.monotonic()
+        self._last_write = 0.0
+        self._server = None
+
+    def start(self):
+        if self.port is not None:
+            monitor = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split("?")[0] != "/metrics":
+                        self.send_error(404)
+                        return
+                    body = monitor.render_prometheus().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+            print(f"크롤러 메트릭: http://127.0.0.1:{self.port}/metrics")
+        return self
+
+    def snapshot(self):
+        """현재 상태 dict"""
+        counters = dict(self.report.counters)
+        elapsed = time.monotonic() - self._started
+        done = sum(counters.get(name, 0) for name in _DONE_COUNTERS)
+        pages_per_sec = done / elapsed if elapsed > 0 else 0.0
+        remaining = max(self.total - done, 0)
+        histogram = self.report.histograms.get(LATENCY_HISTOGRAM)
+        latency = histogram.to_dict() if histogram is not None else {}
+        return {
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "elapsed_seconds": round(elapsed, 1),
+            "pages_done": done,
+            "pages_total": self.total,
+            "pages_ok": counters.get("pages_ok", 0),
+            "pages_failed": counters.get("pages_failed", 0) + counters.get("pages_error", 0),
+            "pages_per_sec": round(pages_per_sec, 3),
+            "bytes_per_sec": round(counters.get("bytes_fetched", 0) / elapsed, 1) if elapsed > 0 else 0.0,
+            "eta_seconds": round(remaining / pages_per_sec) if pages_per_sec > 0 else None,
+            "retries": counters.get("retries", 0),
+            "errors": {name[len("errors_"):]: n for name, n in counters.items() if name.startswith("errors_")},
+            "http_status": {name[len("http_"):]: n for name, n in counters.items() if name.startswith("http_")},
+            "latency_ms": {key: latency[key] for key in ("p50_ms", "p90_ms", "p99_ms", "max_ms") if key in latency},
+        }
+
+    def progress_line(self):
+        """진행 상황 출력용 한 줄 요약"""
+        status = self.snapshot()
+        eta = status["eta_seconds"]
+        eta_text = f"{eta // 60}분 {eta % 60}초" if eta is not None else "계산 중"
+        return (f"{status['pages_per_sec']:.2f}페이지/초, {status['bytes_per_sec'] / 1024:.0f}KB/초, "
+                f"실패 {status['pages_failed']}건, 재시도 {status['retries']}회, 남은 시간 약 {eta_text}")
+
+    def write_status(self):
+        """상태 파일을 임시 파일에 쓴 뒤 교체합니다."""
+        os.makedirs(os.path.dirname(self.status_file), exist_ok=True)
+        tmp_path = f"{self.status_file}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.status_file)
+        self._last_write = time.monotonic()
+
+    def maybe_write_status(self):
+        """마지막 기록 후 interval이 지났으면 상태 파일을 갱신합니다 (페이지마다 호출)."""
+        if time.monotonic() - self._last_write >= self.interval:
+            self.write_status()
+
+    def render_prometheus(self):
+        """Prometheus 텍스트 형식 메트릭"""
+        status = self.snapshot()
+        lines = [
+            "# TYPE crawler_pages_total counter",
+            f'crawler_pages_total{{result="ok"}} {status["pages_ok"]}',
+            f'crawler_pages_total{{result="failed"}} {status["pages_failed"]}',
+            "# TYPE crawler_bytes_total counter",
+            f"crawler_bytes_total {self.report.counters.get('bytes_fetched', 0)}",
+            "# TYPE crawler_retries_total counter",
+            f"crawler_retries_total {status['retries']}",
+            "# TYPE crawler_errors_total counter",
+        ]
+        lines += [f'crawler_errors_total{{class="{name}"}} {n}' for name, n in status["errors"].items()]
+        lines.append("# TYPE crawler_http_responses_total counter")
+        lines += [f'crawler_http_responses_total{{code="{code}"}} {n}' for code, n in status["http_status"].items()]
+
+        histogram = self.report.histograms.get(LATENCY_HISTOGRAM)
+        if histogram is not None:
+            lines.append("# TYPE crawler_page_latency_seconds histogram")
+            cumulative = 0
+            for bound, count in zip(HISTOGRAM_BOUNDS_MS, histogram.counts):
+                cumulative += count
+                lines.append(f'crawler_page_latency_seconds_bucket{{le="{bound / 1000}"}} {cumulative}')
+            lines.append(f'crawler_page_latency_seconds_bucket{{le="+Inf"}} {histogram.n}')
+            lines.append(f"crawler_page_latency_seconds_sum {histogram.total}")
+            lines.append(f"crawler_page_latency_seconds_count {histogram.n}")
+
+        lines += [
+            "# TYPE crawler_pages_per_second gauge",
+            f"crawler_pages_per_second {status['pages_per_sec']}",
+            "# TYPE crawler_bytes_per_second gauge",
+            f"crawler_bytes_per_second {status['bytes_per_sec']}",
+            "# TYPE crawler_progress_ratio gauge",
+            f"crawler_progress_ratio {status['pages_done'] / self.total if self.total else 1.0}",
+        ]
+        if status["eta_seconds"] is not None:
+            lines += ["# TYPE crawler_eta_seconds gauge", f"crawler_eta_seconds {status['eta_seconds']}"]
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        self.write_status()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+class RetryQueue:
+    """가져오지 못한 URL 대기열 (이름 -> 항목). 실행마다 실패 횟수를 누적합니다."""
+
+    COLUMNS = ["Name", "URL", "Error", "Attempts", "Last_Attempt"]
+
+    def __init__(self, path=RETRY_QUEUE_FILE):
+        self.path = path
+        self._entries = {}
+        if os.path.exists(path):
+            df = pd.read_csv(path, encoding="utf-8")
+            for row in df.to_dict("records"):
+                self._entries[row["Name"]] = row
+
+    def __len__(self):
+        return len(self._entries)
+
+    def entries(self):
+        """저장된 항목 목록 (대기열은 그대로 두고, 다시 시도해 성공한 항목만 discard로 뺌)"""
+        return list(self._entries.values())
+
+    def add(self, name, url, error, previous_attempts=0):
+        self._entries[name] = {
+            "Name": name,
+            "URL": url,
+            "Error": error,
+            "Attempts": previous_attempts + 1,
+            "Last_Attempt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    def discard(self, name):
+        self._entries.pop(name, None)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        pd.DataFrame(list(self._entries.values()), columns=self.COLUMNS).to_csv(self.path, index=False, encoding="utf-8")
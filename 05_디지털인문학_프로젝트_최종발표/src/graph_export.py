@@ -0,0 +1,312 @@
+"""
+Gephi용 그래프 파일 스트리밍 출력 (GEXF 1.3, GraphML)
+
+노드/엣지 CSV는 속성의 자료형, 시간 구간을 담지 못해 Gephi에서 매번 다시 지정해야 했습니다.
+이 모듈은 노드 표(DataFrame)와 엣지 표(DataFrame 또는 DataFrame 조각의 반복자)를 받아
+chunk_size 행씩 XML 문자열을 만들어 바로 파일에 쓰므로, XML 전체를 메모리에 만들지 않고
+백만 개 이상의 엣지도 출력할 수 있습니다.
+
+- 노드 속성: id/label을 제외한 열을 자료형(정수, 실수, 불리언, 문자열)을 지정한 속성으로 저장
+- 엣지: Source/Target은 노드 Id로 지정하고, 노드 표의 위치로 한 번에 변환하여 이스케이프한 Id를 재사용
+  (노드 표에 없는 끝점의 엣지는 건너뛰고 개수를 알려줌). Weight 열은 엣지 가중치로 저장
+- 시간 구간 (GEXF만): start/end 열을 지정하면 mode="dynamic" 그래프로 저장하여 Gephi 타임라인에서 사용
+  (GraphML은 시간 구간을 지원하지 않으므로 일반 속성으로 저장)
+- 좌표 (GEXF만): x/y 열을 지정하면 viz:position으로 저장하여 Gephi에서 레이아웃을 다시 돌리지 않아도 됨
+"""
+import re
+from datetime import date
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 50000   # 한 번에 문자열로 만들어 쓰는 행 수
+TIME_FORMAT = "double"  # 연도(기원전은 음수)를 시간 값으로 사용
+
+# pandas 자료형 -> 속성 자료형 (GEXF와 GraphML에서 이름이 같음, 나머지는 string)
+ATTRIBUTE_TYPES = {"integer": "long", "float": "double", "boolean": "boolean"}
+
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _escape(values):
+    """XML 속성/본문에 넣을 수 있도록 문자열로 바꾸고 특수 문자를 이스케이프합니다."""
+    text = pd.Series(values, dtype=object).astype(str)
+    text = text.str.replace(_INVALID_XML_CHARS, "", regex=True)
+    for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;")):
+        text = text.str.replace(char, entity, regex=False)
+    return text.to_numpy(dtype=object)
+
+
+def _dtype_name(dtype):
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "integer"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    return "string"
+
+
+def _format_values(series):
+    """열 값을 XML 문자열 배열로 변환 (결측은 None)"""
+    present = series.notna().to_numpy()
+    kind = _dtype_name(series.dtype)
+    if kind == "boolean":
+        text = np.where(series.fillna(False).to_numpy(dtype=bool), "true", "false").astype(object)
+    elif kind != "string":
+        text = series.astype(str).to_numpy(dtype=object)
+    else:
+        text = _escape(series)
+    return np.where(present, text, None)
+
+
+def _wrap(prefix, values, suffix):
+    """값이 있는 행만 prefix + 값 + suffix (결측 행은 None)"""
+    out = np.full(len(values), None, dtype=object)
+    present = ~pd.isna(values)
+    out[present] = prefix + values[present] + suffix
+    return out
+
+
+def attribute_types(frame):
+    """열 이름 -> 속성 자료형 (정수/실수/불리언이 아니면 문자열)"""
+    return {column: ATTRIBUTE_TYPES.get(_dtype_name(frame[column].dtype), "string") for column in frame.columns}
+
+
+def _edge_chunks(edges):
+    """엣지 DataFrame 또는 DataFrame 조각 반복자를 (첫 조각, 전체 조각 반복자)로 만듭니다."""
+    if isinstance(edges, pd.DataFrame):
+        return edges.head(0), iter([edges])
+    chunks = iter(edges)
+    first = next(chunks, None)
+    if first is None:
+        return pd.DataFrame(columns=["Source", "Target"]), iter([])
+    return first.head(0), chain([first], chunks)
+
+
+def _join(pieces, n):
+    """행별 문자열 조각(모든 행에 같은 문자열 또는 행별 배열, None은 건너뜀)을 행마다 이어 붙입니다."""
+    result = np.full(n, "", dtype=object)
+    for piece in pieces:
+        result = result + (piece if isinstance(piece, str) else np.where(pd.isna(piece), "", piece))
+    return result
+
+
+class _GraphStreamWriter:
+    """노드 표로 Id 색인을 만들고 노드, 엣지를 조각 단위로 파일에 씁니다 (형식별 태그는 하위 클래스)."""
+
+    def __init__(self, nodes, id_column="Id", label_column="Label", directed=True, chunk_size=CHUNK_SIZE):
+        """
+        Args:
+            nodes (pd.DataFrame): 노드 표 (id_column 필수, 나머지 열은 속성)
+            directed (bool): 방향 그래프 여부
+            chunk_size (int): 한 번에 쓰는 행 수
+        """
+        nodes = nodes.dropna(subset=[id_column]).drop_duplicates(subset=[id_column])
+        self.nodes = nodes.reset_index(drop=True)
+        self.id_column = id_column
+        self.label_column = label_column if label_column in nodes.columns else None
+        self.directed = directed
+        self.chunk_size = chunk_size
+        self.node_index = pd.Index(self.nodes[id_column])
+        self.escaped_ids = _escape(self.nodes[id_column])
+        self.skipped_edges = 0
+        self.written_edges = 0
+
+    def _resolve(self, chunk):
+        """엣지 조각의 Source/Target을 노드 위치로 변환하고 노드 표에 없는 끝점의 엣지를 버립니다."""
+        sources = self.node_index.get_indexer(chunk["Source"])
+        targets = self.node_index.get_indexer(chunk["Target"])
+        keep = (sources >= 0) & (targets >= 0)
+        self.skipped_edges += int((~keep).sum())
+        return chunk[keep], sources[keep], targets[keep]
+
+    def write(self, path, edges, **kwargs):
+        """파일 하나를 처음부터 끝까지 씁니다. Returns: 출력 경로"""
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            self._write(f, edges, **kwargs)
+        if self.skipped_edges:
+            print(f"경고: 노드 표에 없는 끝점의 엣지 {self.skipped_edges}개는 제외했습니다.")
+        return path
+
+
+class GexfWriter(_GraphStreamWriter):
+    """GEXF 1.3 스트리밍 출력"""
+
+    def _write(self, f, edges, start_column=None, end_column=None, edge_start_column=None,
+               edge_end_column=None, position_columns=None, description=""):
+        time_columns = [c for c in (start_column, end_column) if c]
+        position_columns = [c for c in (position_columns or ()) if c in self.nodes.columns]
+        edge_time_columns = [c for c in (edge_start_column, edge_end_column) if c]
+        dynamic = bool(time_columns or edge_time_columns)
+        node_attrs = [c for c in self.nodes.columns
+                      if c not in {self.id_column, self.label_column, *time_columns, *position_columns}]
+        node_types = attribute_types(self.nodes[node_attrs])
+        edge_head, edge_chunks = _edge_chunks(edges)
+        edge_attrs = [c for c in edge_head.columns if c not in {"Source", "Target", "Type", "Weight", *edge_time_columns}]
+        edge_types = attribute_types(edge_head[edge_attrs])
+
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<gexf xmlns="http://gexf.net/1.3" xmlns:viz="http://gexf.net/1.3/viz" '
+                'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+                'xsi:schemaLocation="http://gexf.net/1.3 http://gexf.net/1.3/gexf.xsd" version="1.3">\n')
+        f.write(f'  <meta lastmodifieddate="{date.today().isoformat()}">\n'
+                f'    <description>{_escape([description])[0]}</description>\n  </meta>\n')
+        mode = f' mode="dynamic" timeformat="{TIME_FORMAT}" timerepresentation="interval"' if dynamic else ' mode="static"'
+        f.write(f'  <graph defaultedgetype="{"directed" if self.directed else "undirected"}"{mode}>\n')
+        for cls, types in (("node", node_types), ("edge", edge_types)):
+            if types:
+                f.write(f'    <attributes class="{cls}" mode="static">\n')
+                for i, (column, kind) in enumerate(types.items()):
+                    f.write(f'      <attribute id="{cls[0]}{i}" title="{_escape([column])[0]}" type="{kind}"/>\n')
+                f.write('    </attributes>\n')
+
+        f.write('    <nodes>\n')
+        for start in range(0, len(self.nodes), self.chunk_size):
+            chunk = self.nodes.iloc[start:start + self.chunk_size]
+            n = len(chunk)
+            ids = self.escaped_ids[start:start + n]
+            labels = _format_values(chunk[self.label_column]) if self.label_column else ids
+            pieces = ['      <node id="', ids, '" label="',
+                      np.where(pd.isna(labels), ids, labels), '"']
+            pieces += self._spell(chunk, start_column, end_column)
+            pieces += self._attvalues(chunk, node_types, "n", self._position(chunk, position_columns))
+            f.write("".join(_join(pieces, n)))
+        f.write('    </nodes>\n    <edges>\n')
+
+        for chunk in edge_chunks:
+            chunk, sources, targets = self._resolve(chunk)
+            n = len(chunk)
+            if not n:
+                continue
+            edge_ids = np.arange(self.written_edges, self.written_edges + n).astype(str).astype(object)
+            pieces = ['      <edge id="', edge_ids,
+                      '" source="', self.escaped_ids[sources],
+                      '" target="', self.escaped_ids[targets], '"']
+            if "Weight" in chunk.columns:
+                weights = _format_values(chunk["Weight"].fillna(1))
+                pieces += [' weight="', weights, '"']
+            pieces += self._spell(chunk, edge_start_column, edge_end_column)
+            pieces += self._attvalues(chunk, edge_types, "e")
+            f.write("".join(_join(pieces, n)))
+            self.written_edges += n
+        f.write('    </edges>\n  </graph>\n</gexf>\n')
+
+    @staticmethod
+    def _spell(chunk, start_column, end_column):
+        """노드/엣지의 시간 구간 속성 (start, end; 값이 없으면 열린 구간)"""
+        pieces = []
+        for attr, column in (("start", start_column), ("end", end_column)):
+            if column:
+                pieces.append(_wrap(f' {attr}="', _format_values(chunk[column]), '"'))
+        return pieces
+
+    @staticmethod
+    def _position(chunk, position_columns):
+        """viz:position 태그 (좌표 열이 없거나 좌표가 결측인 행은 None)"""
+        if not position_columns:
+            return None
+        values = [chunk[c].astype(float) for c in position_columns]
+        present = np.logical_and.reduce([v.notna().to_numpy() for v in values])
+        pieces = []
+        for axis, value in zip("xyz", values):
+            pieces += [f' {axis}="', value.to_numpy(dtype=float).astype(str).astype(object), '"']
+        tag = _join(['<viz:position', *pieces, '/>'], len(chunk))
+        return np.where(present, tag, None)
+
+    @staticmethod
+    def _attvalues(chunk, types, prefix, extra=None):
+        """속성 값 태그, viz 태그(extra)와 닫는 태그 (둘 다 없는 행은 빈 태그로 닫음)"""
+        n = len(chunk)
+        values = []
+        for i, column in enumerate(types):
+            values.append(_wrap(f'<attvalue for="{prefix}{i}" value="', _format_values(chunk[column]), '"/>'))
+        closing = "node" if prefix == "n" else "edge"
+        if not values and extra is None:
+            return ['/>\n']
+        body = _wrap('<attvalues>', _join(values, n), '</attvalues>') if values else np.full(n, "", dtype=object)
+        body = _join([np.where(body == "<attvalues></attvalues>", "", body), extra], n)
+        return [np.where(body == "", '/>\n', _wrap('>', body, f'</{closing}>\n'))]
+
+
+class GraphMLWriter(_GraphStreamWriter):
+    """GraphML 스트리밍 출력 (시간 구간은 일반 속성으로 저장)"""
+
+    def _write(self, f, edges, description=""):
+        node_attrs = [c for c in self.nodes.columns if c != self.id_column]
+        node_types = attribute_types(self.nodes[node_attrs])
+        edge_head, edge_chunks = _edge_chunks(edges)
+        edge_attrs = [c for c in edge_head.columns if c not in {"Source", "Target", "Type"}]
+        edge_types = attribute_types(edge_head[edge_attrs])
+
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+                'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+                'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+                'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
+        if description:
+            f.write(f'  <desc>{_escape([description])[0]}</desc>\n')
+        for cls, types in (("node", node_types), ("edge", edge_types)):
+            for i, (column, kind) in enumerate(types.items()):
+                f.write(f'  <key id="{cls[0]}{i}" for="{cls}" attr.name="{_escape([column])[0]}" attr.type="{kind}"/>\n')
+        f.write(f'  <graph id="G" edgedefault="{"directed" if self.directed else "undirected"}">\n')
+
+        for start in range(0, len(self.nodes), self.chunk_size):
+            chunk = self.nodes.iloc[start:start + self.chunk_size]
+            n = len(chunk)
+            pieces = ['    <node id="', self.escaped_ids[start:start + n],
+                      '">']
+            pieces += self._data(chunk, node_types, "n")
+            pieces.append('</node>\n')
+            f.write("".join(_join(pieces, n)))
+
+        for chunk in edge_chunks:
+            chunk, sources, targets = self._resolve(chunk)
+            n = len(chunk)
+            if not n:
+                continue
+            pieces = ['    <edge source="', self.escaped_ids[sources],
+                      '" target="', self.escaped_ids[targets], '">']
+            pieces += self._data(chunk, edge_types, "e")
+            pieces.append('</edge>\n')
+            f.write("".join(_join(pieces, n)))
+            self.written_edges += n
+        f.write('  </graph>\n</graphml>\n')
+
+    @staticmethod
+    def _data(chunk, types, prefix):
+        pieces = []
+        for i, column in enumerate(types):
+            pieces.append(_wrap(f'<data key="{prefix}{i}">', _format_values(chunk[column]), '</data>'))
+        return pieces
+
+
+def write_gexf(path, nodes, edges, start_column=None, end_column=None, edge_start_column=None,
+               edge_end_column=None, position_columns=None, directed=True, description="", chunk_size=CHUNK_SIZE):
+    """
+    노드 표와 엣지 표를 GEXF 1.3 파일로 씁니다.
+
+    Args:
+        nodes (pd.DataFrame): Id, Label(선택)과 속성 열
+        edges (pd.DataFrame | Iterable[pd.DataFrame]): Source, Target, Weight(선택)와 속성 열
+            (pd.read_csv(..., chunksize=...)처럼 조각 반복자를 넘기면 엣지 표 전체를 메모리에 올리지 않음)
+        start_column, end_column (str): 노드 시간 구간 열 (연도, 결측이면 열린 구간)
+        edge_start_column, edge_end_column (str): 엣지 시간 구간 열
+        position_columns (tuple): 노드 좌표 열 (예: ("x", "y")), viz:position으로 저장하고 속성에서는 제외
+
+    Returns:
+        GexfWriter: 출력한 엣지 수(written_edges), 제외한 엣지 수(skipped_edges)
+    """
+    writer = GexfWriter(nodes, directed=directed, chunk_size=chunk_size)
+    writer.write(path, edges, start_column=start_column, end_column=end_column,
+                 edge_start_column=edge_start_column, edge_end_column=edge_end_column,
+                 position_columns=position_columns, description=description)
+    return writer
+
+
+def write_graphml(path, nodes, edges, directed=True, description="", chunk_size=CHUNK_SIZE):
+    """노드 표와 엣지 표를 GraphML 파일로 씁니다 (인자는 write_gexf와 같음, 모든 열을 속성으로 저장)."""
+    writer = GraphMLWriter(nodes, directed=directed, chunk_size=chunk_size)
+    writer.write(path, edges, description=description)
+    return writer
@@ -0,0 +1,337 @@
+"""
+그래프 레이아웃 계산 (ForceAtlas2, Fruchterman-Reingold)과 PNG 그리기
+
+네트워크 이미지는 매번 Gephi 화면에서 레이아웃을 돌리고 위치를 손으로 맞춰야 했습니다.
+이 모듈은 CsrGraph(subgraph.py)의 엣지 배열로 노드 좌표를 계산하여 GEXF의 viz:position과
+PNG 이미지에 그대로 쓰므로, 화면 없이도 같은 그림을 다시 만들 수 있습니다.
+
+- 힘 계산은 노드/엣지 배열 단위(NumPy)로 한 번에 합니다.
+  - 인력: 엣지 끝점 좌표 차이를 bincount로 노드마다 합산
+  - 척력: 노드 수가 BARNES_HUT_MIN_NODES 미만이면 모든 쌍을 블록 단위로 직접 계산하고,
+    그 이상이면 4분할 격자(Barnes-Hut 쿼드트리의 단계별 격자)로 근사합니다.
+    단계마다 셀 질량/질량 중심을 bincount로 구하고, 부모 셀의 이웃 중 자기 셀과 붙어 있지 않은
+    자식 셀은 질량 중심 하나로, 가장 세밀한 단계의 인접 셀 노드는 직접 계산합니다 (O(N log N)).
+- 이어서 계산: 이전 좌표(노드 CSV의 x, y 열)를 넘기면 그 위치에서 시작하고,
+  새로 생긴 노드만 이웃 좌표의 평균 근처에 놓아 적은 반복으로 마무리합니다.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+LAYOUT_METHOD = "forceatlas2"   # "forceatlas2" 또는 "fruchterman_reingold"
+ITERATIONS = 300                # 처음부터 계산할 때 반복 수
+WARM_ITERATIONS = 60            # 이전 좌표에서 이어서 계산할 때 반복 수
+RANDOM_SEED = 42
+
+# ForceAtlas2 (Jacomy et al. 2014, Gephi 기본값)
+FA2_SCALING = 2.0               # 척력 계수 (클수록 넓게 퍼짐)
+FA2_GRAVITY = 1.0               # 원점으로 당기는 힘
+FA2_EDGE_WEIGHT_INFLUENCE = 1.0 # 엣지 가중치 지수 (0이면 가중치 무시)
+FA2_JITTER_TOLERANCE = 1.0
+FA2_MAX_DISPLACEMENT = 10.0     # 한 번에 움직이는 최대 거리 (큰 흔들림 방지)
+
+BARNES_HUT_MIN_NODES = 1000     # 이 노드 수부터 격자 근사 척력 사용
+BARNES_HUT_LEAF_SIZE = 4        # 가장 세밀한 격자 셀당 평균 노드 수
+BARNES_HUT_MAX_LEVEL = 12
+EXACT_BLOCK_SIZE = 1024         # 직접 계산할 때 한 번에 만드는 (행 x 전체) 거리 행렬의 행 수
+
+FIGURE_SIZE = (12, 12)
+FIGURE_DPI = 150
+MIN_NODE_SIZE = 10
+MAX_NODE_SIZE = 400
+LABEL_TOP = 30                  # 크기 기준 상위 몇 명에게 이름을 표시할지
+
+
+def _exact_repulsion(pos, mass, kr):
+    """모든 노드 쌍의 척력 kr * m_i * m_j / d (행을 EXACT_BLOCK_SIZE개씩 나누어 계산)"""
+    force = np.zeros_like(pos)
+    for start in range(0, len(pos), EXACT_BLOCK_SIZE):
+        block = slice(start, start + EXACT_BLOCK_SIZE)
+        delta = pos[block, None, :] - pos[None, :, :]
+        dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-9)
+        coeff = kr * mass[block, None] * mass[None, :] / dist2
+        force[block] = (delta * coeff[:, :, None]).sum(axis=1)
+    return force
+
+
+def _grid_repulsion(pos, mass, kr, leaf_size=BARNES_HUT_LEAF_SIZE):
+    """
+    4분할 격자로 근사한 척력 (Barnes-Hut)
+
+    단계 L 격자(2^L x 2^L)에서 노드 셀의 부모 셀과 그 이웃 부모 셀의 자식 36개 중
+    노드 셀과 붙어 있지 않은 셀은 질량 중심 하나로 계산하고,
+    가장 세밀한 단계에서 노드 셀과 붙어 있는 9개 셀의 노드는 직접 계산합니다.
+    """
+    n = len(pos)
+    levels = int(np.clip(np.ceil(np.log(max(n / leaf_size, 1)) / np.log(4)), 2, BARNES_HUT_MAX_LEVEL))
+    low = pos.min(axis=0)
+    span = max(float((pos.max(axis=0) - low).max()), 1e-9) * (1 + 1e-9)
+    x, y = pos[:, 0], pos[:, 1]
+    fx, fy = np.zeros(n), np.zeros(n)
+    node_coeff = kr * mass
+
+    for level in range(2, levels + 1):
+        m = 2 ** level
+        cx = np.minimum(((x - low[0]) / span * m).astype(np.int64), m - 1)
+        cy = np.minimum(((y - low[1]) / span * m).astype(np.int64), m - 1)
+        cell_id = cx * m + cy
+        cell_mass = np.bincount(cell_id, weights=mass, minlength=m * m)
+        safe_mass = np.maximum(cell_mass, 1e-300)
+        center_x = np.bincount(cell_id, weights=mass * x, minlength=m * m) / safe_mass
+        center_y = np.bincount(cell_id, weights=mass * y, minlength=m * m) / safe_mass
+
+        bx, by = (cx // 2) * 2, (cy // 2) * 2
+        for dx in range(-2, 4):
+            ox = bx + dx
+            inside_x = (ox >= 0) & (ox < m)
+            far_x = np.abs(ox - cx) > 1
+            for dy in range(-2, 4):
+                oy = by + dy
+                valid = inside_x & (oy >= 0) & (oy < m) & (far_x | (np.abs(oy - cy) > 1))
+                other_id = np.where(valid, ox * m + oy, 0)
+                ddx, ddy = x - center_x[other_id], y - center_y[other_id]
+                # 범위 밖이거나 붙어 있는 셀, 빈 셀은 질량 0으로 계산에서 빠짐
+                coeff = node_coeff * np.where(valid, cell_mass[other_id], 0.0) / np.maximum(ddx * ddx + ddy * ddy, 1e-9)
+                fx += ddx * coeff
+                fy += ddy * coeff
+
+    # 가장 세밀한 단계: 인접 9개 셀의 노드와 직접 계산 (셀 번호 순으로 정렬한 노드 구간을 모음)
+    order = np.argsort(cell_id, kind="stable")
+    cell_start = np.zeros(m * m + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cell_id, minlength=m * m), out=cell_start[1:])
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            ox, oy = cx + dx, cy + dy
+            valid = np.flatnonzero((ox >= 0) & (ox < m) & (oy >= 0) & (oy < m))
+            other_id = ox[valid] * m + oy[valid]
+            starts = cell_start[other_id]
+            counts = cell_start[other_id + 1] - starts
+            total = int(counts.sum())
+            if not total:
+                continue
+            i = np.repeat(valid, counts)
+            j = order[np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)]
+            keep = i != j
+            i, j = i[keep], j[keep]
+            ddx, ddy = x[i] - x[j], y[i] - y[j]
+            coeff = node_coeff[i] * mass[j] / np.maximum(ddx * ddx + ddy * ddy, 1e-9)
+            fx += np.bincount(i, weights=ddx * coeff, minlength=n)
+            fy += np.bincount(i, weights=ddy * coeff, minlength=n)
+    return np.column_stack([fx, fy])
+
+
+def repulsion(pos, mass, kr, barnes_hut=None):
+    """노드 수에 따라 직접 계산 또는 격자 근사 척력"""
+    if barnes_hut is None:
+        barnes_hut = len(pos) >= BARNES_HUT_MIN_NODES
+    return _grid_repulsion(pos, mass, kr) if barnes_hut else _exact_repulsion(pos, mass, kr)
+
+
+def _undirected_edges(graph):
+    """자기 루프를 뺀 엣지 끝점과 가중치 (방향은 무시, 양방향 엣지는 두 번 당김)"""
+    keep = graph.sources != graph.targets
+    return graph.sources[keep], graph.targets[keep], graph.weights[keep].astype(float)
+
+
+def _attraction(pos, sources, targets, weights, n, power=1):
+    """엣지마다 끝점끼리 weight * 거리^power 크기로 당기는 힘 (bincount로 노드마다 합산)"""
+    delta = pos[sources] - pos[targets]
+    if power != 1:
+        delta = delta * np.sqrt((delta ** 2).sum(axis=1))[:, None] ** (power - 1)
+    pull = delta * weights[:, None]
+    force = np.zeros_like(pos)
+    for axis in range(2):
+        force[:, axis] = np.bincount(targets, weights=pull[:, axis], minlength=n) - np.bincount(sources, weights=pull[:, axis], minlength=n)
+    return force
+
+
+def forceatlas2(graph, positions=None, iterations=ITERATIONS, scaling=FA2_SCALING, gravity=FA2_GRAVITY,
+                edge_weight_influence=FA2_EDGE_WEIGHT_INFLUENCE, barnes_hut=None):
+    """
+    ForceAtlas2 레이아웃 (선형 인력, 차수+1 질량의 척력, 원점 중력, Gephi와 같은 적응형 속도)
+
+    Args:
+        graph (CsrGraph): 그래프
+        positions (np.ndarray): (노드 수, 2) 시작 좌표 (None이면 무작위)
+        iterations (int): 반복 수
+        barnes_hut (bool): 격자 근사 척력 사용 여부 (None이면 노드 수로 결정)
+
+    Returns:
+        np.ndarray: (노드 수, 2) 좌표
+    """
+    n = graph.n_nodes
+    if n == 0:
+        return np.zeros((0, 2))
+    pos = initial_positions(n) if positions is None else np.array(positions, dtype=float)
+    sources, targets, weights = _undirected_edges(graph)
+    weights = weights ** edge_weight_influence if edge_weight_influence != 1 else weights
+    mass = 1.0 + np.bincount(sources, minlength=n) + np.bincount(targets, minlength=n)
+
+    speed, speed_efficiency = 1.0, 1.0
+    previous = np.zeros_like(pos)
+    for _ in range(iterations):
+        force = repulsion(pos, mass, scaling, barnes_hut)
+        force += _attraction(pos, sources, targets, weights, n)
+        distance = np.sqrt((pos ** 2).sum(axis=1))
+        force -= pos * (gravity * mass / np.maximum(distance, 1e-9))[:, None]
+
+        # 적응형 속도: 흔들림(swing)이 크면 줄이고, 한 방향으로 움직이면(traction) 늘림
+        swing = mass * np.sqrt(((force - previous) ** 2).sum(axis=1))
+        traction = mass * np.sqrt(((force + previous) ** 2).sum(axis=1)) / 2
+        total_swing, total_traction = swing.sum(), traction.sum()
+        estimated = 0.05 * np.sqrt(n)
+        jitter = FA2_JITTER_TOLERANCE * max(np.sqrt(estimated), min(10.0, estimated * total_traction / n ** 2))
+        if total_traction > 0 and total_swing / total_traction > 2.0:
+            speed_efficiency = max(speed_efficiency * 0.5, 0.05)
+            jitter = max(jitter, FA2_JITTER_TOLERANCE)
+        target = jitter * speed_efficiency * total_traction / max(total_swing, 1e-12)
+        if total_swing > jitter * total_traction:
+            speed_efficiency = max(speed_efficiency * 0.7, 0.05)
+        elif speed < 1000:
+            speed_efficiency *= 1.3
+        speed += min(target - speed, 0.5 * speed)
+
+        factor = speed / (1.0 + np.sqrt(speed * swing / mass))
+        step = force * factor[:, None]
+        length = np.sqrt((step ** 2).sum(axis=1))
+        step *= (np.minimum(length, FA2_MAX_DISPLACEMENT) / np.maximum(length, 1e-12))[:, None]
+        pos += step
+        previous = force
+    return pos
+
+
+def fruchterman_reingold(graph, positions=None, iterations=ITERATIONS, barnes_hut=None):
+    """
+    Fruchterman-Reingold 레이아웃 (척력 k²/d, 인력 d²/k, 온도를 선형으로 낮춤)
+
+    Returns:
+        np.ndarray: (노드 수, 2) 좌표 (한 변이 1인 정사각형 안)
+    """
+    n = graph.n_nodes
+    if n == 0:
+        return np.zeros((0, 2))
+    pos = initial_positions(n, scale=1.0) if positions is None else _normalize(np.array(positions, dtype=float))
+    sources, targets, weights = _undirected_edges(graph)
+    k = np.sqrt(1.0 / max(n, 1))
+    temperature = 0.1 if positions is None else 0.02
+    ones = np.ones(n)
+    for i in range(iterations):
+        force = repulsion(pos, ones, k ** 2, barnes_hut)
+        force += _attraction(pos, sources, targets, weights, n, power=2) / k
+        length = np.sqrt((force ** 2).sum(axis=1))
+        step_size = temperature * (1 - i / iterations)
+        pos += force * (np.minimum(length, step_size) / np.maximum(length, 1e-12))[:, None]
+    return pos
+
+
+LAYOUTS = {"forceatlas2": forceatlas2, "fruchterman_reingold": fruchterman_reingold}
+
+
+def initial_positions(n, scale=None, seed=RANDOM_SEED):
+    """무작위 시작 좌표 (scale이 없으면 노드 수에 맞춘 크기의 정사각형)"""
+    scale = np.sqrt(n) * 10 if scale is None else scale
+    return np.random.default_rng(seed).uniform(-scale / 2, scale / 2, size=(n, 2))
+
+
+def _normalize(pos):
+    """좌표를 한 변이 1인 정사각형 안으로 옮김"""
+    low = pos.min(axis=0)
+    return (pos - low) / max(float((pos.max(axis=0) - low).max()), 1e-9) - 0.5
+
+
+def warm_positions(graph, previous, id_column="Id", seed=RANDOM_SEED):
+    """
+    이전 좌표 표(Id, x, y)로 시작 좌표를 만듭니다.
+    이전 표에 없는 노드는 좌표가 있는 이웃의 평균 근처에, 그런 이웃도 없으면 이전 좌표 범위 안 무작위 위치에 놓습니다.
+
+    Returns:
+        tuple: (np.ndarray (노드 수, 2) 좌표, 이전 좌표가 있던 노드 수)
+    """
+    rng = np.random.default_rng(seed)
+    previous = previous.dropna(subset=[id_column, "x", "y"]).drop_duplicates(subset=[id_column]).set_index(id_column)
+    pos = previous.reindex(pd.Index(graph.names))[["x", "y"]].to_numpy(dtype=float, copy=True)
+    known = ~np.isnan(pos[:, 0])
+    if not known.any():
+        return initial_positions(graph.n_nodes, seed=seed), 0
+    missing = np.flatnonzero(~known)
+    if len(missing):
+        low, high = pos[known].min(axis=0), pos[known].max(axis=0)
+        spread = max(float((high - low).max()), 1.0) * 0.01
+        sources, targets, _ = _undirected_edges(graph)
+        ends = np.concatenate([sources, targets])
+        others = np.concatenate([targets, sources])
+        use = known[others]
+        counts = np.bincount(ends[use], minlength=graph.n_nodes)
+        mean = np.zeros_like(pos)
+        for axis in range(2):
+            mean[:, axis] = np.bincount(ends[use], weights=pos[others[use], axis], minlength=graph.n_nodes)
+        linked = counts[missing] > 0
+        pos[missing[linked]] = mean[missing[linked]] / counts[missing[linked], None] + rng.normal(0, spread, (linked.sum(), 2))
+        pos[missing[~linked]] = rng.uniform(low, high, size=((~linked).sum(), 2))
+    return pos, int(known.sum())
+
+
+def compute_layout(graph, previous=None, method=LAYOUT_METHOD, iterations=None, warm_iterations=WARM_ITERATIONS):
+    """
+    레이아웃 좌표를 계산합니다. previous(Id, x, y 표)가 있으면 이전 좌표에서 이어서 계산합니다.
+
+    Returns:
+        pd.DataFrame: 그래프 노드 순서의 x, y 열
+    """
+    if method not in LAYOUTS:
+        raise ValueError(f"지원하지 않는 레이아웃: {method}")
+    positions = None
+    if previous is not None and {"x", "y"} <= set(previous.columns):
+        positions, reused = warm_positions(graph, previous)
+        if reused:
+            iterations = warm_iterations if iterations is None else iterations
+            print(f"이전 좌표에서 이어서 계산: {reused}/{graph.n_nodes}개 노드")
+        else:
+            positions = None
+    pos = LAYOUTS[method](graph, positions, ITERATIONS if iterations is None else iterations)
+    return pd.DataFrame({"x": pos[:, 0].round(4), "y": pos[:, 1].round(4)})
+
+
+def render_png(path, graph, pos, sizes=None, labels=None, title=None, label_top=LABEL_TOP):
+    """
+    좌표로 네트워크 이미지를 저장합니다 (화면 없는 Agg 백엔드).
+
+    Args:
+        pos (np.ndarray): (노드 수, 2) 좌표
+        sizes (array-like): 노드 크기 기준 값 (예: 중심성, None이면 차수)
+        labels (array-like): 노드 이름 (크기 기준 상위 label_top명만 표시)
+
+    Returns:
+        str: 저장한 경로 (노드가 없으면 그리지 않고 None)
+    """
+    if graph.n_nodes == 0:
+        print(f"경고: 노드가 없는 그래프라 이미지를 만들지 않습니다: {path}")
+        return None
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    pos = np.asarray(pos, dtype=float)
+    sizes = (graph.in_degree() + graph.out_degree()) if sizes is None else pd.to_numeric(pd.Series(sizes), errors="coerce").fillna(0).to_numpy(dtype=float)
+    span = sizes.max() - sizes.min()
+    scaled = MIN_NODE_SIZE + (sizes - sizes.min()) / span * (MAX_NODE_SIZE - MIN_NODE_SIZE) if span > 0 else np.full(len(sizes), MIN_NODE_SIZE * 3.0)
+    scaled *= min(1.0, np.sqrt(100 / max(len(sizes), 1)))  # 노드가 많으면 전체적으로 작게
+
+    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
+    segments = np.stack([pos[graph.sources], pos[graph.targets]], axis=1)
+    ax.add_collection(LineCollection(segments, colors="gray", linewidths=0.3, alpha=min(1.0, 200 / max(graph.n_edges, 1)) * 0.5 + 0.05))
+    ax.scatter(pos[:, 0], pos[:, 1], s=scaled, c=sizes, cmap="viridis", edgecolors="white", linewidths=0.5, zorder=2)
+    if labels is not None and label_top:
+        for i in np.argsort(-sizes, kind="stable")[:label_top]:
+            ax.annotate(str(labels[i]), pos[i], fontsize=8, ha="center", va="bottom", zorder=3)
+    if title:
+        ax.set_title(title)
+    ax.set_aspect("equal")
+    ax.autoscale_view()
+    ax.axis("off")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fig.savefig(path, dpi=FIGURE_DPI, bbox_inches="tight")
+    plt.close(fig)
+    return path
@@ -0,0 +1,220 @@
+"""
+멘션 문맥(문장) 위치 색인
+
+매칭 단계에서 언급 하나마다 (문장 시작, 문장 끝, 언급 시작, 언급 끝) 문자 위치 4개만 기록하고,
+문장 문자열은 복사하지 않습니다. 본문은 data/processed/mention_contexts/pages.txt에 한 번만 저장하고
+색인(index.npz)은 그 안의 위치를 가리킵니다.
+
+- MentionContextBuilder: 02_search_name_from_wiki.py의 매칭 중에 페이지별 언급 위치를 모아 저장
+- MentionContextIndex: 저장된 색인을 로드하여 (출발, 대상) 쌍의 언급 문장을 사전 조회 한 번(O(1))으로 반환
+  (페이지를 다시 가져오거나 다시 스캔하지 않음)
+
+실행: 프로젝트 루트에서 `python src/mention_context.py "출발 철학자" "대상 철학자"`
+"""
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from collections import defaultdict, namedtuple
+
+import numpy as np
+
+CONTEXT_DIR = "data/processed/mention_contexts"
+PAGES_FILE = "pages.txt"   # 페이지 본문을 이어 붙인 UTF-8 파일
+INDEX_FILE = "index.npz"   # 페이지 위치, (출발, 대상) 쌍, 언급 위치 배열
+
+RECORD_WIDTH = 4  # 언급 하나: 문장 시작, 문장 끝, 언급 시작, 언급 끝 (페이지 본문 기준 문자 위치)
+
+# 문장 끝: 마침표류 뒤의 공백, 또는 줄바꿈 (위키텍스트에서 만든 본문은 문단마다 줄이 바뀜)
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])[\"'”’)\]]*\s+|\n+")
+
+MentionContext = namedtuple("MentionContext", ["sentence", "mention"])
+
+
+def sentence_bounds(text):
+    """문장 시작 위치 배열 (마지막 값은 본문 길이)"""
+    bounds = array("I", [0])
+    bounds.extend(match.end() for match in _SENTENCE_END.finditer(text))
+    if bounds[-1] != len(text):
+        bounds.append(len(text))
+    return bounds
+
+
+class MentionContextBuilder:
+    """
+    페이지별 언급 위치를 모아 색인 파일로 저장합니다.
+    본문은 추가되는 즉시 파일에 쓰고 메모리에는 정수 배열만 보관합니다.
+    """
+
+    def __init__(self, names, context_dir=CONTEXT_DIR, resume=False):
+        """
+        Args:
+            names (list): 철학자 이름 목록 (색인은 이 목록의 번호로 저장)
+            resume (bool): True면 기존 색인에 이어서 추가 (체크포인트 재개)
+        """
+        self.names = list(names)
+        self._ids = {name: i for i, name in enumerate(self.names)}
+        self.context_dir = context_dir
+        self._pages_path = os.path.join(context_dir, PAGES_FILE)
+        self._index_path = os.path.join(context_dir, INDEX_FILE)
+        os.makedirs(context_dir, exist_ok=True)
+
+        self._page_spans = {}       # 출발 번호 -> (본문 바이트 위치, 바이트 수)
+        self._pairs = {}            # (출발 번호, 대상 번호) -> (첫 언급 레코드 번호, 언급 수)
+        self._records = array("I")  # 언급 레코드를 RECORD_WIDTH개씩 이어 붙인 배열
+        if resume and os.path.exists(self._index_path) and os.path.exists(self._pages_path):
+            self._load_existing()
+            self._pages = open(self._pages_path, "ab")
+        else:
+            self._pages = open(self._pages_path, "wb")
+
+    def _load_existing(self):
+        index = MentionContextIndex(self.context_dir)
+        for name, span in index.page_spans().items():
+            if name in self._ids:
+                self._page_spans[self._ids[name]] = span
+        for (source, target), (first, count) in index.pairs().items():
+            if source in self._ids and target in self._ids:
+                self._pairs[(self._ids[source], self._ids[target])] = (len(self._records) // RECORD_WIDTH, count)
+                self._records.extend(index.records(first, count))
+        index.close()
+
+    def add_page(self, source_name, text, mentions):
+        """
+        페이지 하나의 언급 위치를 기록합니다. 같은 출발 페이지를 다시 추가하면 새 기록으로 교체됩니다.
+
+        Args:
+            source_name (str): 출발 철학자 이름
+            text (str): 매칭에 사용한 본문
+            mentions (list): MentionMatcher.find_mention_spans 결과 [(대상 이름, 시작, 끝)]
+        """
+        source = self._ids[source_name]
+        if source in self._page_spans:
+            for pair in [pair for pair in self._pairs if pair[0] == source]:
+                del self._pairs[pair]
+
+        by_target = defaultdict(list)
+        for target_name, start, end in mentions:
+            target = self._ids.get(target_name)
+            if target is not None and target != source:
+                by_target[target].append((start, end))
+        if not by_target:
+            self._page_spans.pop(source, None)
+            return
+
+        data = text.encode("utf-8")
+        self._page_spans[source] = (self._pages.tell(), len(data))
+        self._pages.write(data)
+
+        bounds = sentence_bounds(text)
+        for target, spans in by_target.items():
+            self._pairs[(source, target)] = (len(self._records) // RECORD_WIDTH, len(spans))
+            for start, end in spans:
+                k = bisect_right(bounds, start) - 1
+                self._records.extend((bounds[k], bounds[k + 1], start, end))
+
+    def save(self):
+        """색인 파일을 저장합니다 (체크포인트마다 호출 가능)."""
+        self._pages.flush()
+        pages = sorted(self._page_spans.items())
+        pairs = sorted(self._pairs.items())
+        np.savez_compressed(
+            self._index_path,
+            names=np.array(self.names, dtype=str),
+            page_source=np.array([source for source, _ in pages], dtype=np.int32),
+            page_offset=np.array([span[0] for _, span in pages], dtype=np.int64),
+            page_length=np.array([span[1] for _, span in pages], dtype=np.int64),
+            pair_source=np.array([pair[0] for pair, _ in pairs], dtype=np.int32),
+            pair_target=np.array([pair[1] for pair, _ in pairs], dtype=np.int32),
+            pair_first=np.array([value[0] for _, value in pairs], dtype=np.int64),
+            pair_count=np.array([value[1] for _, value in pairs], dtype=np.int32),
+            records=np.frombuffer(self._records, dtype=np.uint32).reshape(-1, RECORD_WIDTH),
+        )
+        return self._index_path
+
+    def close(self):
+        self._pages.close()
+
+
+class MentionContextIndex:
+    """저장된 멘션 문맥 색인 조회"""
+
+    def __init__(self, context_dir=CONTEXT_DIR):
+        with np.load(os.path.join(context_dir, INDEX_FILE)) as data:
+            self.names = data["names"].tolist()
+            self._records = data["records"]
+            page_spans = zip(data["page_source"].tolist(), data["page_offset"].tolist(), data["page_length"].tolist())
+            self._page_spans = {source: (offset, length) for source, offset, length in page_spans}
+            pairs = zip(data["pair_source"].tolist(), data["pair_target"].tolist(),
+                        data["pair_first"].tolist(), data["pair_count"].tolist())
+            self._pairs = {(source, target): (first, count) for source, target, first, count in pairs}
+        self._ids = {name: i for i, name in enumerate(self.names)}
+        self._pages = open(os.path.join(context_dir, PAGES_FILE), "rb")
+
+    def __len__(self):
+        return len(self._pairs)
+
+    def __contains__(self, pair):
+        source, target = pair
+        return (self._ids.get(source), self._ids.get(target)) in self._pairs
+
+    def page_spans(self):
+        """출발 이름 -> (본문 바이트 위치, 바이트 수)"""
+        return {self.names[source]: span for source, span in self._page_spans.items()}
+
+    def pairs(self):
+        """(출발 이름, 대상 이름) -> (첫 언급 레코드 번호, 언급 수)"""
+        return {(self.names[source], self.names[target]): value for (source, target), value in self._pairs.items()}
+
+    def records(self, first, count):
+        """언급 레코드를 이어 붙인 평탄한 정수 리스트"""
+        return self._records[first:first + count].ravel().tolist()
+
+    def page_text(self, source_name):
+        """저장된 출발 페이지 본문 (없으면 None)"""
+        span = self._page_spans.get(self._ids.get(source_name))
+        if span is None:
+            return None
+        offset, length = span
+        self._pages.seek(offset)
+        return self._pages.read(length).decode("utf-8")
+
+    def contexts(self, source_name, target_name):
+        """
+        출발 페이지에서 대상 철학자가 언급된 문장 목록.
+        (출발, 대상) 쌍은 사전 조회 한 번으로 찾고, 문장은 저장된 본문에서 위치로 잘라 냅니다.
+
+        Returns:
+            list: MentionContext(문장, 언급 표기) 리스트 (엣지가 없으면 빈 리스트)
+        """
+        key = (self._ids.get(source_name), self._ids.get(target_name))
+        if key not in self._pairs:
+            return []
+        first, count = self._pairs[key]
+        text = self.page_text(source_name)
+        return [
+            MentionContext(text[sentence_start:sentence_end].strip(), text[start:end])
+            for sentence_start, sentence_end, start, end in self._records[first:first + count].tolist()
+        ]
+
+    def close(self):
+        self._pages.close()
+
+
+def main():
+    if len(sys.argv) != 3:
+        print('사용법: python src/mention_context.py "출발 철학자" "대상 철학자"')
+        exit(1)
+    source_name, target_name = sys.argv[1], sys.argv[2]
+    index = MentionContextIndex()
+    contexts = index.contexts(source_name, target_name)
+    if not contexts:
+        print(f"{source_name} -> {target_name}: 기록된 언급이 없습니다")
+    for n, context in enumerate(contexts, start=1):
+        print(f"[{n}] ({context.mention}) {context.sentence}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+별칭 기반 철학자 언급 매칭
+
+철학자마다 별칭 테이블(전체 이름, 성, 리다이렉트 제목, 라틴어/관용 표기)을 만들고,
+페이지 본문을 한 번 정규화/토큰화(text_normalize)한 뒤 '첫 토큰 -> 별칭' 사전으로 모든 별칭을 한 번에 찾습니다.
+별칭 수가 늘어나도 토큰마다 사전 조회 한 번이 추가될 뿐이므로 스캔 비용은 본문 길이에 비례합니다.
+
+이름 검사(문자열 여부, 길이, 중복, 소문자 변환, 모호한 이름 표시)는 매처 생성 시 한 번만 하고,
+생성된 매처는 변경하지 않으므로 페이지별 매칭 루프에서는 이름마다 확인하는 작업이 없습니다.
+"""
+import os
+import re
+from collections import defaultdict, namedtuple
+
+import pandas as pd
+
+from name_index import MANUAL_ALIASES, NameIndex, load_priors, repair_mojibake
+from text_normalize import NormalizedText, normalize_key, normalize_text, normalize_text_with_spans
+
+REDIRECTS_FILE = "data/raw/redirects.csv"
+
+# 별칭 종류
+ALIAS_FULL = "full"          # 목록의 전체 이름
+ALIAS_VARIANT = "variant"    # 인코딩 복구/관용 표기/라틴어 표기
+ALIAS_REDIRECT = "redirect"  # 위키피디아 리다이렉트 제목
+ALIAS_SURNAME = "surname"    # 성만 표기 (예: 'Kant')
+
+MIN_ALIAS_LENGTH = 3         # 이보다 짧은 별칭(전체 이름 제외)은 오탐이 많아 제외
+SHORT_NAME_LENGTH = 4        # 이보다 짧은 한 단어 이름은 대문자로 시작할 때만 인정
+MIN_SURNAME_LENGTH = 4
+DOMINANCE_RATIO = 3.0        # 같은 성을 가진 후보 중 1위의 In-Degree가 2위의 몇 배 이상이면 1위에 배정
+MIN_SUBSTRING_LENGTH = 3     # 부분 문자열 매칭에서 이보다 짧은 이름은 오탐이 많아 제외
+
+# 라틴어/관용 표기 (목록 이름 -> 본문에서 자주 쓰이는 다른 표기)
+LATINIZED_FORMS = {
+    'Avicenna': ['Ibn Sina'],
+    'Averroes': ['Ibn Rushd'],
+    'Moses Maimonides': ['Rambam'],
+    'Al-Kindi': ['Alkindus'],
+    'Al-Farabi': ['Alpharabius'],
+    'Al-Ghazali': ['Algazel'],
+    'Lao Zi': ['Laozi', 'Lao Tzu', 'Lao-Tzu'],
+    'Zhuang Zi': ['Zhuangzi', 'Chuang Tzu'],
+    'Confucius': ['Kongzi', 'Kong Qiu'],
+    'Mencius': ['Mengzi'],
+    'Mozi': ['Mo Tzu'],
+    'Augustine of Hippo': ['Saint Augustine', 'St. Augustine', 'Augustinus'],
+    'Thomas Aquinas': ['Aquinas', 'Thomas de Aquino'],
+    'Boethius': ['Anicius Manlius Severinus Boethius'],
+    'Nicholas of Cusa': ['Cusanus'],
+    'Desiderius Erasmus': ['Erasmus'],
+    'Carolus Linnaeus': ['Linnaeus'],
+}
+
+# 성으로 쓰일 때 일반 영어 단어와 겹쳐 오탐이 많은 토큰
+COMMON_WORDS = frozenset({
+    'mill', 'more', 'moore', 'young', 'wood', 'long', 'west', 'price', 'grant', 'hope', 'law',
+    'bell', 'brown', 'green', 'white', 'black', 'gray', 'grey', 'king', 'rich', 'good', 'wise',
+    'hall', 'field', 'stone', 'church', 'bishop', 'abbot', 'major', 'small', 'little', 'noble',
+    'will', 'may', 'rose', 'fox', 'bacon', 'bloom', 'love', 'hand', 'lord', 'lewis', 'james',
+    'john', 'thomas', 'paul', 'peter', 'david', 'george', 'henry', 'charles', 'william',
+    'the', 'and', 'for', 'with', 'from', 'about', 'after', 'also', 'only', 'other',
+})
+
+_TOKEN = re.compile(r"\w+")
+_PARTICLES = {'de', 'del', 'della', 'der', 'des', 'di', 'du', 'la', 'le', 'van', 'von', 'of', 'the', 'ibn', 'bin', 'ben', 'al', 'el', 'st', 'saint'}
+
+
+# 매칭 대상 이름 집합 (build_name_set 결과)
+# names: 사용할 표준 이름 (목록 순서), keys: 미리 소문자로 바꾼 검색 키, ids: 이름 -> 번호
+# ambiguous: 소문자 키가 겹쳐 첫 이름만 남긴 경우 (키 -> 이름 목록), common: 일반 단어와 같아 제외한 이름,
+# skipped: 문자열이 아니거나 너무 짧아 제외한 이름
+NameSet = namedtuple("NameSet", ["names", "keys", "ids", "ambiguous", "common", "skipped"])
+
+
+def tokenize(text):
+    """이름을 대소문자를 유지한 단어 토큰으로 나눕니다 (성 추출용)."""
+    return _TOKEN.findall(text)
+
+
+def load_redirects(filepath=REDIRECTS_FILE):
+    """wiki_api.py가 저장한 리다이렉트 CSV를 '이름 -> 리다이렉트 목록' dict로 로드합니다. 없으면 빈 dict."""
+    if not os.path.exists(filepath):
+        return {}
+    df = pd.read_csv(filepath, encoding='utf-8').dropna(subset=['Name', 'Redirect'])
+    redirects = defaultdict(list)
+    for name, redirect in zip(df['Name'], df['Redirect']):
+        redirects[name].append(redirect)
+    return dict(redirects)
+
+
+def build_name_set(names, min_length=MIN_SUBSTRING_LENGTH):
+    """
+    부분 문자열 매칭용 이름 집합을 한 번만 만듭니다.
+    문자열이 아니거나 짧은 이름 제외, 중복 제거, 소문자 키 계산, 모호하거나 일반 단어인 이름 표시.
+
+    Returns:
+        NameSet
+    """
+    kept, keys, skipped, common = [], [], [], []
+    owners = defaultdict(list)
+    for name in dict.fromkeys(names):
+        if not isinstance(name, str) or len(name.strip()) < min_length:
+            skipped.append(name)
+            continue
+        key = name.lower()
+        owners[key].append(name)
+        if len(owners[key]) > 1:
+            continue
+        # 'Bacon', 'Wood'처럼 이름 전체가 일반 단어 하나면 본문의 일반 단어와 구분할 수 없음
+        if key in COMMON_WORDS:
+            common.append(name)
+            continue
+        kept.append(name)
+        keys.append(key)
+    ambiguous = {key: tuple(group) for key, group in owners.items() if len(group) > 1}
+    return NameSet(
+        names=tuple(kept),
+        keys=tuple(keys),
+        ids={name: i for i, name in enumerate(kept)},
+        ambiguous=ambiguous,
+        common=tuple(common),
+        skipped=tuple(skipped),
+    )
+
+
+class SubstringNameMatcher:
+    """
+    기존 방식(전체 이름의 소문자 부분 문자열 검색) 매처.
+    이름 검사는 build_name_set에서 끝났으므로 페이지마다 본문 소문자 변환 한 번과 키 검색만 합니다.
+    """
+
+    __slots__ = ("names", "ids", "_keys")
+
+    def __init__(self, name_set):
+        """
+        Args:
+            name_set (NameSet): build_name_set 결과
+        """
+        self.names = name_set.names
+        self.ids = name_set.ids
+        self._keys = tuple(enumerate(name_set.keys))
+
+    def find_mentions(self, text, exclude=None):
+        """
+        본문에서 언급된 철학자 이름 목록 (목록 순서)
+
+        Args:
+            exclude (str): 결과에서 뺄 이름 (보통 출발 페이지의 철학자 자신)
+        """
+        text = text.lower()
+        skip = self.ids.get(exclude, -1)
+        return [self.names[i] for i, key in self._keys if key in text and i != skip]
+
+
+def _surname_of(tokens):
+    """전체 이름 토큰에서 성 후보를 고릅니다. 'X of Y', 'X the Younger' 형태나 한 단어 이름은 성이 없는 것으로 봅니다."""
+    lowered = [t.lower() for t in tokens]
+    if len(tokens) < 2 or 'of' in lowered or lowered[-2] == 'the':
+        return None
+    surname = tokens[-1]
+    # 'Jr', 'II' 등 접미사나 이니셜은 성으로 쓰지 않음
+    if len(surname) < MIN_SURNAME_LENGTH or surname.lower() in _PARTICLES or not surname[0].isupper():
+        return None
+    return surname
+
+
+def build_alias_table(names, redirects=None, priors=None):
+    """
+    철학자별 별칭 테이블을 만듭니다.
+
+    Args:
+        names (list): 철학자 표준 이름 목록
+        redirects (dict): 이름 -> 리다이렉트 제목 목록 (load_redirects 결과)
+        priors (dict): 이름 -> In-Degree (모호한 성의 배정에 사용)
+
+    Returns:
+        tuple: (별칭 테이블 dict: 이름 -> [(별칭, 종류)], 모호해서 제외한 성 dict: 성 -> [후보 이름])
+    """
+    redirects = redirects or {}
+    priors = priors or {}
+    index = NameIndex(names)
+    table = {name: [(name, ALIAS_FULL)] for name in names}
+
+    # 인코딩이 깨진 이름은 복구한 표기도 별칭으로 사용 (예: 'SÃ¸ren Kierkegaard' -> 'Søren Kierkegaard')
+    for name in names:
+        repaired = repair_mojibake(name)
+        if repaired != name:
+            table[name].append((repaired, ALIAS_VARIANT))
+
+    # 기존 clean_ai_name 매핑의 영문 표기와 라틴어/관용 표기
+    variant_sources = [(english, [english]) for english in MANUAL_ALIASES.values()] + list(LATINIZED_FORMS.items())
+    for target, variants in variant_sources:
+        match = index.resolve(target)
+        if match.name is None or match.score < 0.85:
+            continue
+        for variant in variants:
+            if variant != match.name:
+                table[match.name].append((variant, ALIAS_VARIANT))
+
+    for name in names:
+        for redirect in redirects.get(name, []):
+            # 'Kant, Immanuel', 'Kant (philosopher)' 같은 색인용 리다이렉트는 본문에 나오지 않으므로 제외
+            if ',' in redirect or '(' in redirect:
+                continue
+            table[name].append((redirect, ALIAS_REDIRECT))
+
+    # 성 별칭: 성을 공유하는 후보가 여럿이면 In-Degree가 압도적인 경우에만 배정
+    full_name_keys = {normalize_key(name) for name in names}
+    surname_owners = defaultdict(list)
+    for name in names:
+        surname = _surname_of(tokenize(name))
+        if surname and surname.lower() not in COMMON_WORDS and normalize_key(surname) not in full_name_keys:
+            surname_owners[surname].append(name)
+
+    ambiguous = {}
+    for surname, owners in surname_owners.items():
+        owners = list(dict.fromkeys(owners))
+        if len(owners) > 1:
+            ranked = sorted(owners, key=lambda n: priors.get(n, 0), reverse=True)
+            top, second = priors.get(ranked[0], 0), priors.get(ranked[1], 0)
+            if top <= 0 or top < DOMINANCE_RATIO * second:
+                ambiguous[surname] = owners
+                continue
+            owners = ranked[:1]
+        table[owners[0]].append((surname, ALIAS_SURNAME))
+
+    return table, ambiguous
+
+
+class MentionMatcher:
+    """
+    별칭 테이블로 만든 한 번 스캔(single-pass) 매처.
+    별칭 검사와 충돌 처리는 생성 시 끝내고, 생성 후에는 튜플로만 보관하여 변경하지 않습니다.
+    """
+
+    __slots__ = ("names", "ids", "_by_first")
+
+    def __init__(self, alias_table):
+        """
+        Args:
+            alias_table (dict): build_alias_table이 만든 이름 -> [(별칭, 종류)]
+        """
+        self.names = tuple(alias_table)
+        self.ids = {name: owner for owner, name in enumerate(self.names)}
+        by_first = defaultdict(list)  # 첫 토큰 -> [(별칭 키, 소유자 번호, 대문자 필요 여부)]
+        seen = {}
+        for owner, name in enumerate(self.names):
+            for alias, kind in alias_table[name]:
+                if not isinstance(alias, str):
+                    continue
+                if kind != ALIAS_FULL and len(alias.strip()) < MIN_ALIAS_LENGTH:
+                    continue
+                key = normalize_key(alias)
+                if not key:
+                    continue
+                # 같은 별칭을 여러 철학자가 공유하면 전체 이름 소유자를 우선하고 (목록 순서와 무관),
+                # 전체 이름끼리 또는 그 외 별칭끼리 겹치면 제외
+                if key in seen:
+                    prev_owner, prev_kind = seen[key]
+                    if (kind == ALIAS_FULL) != (prev_kind == ALIAS_FULL):
+                        if kind == ALIAS_FULL:
+                            seen[key] = (owner, kind)
+                    elif prev_owner != owner:
+                        seen[key] = (None, prev_kind)
+                    continue
+                seen[key] = (owner, kind)
+
+        for key, (owner, kind) in seen.items():
+            if owner is None:
+                continue
+            # 한 단어짜리 성/별칭과 짧은 이름은 본문에서 대문자로 시작할 때만 인정 (일반 단어와 구분)
+            needs_capital = len(key) == 1 and (kind != ALIAS_FULL or len(key[0]) < SHORT_NAME_LENGTH)
+            by_first[key[0]].append((key, owner, needs_capital))
+
+        # 같은 위치에서 가장 긴 별칭부터 확인
+        self._by_first = {
+            first: tuple(sorted(entries, key=lambda entry: len(entry[0]), reverse=True))
+            for first, entries in by_first.items()
+        }
+
+    def _scan(self, tokens, capitalized):
+        """토큰 열을 왼쪽부터 훑으며 (시작 토큰 번호, 토큰 수, 소유자 번호)를 반환합니다."""
+        by_first = self._by_first
+        i = 0
+        n_tokens = len(tokens)
+        while i < n_tokens:
+            entries = by_first.get(tokens[i])
+            step = 1
+            if entries:
+                for key, owner, needs_capital in entries:
+                    size = len(key)
+                    if size > 1 and tuple(tokens[i:i + size]) != key:
+                        continue
+                    if needs_capital and not capitalized[i]:
+                        continue
+                    yield i, size, owner
+                    step = size
+                    break
+            i += step
+
+    def find_mentions(self, text, exclude=None):
+        """
+        본문에서 언급된 철학자 이름 목록을 반환합니다 (목록 순서 기준 정렬).
+        왼쪽부터 가장 긴 별칭을 우선 매칭하므로 'Harriet Taylor Mill' 안의 'Mill'은 따로 세지 않습니다.
+
+        Args:
+            text (str | NormalizedText): 본문 또는 normalize_text로 미리 정규화한 본문
+            exclude (str): 결과에서 뺄 이름 (보통 출발 페이지의 철학자 자신)
+        """
+        if not isinstance(text, NormalizedText):
+            text = normalize_text(text)
+        found = {owner for _, _, owner in self._scan(*text)}
+        found.discard(self.ids.get(exclude))
+        return [self.names[owner] for owner in sorted(found)]
+
+    def find_mention_spans(self, text, exclude=None):
+        """
+        find_mentions와 같은 매칭 결과를 언급 하나하나의 원문 위치와 함께 반환합니다.
+
+        Returns:
+            list: 본문 순서의 (철학자 이름, 시작, 끝) 리스트 (원문 문자 위치)
+        """
+        normalized, spans = normalize_text_with_spans(text)
+        skip = self.ids.get(exclude, -1)
+        return [
+            (self.names[owner], spans[start][0], spans[start + size - 1][1])
+            for start, size, owner in self._scan(*normalized)
+            if owner != skip
+        ]
+
+
+def build_matcher(names, redirects_file=REDIRECTS_FILE):
+    """리다이렉트 CSV와 중심성 priors를 사용해 기본 매처를 생성합니다."""
+    table, ambiguous = build_alias_table(names, redirects=load_redirects(redirects_file), priors=load_priors())
+    return MentionMatcher(table), ambiguous
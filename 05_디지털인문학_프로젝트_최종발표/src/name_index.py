@@ -0,0 +1,345 @@
+"""
+철학자 이름 해석(resolution) 인덱스
+
+AI 생성 목록 등 외부 출처의 철학자 이름을 철학자 목록(philosophers_by_century.csv)의
+표준 이름으로 연결합니다. 수작업 name_map 대신 다음 단계를 순서대로 시도합니다.
+
+1. 정확히 일치 / 수동 별칭 (한국어 표기 등 규칙으로 만들 수 없는 이름)
+2. 정규화 후 일치 (대소문자, 발음 구별 기호, 특수 문자 음역, 깨진 인코딩 복구)
+3. 이니셜 확장 (예: 'G. W. F. Hegel' -> 'G.W.F. Hegel', 'J.-J. Rousseau')
+4. 성(姓) 또는 단일 이름 조회 (예: 'Kant', 'Augustine')
+5. 트라이그램 후보 검색 + 편집 거리 유사도 (오탈자, 표기 변형)
+"""
+import os
+import re
+from collections import defaultdict, namedtuple
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from text_normalize import strip_accents
+
+PHILOSOPHERS_FILE = "data/raw/philosophers_by_century.csv"
+CENTRALITIES_FILE = "data/processed/centralities.csv"
+
+# 해석 결과: query(입력), name(표준 이름 또는 None), method(해석 단계), score(신뢰도 0~1)
+NameMatch = namedtuple("NameMatch", ["query", "name", "method", "score"])
+
+# 단계별 기본 신뢰도
+SCORE_EXACT = 1.0
+SCORE_ALIAS = 1.0
+SCORE_FOLDED = 0.98
+SCORE_INITIALS = 0.9
+SCORE_SURNAME = 0.85
+SCORE_SURNAME_TIEBREAK = 0.6   # 같은 성의 후보가 여럿이라 중심성으로 고른 경우
+FUZZY_THRESHOLD = 0.85         # 트라이그램/편집 거리 유사도 하한
+FUZZY_MAX_CANDIDATES = 20
+
+# 규칙으로 유도할 수 없는 표기(주로 한국어 표기)의 수동 별칭
+# 값은 영문 표기이며, 인덱스 생성 시 다시 표준 이름으로 해석됩니다.
+MANUAL_ALIASES = {
+    '소크라테스': 'Socrates',
+    '플라톤': 'Plato',
+    '아리스토텔레스': 'Aristotle',
+    '공자': 'Confucius',
+    '노자': 'Laozi',
+    '칸트': 'Immanuel Kant',
+    '헤겔': 'Georg Wilhelm Friedrich Hegel',
+    '마르크스': 'Karl Marx',
+    '니체': 'Friedrich Nietzsche',
+    '하이데거': 'Martin Heidegger',
+    '사르트르': 'Jean-Paul Sartre',
+    '데카르트': 'René Descartes',
+    '루소': 'Jean-Jacques Rousseau',
+    '홉스': 'Thomas Hobbes',
+    '존 로크': 'John Locke',
+    '버클리': 'George Berkeley',
+    '흄': 'David Hume',
+    '스피노자': 'Baruch Spinoza',
+    '라이프니츠': 'Gottfried Leibniz',
+    '푸코': 'Michel Foucault',
+    '들뢰즈': 'Gilles Deleuze',
+    '데리다': 'Jacques Derrida',
+    '비트겐슈타인': 'Ludwig Wittgenstein',
+    '러셀': 'Bertrand Russell',
+    '프레게': 'Gottlob Frege',
+    '밀': 'John Stuart Mill',
+    '벤담': 'Jeremy Bentham',
+    '키에르케고르': 'Søren Kierkegaard',
+    '쇼펜하우어': 'Arthur Schopenhauer',
+    '아퀴나스': 'Thomas Aquinas',
+    '아우구스티누스': 'Augustine of Hippo',
+    '이븐 시나': 'Avicenna',
+    '이븐 루시드': 'Averroes',
+    '모이세 마이모니데스': 'Moses Maimonides',
+    '알 키디': 'Al-Kindi',
+    '나가르주나': 'Nagarjuna',
+    '찬드라키르티': 'Candrakīrti',
+    '장자': 'Zhuangzi',
+    '한나 아렌트': 'Hannah Arendt',
+    '시몬 드 보부아르': 'Simone de Beauvoir',
+    '주디스 버틀러': 'Judith Butler',
+    '찰스 퍼스': 'Charles Sanders Peirce',
+    '윌리엄 제임스': 'William James',
+    '존 듀이': 'John Dewey',
+    '리차드 로티': 'Richard Rorty',
+    '가다머': 'Hans-Georg Gadamer',
+    '칼 포퍼': 'Karl Popper',
+    '토마스 쿤': 'Thomas Kuhn',
+    '아이리스 머독': 'Iris Murdoch',
+    '코넬 웨스트': 'Cornel West',
+}
+
+# 이름 키에서는 아포스트로피도 제거 ("Ma'shar" -> 'mashar')
+_TRANSLITERATION = str.maketrans({'’': '', "'": ''})
+_NON_WORD = re.compile(r"[^\w]+")
+# UTF-8 바이트를 latin1/cp1252로 잘못 읽었을 때 나타나는 문자 (예: 'SÃ¸ren')
+_MOJIBAKE_HINT = re.compile(r"[ÃÂÅÄÆÐÑ][\x80-\xbf€‚ƒ„…†‡ˆ‰Š‹ŒŽ‘’“”•–—˜™š›œžŸ¡-¿]")
+# 성 조회 시 건너뛰는 이름 접두어/연결어
+_PARTICLES = {'de', 'del', 'della', 'der', 'des', 'di', 'du', 'la', 'le', 'van', 'von', 'of', 'the', 'ibn', 'bin', 'ben', 'al', 'el'}
+
+
+def repair_mojibake(text):
+    """UTF-8을 latin1/cp1252로 잘못 디코딩해 깨진 문자열을 복구합니다. 복구할 수 없으면 그대로 반환합니다."""
+    if not _MOJIBAKE_HINT.search(text):
+        return text
+    for encoding in ('cp1252', 'latin1'):
+        try:
+            return text.encode(encoding).decode('utf-8')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            continue
+    return text
+
+
+def fold_name(name):
+    """
+    비교용 이름 키를 만듭니다.
+    깨진 인코딩 복구 -> 특수 문자 음역 -> NFKD 분해 후 결합 기호 제거 -> casefold -> 구두점을 공백으로.
+    """
+    if not isinstance(name, str):
+        return ""
+    text = strip_accents(repair_mojibake(name).translate(_TRANSLITERATION))
+    text = _NON_WORD.sub(" ", text.casefold()).replace("_", " ")
+    return " ".join(text.split())
+
+
+def extract_parenthesized(name):
+    """'소크라테스 (Socrates)' 형태에서 괄호 안의 이름을, 없으면 원래 이름을 반환합니다."""
+    match = re.search(r'\((.*?)\)', name)
+    return match.group(1).strip() if match else name.strip()
+
+
+def trigrams(key):
+    """앞뒤 공백을 붙인 문자 트라이그램 집합"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    표준 이름 목록 위에 만든 이름 해석 인덱스.
+    생성 시 한 번만 정규화/색인하므로, 이후 resolve 호출은 딕셔너리 조회 위주로 동작합니다.
+    """
+
+    def __init__(self, canonical_names, priors=None, aliases=None):
+        """
+        Args:
+            canonical_names (iterable): 표준 이름 목록
+            priors (dict): 이름별 우선순위 점수 (예: In-Degree). 같은 성의 후보가 여럿일 때 사용
+            aliases (dict): 별칭 -> 표준 이름(또는 표준 이름으로 해석 가능한 표기)
+        """
+        self.priors = priors or {}
+        self.names = []
+        self.exact = {}
+        self.folded = {}
+        self.by_surname = defaultdict(list)
+        self.by_token = defaultdict(list)
+        self.by_trigram = defaultdict(set)
+        self._tokens = []
+        self._keys = []
+
+        for name in canonical_names:
+            if not isinstance(name, str) or not name.strip() or name in self.exact:
+                continue
+            idx = len(self.names)
+            key = fold_name(name)
+            tokens = key.split()
+            self.names.append(name)
+            self._keys.append(key)
+            self._tokens.append(tokens)
+            self.exact[name] = idx
+            # 정규화 키가 겹치면 먼저 나온(목록 순서상 앞선) 이름을 유지
+            self.folded.setdefault(key, idx)
+            if tokens:
+                surname = self._surname(tokens)
+                self.by_surname[surname].append(idx)
+                for token in set(tokens):
+                    self.by_token[token].append(idx)
+            for gram in trigrams(key):
+                self.by_trigram[gram].add(idx)
+
+        # 별칭은 표준 이름 색인이 끝난 뒤 등록 (별칭 값 자체도 해석 규칙으로 표준 이름에 연결)
+        self.aliases = {}
+        for alias, target in (aliases or {}).items():
+            match = self.resolve(target)
+            if match.name is not None:
+                self.aliases[alias] = match.name
+                self.aliases.setdefault(fold_name(alias), match.name)
+
+    @staticmethod
+    def _surname(tokens):
+        """마지막 토큰을 성으로 사용 (단, 'Augustine of Hippo'처럼 'of'가 있으면 앞부분)"""
+        if 'of' in tokens[1:]:
+            return tokens[tokens.index('of', 1) - 1]
+        return tokens[-1]
+
+    def _pick(self, candidates):
+        """후보가 하나면 그대로, 여럿이면 priors가 가장 큰 이름을 고르고 동률 여부를 함께 반환합니다."""
+        if len(candidates) == 1:
+            return candidates[0], False
+        ranked = sorted(candidates, key=lambda i: self.priors.get(self.names[i], 0), reverse=True)
+        best = ranked[0]
+        if self.priors.get(self.names[best], 0) <= self.priors.get(self.names[ranked[1]], 0):
+            return None, True
+        return best, True
+
+    def _match_initials(self, query_tokens, candidate_tokens):
+        """
+        질의의 이름 부분(성 제외)이 후보 이름 토큰의 부분열로 대응되는지 확인합니다.
+        한 글자 토큰은 이니셜로 간주합니다. (예: ['g', 'w', 'f'] vs ['georg', 'wilhelm', 'friedrich'])
+        """
+        pos = 0
+        for token in query_tokens:
+            while pos < len(candidate_tokens):
+                candidate = candidate_tokens[pos]
+                pos += 1
+                if candidate == token or (len(token) == 1 and candidate.startswith(token)):
+                    break
+                # 후보 쪽 토큰이 이니셜인 경우 (예: 'G.W.F. Hegel')
+                if len(candidate) == 1 and token.startswith(candidate):
+                    break
+            else:
+                return False
+        return True
+
+    def resolve(self, query):
+        """
+        이름 하나를 표준 이름으로 해석합니다.
+
+        Returns:
+            NameMatch: 해석 실패 시 name=None, method='unresolved'
+        """
+        if not isinstance(query, str) or not query.strip():
+            return NameMatch(query, None, 'unresolved', 0.0)
+
+        raw = query.strip()
+        if raw in self.exact:
+            return NameMatch(query, raw, 'exact', SCORE_EXACT)
+        if raw in self.aliases:
+            return NameMatch(query, self.aliases[raw], 'alias', SCORE_ALIAS)
+
+        # 괄호 안의 영문 표기를 우선 사용하고, 괄호 앞의 표기는 별칭 조회에 사용
+        inner = extract_parenthesized(raw)
+        outer = raw.split('(')[0].strip()
+        for variant in dict.fromkeys([inner, outer]):
+            if variant in self.exact:
+                return NameMatch(query, variant, 'exact', SCORE_EXACT)
+            if variant in self.aliases:
+                return NameMatch(query, self.aliases[variant], 'alias', SCORE_ALIAS)
+
+        key = fold_name(inner)
+        if not key:
+            return NameMatch(query, None, 'unresolved', 0.0)
+        if key in self.folded:
+            return NameMatch(query, self.names[self.folded[key]], 'folded', SCORE_FOLDED)
+        if key in self.aliases:
+            return NameMatch(query, self.aliases[key], 'alias', SCORE_ALIAS)
+
+        tokens = key.split()
+        surname_pos = tokens.index('of', 1) - 1 if 'of' in tokens[1:] else len(tokens) - 1
+        surname = tokens[surname_pos]
+
+        # 이니셜 확장: 같은 성을 가진 후보 중 이름 부분이 이니셜/부분열로 대응되는 이름
+        if len(tokens) > 1:
+            given = [t for t in tokens[:surname_pos] if t not in _PARTICLES]
+            candidates = [i for i in self.by_surname.get(surname, []) if self._match_initials(given, self._tokens[i])]
+            if candidates:
+                idx, tied = self._pick(candidates)
+                if idx is not None:
+                    score = SCORE_SURNAME_TIEBREAK if tied else SCORE_INITIALS
+                    return NameMatch(query, self.names[idx], 'initials', score)
+
+        # 단일 이름 조회: 성이 일치하는 후보, 없으면 이름 어디에든 포함된 후보
+        if len(tokens) == 1:
+            candidates = self.by_surname.get(surname) or self.by_token.get(surname, [])
+            if candidates:
+                idx, tied = self._pick(candidates)
+                if idx is not None:
+                    score = SCORE_SURNAME_TIEBREAK if tied else SCORE_SURNAME
+                    return NameMatch(query, self.names[idx], 'surname', score)
+
+        return self._fuzzy(query, key)
+
+    def _fuzzy(self, query, key):
+        """트라이그램을 많이 공유하는 후보만 추린 뒤 편집 거리 유사도로 최종 판정합니다."""
+        counts = defaultdict(int)
+        for gram in trigrams(key):
+            for idx in self.by_trigram.get(gram, ()):
+                counts[idx] += 1
+        if not counts:
+            return NameMatch(query, None, 'unresolved', 0.0)
+
+        single_token = ' ' not in key
+        best_idx, best_score = None, 0.0
+        for idx, _ in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:FUZZY_MAX_CANDIDATES]:
+            score = SequenceMatcher(None, key, self._keys[idx]).ratio()
+            # 단일 토큰 질의(예: 'Nietzche')는 후보의 성과도 비교
+            if single_token and self._tokens[idx]:
+                surname = self._surname(self._tokens[idx])
+                score = max(score, SequenceMatcher(None, key, surname).ratio())
+            if score > best_score:
+                best_idx, best_score = idx, score
+        if best_score >= FUZZY_THRESHOLD:
+            return NameMatch(query, self.names[best_idx], 'fuzzy', round(best_score * SCORE_FOLDED, 4))
+        return NameMatch(query, None, 'unresolved', round(best_score, 4))
+
+    def resolve_many(self, queries):
+        """
+        여러 이름을 해석합니다.
+
+        Returns:
+            tuple: (NameMatch 목록, 해석되지 않은 입력 목록)
+        """
+        matches = [self.resolve(q) for q in queries]
+        unresolved = [m.query for m in matches if m.name is None]
+        return matches, unresolved
+
+
+def load_canonical_names(filepath=PHILOSOPHERS_FILE):
+    """철학자 목록 CSV에서 표준 이름 목록을 로드합니다. (02 단계와 같은 인코딩 순서로 읽어 이름이 일치하도록 함)"""
+    encodings = ['utf-8', 'cp1252', 'latin1', 'iso-8859-1']
+    for encoding in encodings:
+        try:
+            df = pd.read_csv(filepath, encoding=encoding)
+            return df['Name'].dropna().drop_duplicates().tolist()
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"지원되는 인코딩으로 파일을 읽을 수 없습니다: {filepath}")
+
+
+def load_priors(filepath=CENTRALITIES_FILE):
+    """동명 후보 선택에 사용할 In-Degree 값을 로드합니다. 파일이 없으면 빈 dict를 반환합니다."""
+    if not os.path.exists(filepath):
+        return {}
+    df = pd.read_csv(filepath, encoding='utf-8')
+    column = 'Calculated_In_Degree_Count' if 'Calculated_In_Degree_Count' in df.columns else 'In-Degree Centrality'
+    return dict(zip(df['Name'], df[column]))
+
+
+def build_default_index(philosophers_file=PHILOSOPHERS_FILE, centralities_file=CENTRALITIES_FILE):
+    """철학자 목록 + 중심성 priors + 수동 별칭으로 기본 인덱스를 생성합니다."""
+    return NameIndex(
+        load_canonical_names(philosophers_file),
+        priors=load_priors(centralities_file),
+        aliases=MANUAL_ALIASES,
+    )
@@ -0,0 +1,221 @@
+"""
+단계별 실행 시간 측정과 실행 보고서
+
+- RunReport.stage(이름): 단계 시간 측정 컨텍스트 (중첩하면 '바깥/안쪽' 경로로 기록, 같은 이름은 누적)
+- RunReport.count(이름, n): 처리 건수 카운터
+- RunReport.observe(이름, 초): 페이지별 지연 시간 등의 분포 (로그 구간 히스토그램 + 표본 백분위수)
+- profile="cprofile": 실행 전체를 cProfile로 기록하여 누적 시간 상위 함수를 보고서에 포함 (.prof 파일도 저장)
+- profile="tracemalloc": 단계별 최대 메모리 할당량을 함께 기록
+
+finish()가 data/reports/<이름>_<시각>.json(구조화된 결과)과 .txt(요약)를 저장합니다.
+측정을 쓰지 않는 함수 인자 기본값에는 아무것도 하지 않는 NULL_REPORT를 사용합니다.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+REPORT_DIR = "data/reports"
+
+# 지연 시간 히스토그램 구간 상한 (밀리초, 마지막 구간은 그 이상)
+HISTOGRAM_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+HISTOGRAM_SAMPLE_SIZE = 2000  # 백분위수 계산용 표본 크기 (저수지 표본 추출)
+PROFILE_TOP_N = 25
+
+
+class Histogram:
+    """로그 구간별 건수는 모든 관측값으로, 백분위수는 고정 크기 표본으로 계산합니다."""
+
+    def __init__(self, sample_size=HISTOGRAM_SAMPLE_SIZE, seed=0):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.n = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._sample = []
+        self._sample_size = sample_size
+        self._rng = random.Random(seed)
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        bucket = 0
+        while bucket < len(HISTOGRAM_BOUNDS_MS) and ms > HISTOGRAM_BOUNDS_MS[bucket]:
+            bucket += 1
+        self.counts[bucket] += 1
+        self.n += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if len(self._sample) < self._sample_size:
+            self._sample.append(seconds)
+        else:
+            k = self._rng.randrange(self.n)
+            if k < self._sample_size:
+                self._sample[k] = seconds
+
+    def percentile(self, q):
+        if not self._sample:
+            return 0.0
+        ordered = sorted(self._sample)
+        return ordered[min(int(q / 100 * len(ordered)), len(ordered) - 1)]
+
+    def to_dict(self):
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}ms"]
+        return {
+            "count": self.n,
+            "mean_ms": round(self.total / self.n * 1000, 3) if self.n else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p90_ms": round(self.percentile(90) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class RunReport:
+    """스크립트 한 번 실행의 단계별 시간, 카운터, 분포를 모아 보고서로 저장합니다."""
+
+    def __init__(self, name, profile=None, report_dir=REPORT_DIR):
+        """
+        Args:
+            name (str): 보고서 이름 (보통 스크립트 이름)
+            profile (str): None, "cprofile", "tracemalloc"
+        """
+        self.name = name
+        self.profile = profile
+        self.report_dir = report_dir
+        self.stages = {}      # 경로 -> {"seconds", "calls", "peak_kb"}
+        self.counters = {}
+        self.histograms = {}
+        self._stack = []      # [경로, 시작 시각, 하위 단계 포함 최대 메모리]
+        self._profiler = None
+        self._started = None
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._started_at = datetime.now()
+        if self.profile == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.profile == "tracemalloc":
+            tracemalloc.start()
+        return self
+
+    @contextmanager
+    def stage(self, name):
+        path = f"{self._stack[-1][0]}/{name}" if self._stack else name
+        tracing = tracemalloc.is_tracing() and self.profile == "tracemalloc"
+        if tracing:
+            # 안쪽 단계가 최대값을 초기화하기 전에 바깥 단계의 최대값을 보존
+            if self._stack:
+                self._stack[-1][2] = max(self._stack[-1][2], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame = [path, time.perf_counter(), 0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            stats = self.stages.setdefault(path, {"seconds": 0.0, "calls": 0})
+            stats["seconds"] += time.perf_counter() - frame[1]
+            stats["calls"] += 1
+            if tracing:
+                peak = max(tracemalloc.get_traced_memory()[1], frame[2])
+                stats["peak_kb"] = max(stats.get("peak_kb", 0), peak // 1024)
+                if self._stack:
+                    self._stack[-1][2] = max(self._stack[-1][2], peak)
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name, seconds):
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        self.histograms[name].add(seconds)
+
+    def to_dict(self):
+        total = time.perf_counter() - self._started if self._started is not None else 0.0
+        return {
+            "name": self.name,
+            "started_at": self._started_at.strftime("%Y-%m-%d %H:%M:%S") if self._started is not None else None,
+            "total_seconds": round(total, 3),
+            "profile": self.profile,
+            "stages": {
+                path: {**stats, "seconds": round(stats["seconds"], 4)} for path, stats in self.stages.items()
+            },
+            "counters": dict(self.counters),
+            "histograms": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+        }
+
+    def summary(self, data=None, profile_text=""):
+        """사람이 읽는 요약 텍스트"""
+        data = data or self.to_dict()
+        total = data["total_seconds"] or 1.0
+        lines = [f"실행 보고서: {data['name']} ({data['started_at']}, 총 {data['total_seconds']:.2f}초)", ""]
+        has_peak = any("peak_kb" in stats for stats in data["stages"].values())
+        lines.append(f"{'단계':<40}{'시간(초)':>10}{'비율':>8}{'호출':>10}{'평균(ms)':>12}"
+                     + (f"{'최대 할당(KB)':>16}" if has_peak else ""))
+        for path, stats in data["stages"].items():
+            mean_ms = stats["seconds"] / stats["calls"] * 1000
+            peak = f"{stats['peak_kb']:>16}" if "peak_kb" in stats else ""
+            lines.append(
+                f"{'  ' * path.count('/') + path.rsplit('/', 1)[-1]:<40}{stats['seconds']:>10.2f}"
+                f"{stats['seconds'] / total:>8.1%}{stats['calls']:>10}{mean_ms:>12.2f}{peak}"
+            )
+        if data["counters"]:
+            lines += ["", "카운터:"] + [f"  {name}: {value}" for name, value in data["counters"].items()]
+        for name, histogram in data["histograms"].items():
+            lines += ["", f"분포 {name}: {histogram['count']}건, 평균 {histogram['mean_ms']}ms, "
+                          f"p50 {histogram['p50_ms']}ms, p90 {histogram['p90_ms']}ms, p99 {histogram['p99_ms']}ms"]
+            peak_count = max(histogram["buckets"].values()) or 1
+            for label, count in histogram["buckets"].items():
+                if count:
+                    lines.append(f"  {label:>9} {'#' * max(1, round(40 * count / peak_count))} {count}")
+        if profile_text:
+            lines += ["", f"cProfile 누적 시간 상위 {PROFILE_TOP_N}개:", profile_text]
+        return "\n".join(lines)
+
+    def finish(self):
+        """측정을 끝내고 JSON과 요약 텍스트를 저장합니다. Returns: (JSON 경로, 텍스트 경로)"""
+        data = self.to_dict()
+        os.makedirs(self.report_dir, exist_ok=True)
+        prefix = os.path.join(self.report_dir, f"{self.name}_{self._started_at.strftime('%Y%m%d_%H%M%S')}")
+
+        profile_text = ""
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(f"{prefix}.prof")
+            stream = io.StringIO()
+            pstats.Stats(self._profiler, stream=stream).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+            profile_text = stream.getvalue()
+            data["profile_file"] = f"{prefix}.prof"
+        elif self.profile == "tracemalloc" and tracemalloc.is_tracing():
+            data["peak_traced_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+            tracemalloc.stop()
+
+        with open(f"{prefix}.json", "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(f"{prefix}.txt", "w", encoding="utf-8") as f:
+            f.write(self.summary(data, profile_text))
+        return f"{prefix}.json", f"{prefix}.txt"
+
+
+class _NullReport:
+    """측정하지 않을 때 쓰는 빈 보고서 (호출 비용만 있고 기록하지 않음)"""
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+    def count(self, name, n=1):
+        pass
+
+    def observe(self, name, seconds):
+        pass
+
+
+NULL_REPORT = _NullReport()
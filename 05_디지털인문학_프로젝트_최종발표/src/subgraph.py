@@ -0,0 +1,231 @@
+"""
+정수 ID CSR 그래프와 유도 부분 그래프 추출 (Gephi 뷰 생성용)
+
+철학자 이름을 0부터의 정수 ID로 바꾸고 나가는/들어오는 엣지를 CSR(행 시작 위치 + 이웃 배열)로 저장합니다.
+부분 그래프는 선택한 노드의 CSR 구간만 모아서 만들므로, 전체 엣지 표를 훑지 않고
+선택한 노드의 차수 합에 비례하는 시간에 엣지를 찾습니다.
+
+노드 선택 (select_nodes, 조건을 함께 쓰면 교집합)
+- names: 이름 목록 그대로
+- top: (열 이름, N) 노드 표의 임의 열(표준/시간 보정 중심성, PageRank 등) 기준 상위 N명
+- ego: (중심 이름 목록, k) 중심에서 k단계 이내의 이웃 (direction: "out", "in", "both")
+- century: 세기 목록 (노드 표의 Century 열)
+"""
+import numpy as np
+import pandas as pd
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_TOL = 1e-10
+PAGERANK_MAX_ITER = 200
+
+
+def _gather(indptr, nodes):
+    """노드들의 CSR 구간 위치를 한 배열로 모읍니다 (구간 길이 합에 비례)."""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.array([], dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(total)
+
+
+def _csr(rows, cols, n):
+    """(행 시작 위치, 열 배열, 원래 엣지 위치) — 같은 행 안에서는 원래 엣지 순서 유지"""
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order], order
+
+
+class CsrGraph:
+    """이름 <-> 정수 ID 색인과 나가는/들어오는 엣지 CSR을 가진 방향 그래프"""
+
+    def __init__(self, names, sources, targets, weights=None):
+        """
+        Args:
+            names (array-like): 정수 ID 순서의 노드 이름
+            sources, targets (np.ndarray): 엣지 끝점의 정수 ID
+            weights (np.ndarray): 엣지 가중치 (None이면 모두 1)
+        """
+        self.names = np.asarray(names, dtype=object)
+        self.index = pd.Index(self.names)
+        n = len(self.names)
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.weights = np.ones(len(self.sources), dtype=np.int64) if weights is None else np.asarray(weights)
+        self.out_indptr, self.out_indices, self.out_edges = _csr(self.sources, self.targets, n)
+        self.in_indptr, self.in_indices, self.in_edges = _csr(self.targets, self.sources, n)
+
+    @classmethod
+    def from_edge_frame(cls, edges, names=None):
+        """
+        Source/Target(/Weight) 엣지 표로 그래프를 만듭니다.
+
+        Args:
+            names (array-like): 노드 순서 (엣지에만 나오는 이름은 뒤에 추가)
+        """
+        edges = edges.dropna(subset=["Source", "Target"])
+        known = pd.Index(pd.unique(pd.Series(names, dtype=object))) if names is not None else pd.Index([])
+        endpoints = pd.unique(pd.concat([edges["Source"], edges["Target"]], ignore_index=True))
+        extra = endpoints[~pd.Index(endpoints).isin(known)]
+        index = known.append(pd.Index(extra))
+        weights = edges["Weight"].fillna(1).to_numpy() if "Weight" in edges.columns else None
+        return cls(index, index.get_indexer(edges["Source"]), index.get_indexer(edges["Target"]), weights)
+
+    @property
+    def n_nodes(self):
+        return len(self.names)
+
+    @property
+    def n_edges(self):
+        return len(self.sources)
+
+    def ids(self, names):
+        """이름 -> 정수 ID (그래프에 없는 이름은 경고 후 제외)"""
+        ids = self.index.get_indexer(pd.Index(names))
+        if (ids < 0).any():
+            missing = [name for name, i in zip(names, ids) if i < 0]
+            print(f"경고: 그래프에 없는 이름 {len(missing)}개는 제외합니다: {missing[:5]}")
+        return ids[ids >= 0]
+
+    def out_degree(self):
+        return np.diff(self.out_indptr)
+
+    def in_degree(self):
+        return np.diff(self.in_indptr)
+
+    def neighbors(self, nodes, direction="both"):
+        """노드들의 이웃 ID (중복 제거)"""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        found = []
+        if direction in ("out", "both"):
+            found.append(self.out_indices[_gather(self.out_indptr, nodes)])
+        if direction in ("in", "both"):
+            found.append(self.in_indices[_gather(self.in_indptr, nodes)])
+        return np.unique(np.concatenate(found)) if found else np.array([], dtype=np.int64)
+
+    def ego(self, centers, k=1, direction="both"):
+        """
+        중심 노드에서 k단계 이내의 노드 ID (너비 우선, 단계마다 새로 도달한 노드만 확장)
+
+        Returns:
+            np.ndarray: 정렬된 노드 ID
+        """
+        visited = np.zeros(self.n_nodes, dtype=bool)
+        frontier = np.unique(np.asarray(centers, dtype=np.int64))
+        visited[frontier] = True
+        for _ in range(k):
+            if not len(frontier):
+                break
+            reached = self.neighbors(frontier, direction)
+            frontier = reached[~visited[reached]]
+            visited[frontier] = True
+        return np.flatnonzero(visited)
+
+    def induced_edges(self, nodes):
+        """
+        노드 집합 안의 엣지 위치 (원래 엣지 순서로 정렬)
+        선택한 노드의 나가는 엣지만 확인하므로 선택한 노드의 나가는 차수 합에 비례합니다.
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        member = np.zeros(self.n_nodes, dtype=bool)
+        member[nodes] = True
+        positions = _gather(self.out_indptr, nodes)
+        edges = self.out_edges[positions[member[self.out_indices[positions]]]]
+        return np.sort(edges)
+
+    def subgraph(self, nodes):
+        """
+        유도 부분 그래프 (새 정수 ID는 nodes 순서)
+
+        Returns:
+            tuple: (CsrGraph, 원래 그래프의 엣지 위치)
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        edges = self.induced_edges(nodes)
+        local = np.full(self.n_nodes, -1, dtype=np.int64)
+        local[nodes] = np.arange(len(nodes))
+        graph = CsrGraph(self.names[nodes], local[self.sources[edges]], local[self.targets[edges]], self.weights[edges])
+        return graph, edges
+
+    def pagerank(self, damping=PAGERANK_DAMPING, tol=PAGERANK_TOL, max_iter=PAGERANK_MAX_ITER):
+        """
+        가중치 PageRank (거듭제곱법, 나가는 엣지가 없는 노드의 점수는 모든 노드에 고르게 나눔)
+
+        Returns:
+            np.ndarray: 노드 ID 순서의 점수 (합 1)
+        """
+        n = self.n_nodes
+        if n == 0:
+            return np.array([])
+        weights = self.weights.astype(float)
+        out_weight = np.bincount(self.sources, weights=weights, minlength=n)
+        dangling = out_weight == 0
+        share = np.divide(weights, out_weight[self.sources], out=np.zeros_like(weights),
+                          where=out_weight[self.sources] > 0)
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            spread = np.bincount(self.targets, weights=rank[self.sources] * share, minlength=n)
+            updated = damping * (spread + rank[dangling].sum() / n) + (1 - damping) / n
+            if np.abs(updated - rank).sum() < tol * n:
+                return updated
+            rank = updated
+        print(f"경고: PageRank가 {max_iter}회 반복 안에 수렴하지 않았습니다.")
+        return rank
+
+
+def align_table(graph, table, id_column="Id"):
+    """노드 표를 그래프의 정수 ID 순서로 맞춥니다 (표에 없는 노드는 Id만 있는 행)."""
+    table = table.dropna(subset=[id_column]).drop_duplicates(subset=[id_column]).set_index(id_column)
+    return table.reindex(pd.Index(graph.names, name=id_column)).reset_index()
+
+
+def select_nodes(graph, table, names=None, top=None, ego=None, century=None, direction="both"):
+    """
+    조건에 맞는 노드 ID (모든 조건의 교집합, 정렬됨)
+
+    Args:
+        table (pd.DataFrame): align_table로 그래프 순서에 맞춘 노드 표
+        names (list): 이름 목록
+        top (tuple): (열 이름, N) — century가 있으면 그 세기 안에서 상위 N명
+        ego (tuple): (중심 이름 목록, k)
+        century (list): 세기 이름 목록
+
+    Returns:
+        np.ndarray: 노드 ID
+    """
+    mask = np.ones(graph.n_nodes, dtype=bool)
+    if century is not None:
+        mask &= table["Century"].isin(century).to_numpy()
+    if names is not None:
+        chosen = np.zeros(graph.n_nodes, dtype=bool)
+        chosen[graph.ids(names)] = True
+        mask &= chosen
+    if ego is not None:
+        centers, k = ego
+        chosen = np.zeros(graph.n_nodes, dtype=bool)
+        chosen[graph.ego(graph.ids(centers), k, direction)] = True
+        mask &= chosen
+    if top is not None:
+        column, n = top
+        if column not in table.columns:
+            # 값이 모두 비어 있어 로드할 때 빠진 열 등: 빈 선택
+            print(f"경고: 노드 표에 '{column}' 열이 없어 선택되는 노드가 없습니다.")
+            return np.array([], dtype=np.int64)
+        scores = pd.to_numeric(table[column], errors="coerce").to_numpy(dtype=float)
+        candidates = np.flatnonzero(mask & ~np.isnan(scores))
+        # 점수 내림차순, 동점은 노드 순서 (sort_values(...).head(N)과 같은 선택)
+        order = np.lexsort((candidates, -scores[candidates]))
+        mask = np.zeros(graph.n_nodes, dtype=bool)
+        mask[candidates[order[:n]]] = True
+    return np.flatnonzero(mask)
+
+
+def edge_frame(graph, edges):
+    """엣지 위치 배열 -> 엣지 표 (Source, Target, Weight)"""
+    return pd.DataFrame({
+        "Source": graph.names[graph.sources[edges]],
+        "Target": graph.names[graph.targets[edges]],
+        "Weight": graph.weights[edges],
+    })
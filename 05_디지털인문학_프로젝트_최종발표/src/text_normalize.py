@@ -0,0 +1,71 @@
+"""
+페이지 본문 정규화
+
+페이지마다 한 번만 casefold, NFKD 분해 후 결합 기호 제거, 토큰화를 수행합니다.
+이름 매칭은 이 토큰 열 위에서 이루어지므로 단어 경계가 자동으로 지켜지고
+('Ion'이 'religion'에 걸리지 않음), 'Søren'과 'Soren'처럼 발음 구별 기호만 다른 표기도 같은 토큰이 됩니다.
+"""
+import re
+import unicodedata
+from collections import namedtuple
+
+# NFKD 분해로 기본 문자가 남지 않는 라틴 특수 문자의 음역
+LETTER_TRANSLITERATION = {
+    'ø': 'o', 'Ø': 'O', 'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE',
+    'ß': 'ss', 'đ': 'd', 'Đ': 'D', 'ł': 'l', 'Ł': 'L', 'þ': 'th', 'Þ': 'TH',
+    'ð': 'd', 'Ð': 'D', 'ı': 'i', 'ʿ': '', 'ʾ': '',
+}
+_LETTER_TABLE = str.maketrans(LETTER_TRANSLITERATION)
+# 결합 기호 블록 (문자마다 unicodedata.combining을 호출하는 것보다 빠름)
+_COMBINING_CLASS = r"[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]"
+_COMBINING = re.compile(_COMBINING_CLASS + "+")
+_TOKEN = re.compile(r"[^\W_]+")
+# 원문 위치를 구할 때의 토큰: 분해형으로 저장된 결합 기호('e\u0301')도 토큰 안에 포함
+_SPAN_TOKEN = re.compile(r"(?:[^\W_]|" + _COMBINING_CLASS + r")+")
+
+# 정규화된 페이지: tokens(비교용 토큰), capitalized(원문에서 대문자로 시작했는지 여부)
+NormalizedText = namedtuple("NormalizedText", ["tokens", "capitalized"])
+
+
+def strip_accents(text):
+    """특수 문자 음역 + NFKD 분해 후 결합 기호를 제거합니다. ASCII 문자열은 그대로 반환합니다."""
+    if text.isascii():
+        return text
+    text = unicodedata.normalize('NFKD', text.translate(_LETTER_TABLE))
+    return _COMBINING.sub("", text)
+
+
+def normalize_text(text):
+    """
+    본문을 비교용 토큰 열로 변환합니다.
+
+    Returns:
+        NormalizedText: casefold된 토큰 리스트와 각 토큰의 원문 대문자 여부
+    """
+    raw_tokens = _TOKEN.findall(strip_accents(text))
+    return NormalizedText(
+        [token.casefold() for token in raw_tokens],
+        [token[0].isupper() for token in raw_tokens],
+    )
+
+
+def normalize_text_with_spans(text):
+    """
+    normalize_text와 같은 토큰 열과 함께 각 토큰의 원문 위치를 반환합니다 (멘션 위치 색인용).
+    토큰 단위로 정규화하므로 페이지 전체를 한 번에 정규화하는 normalize_text보다 느립니다.
+
+    Returns:
+        tuple: (NormalizedText, [(시작, 끝)] 원문 문자 위치 리스트)
+    """
+    tokens, capitalized, spans = [], [], []
+    for match in _SPAN_TOKEN.finditer(text):
+        for token in _TOKEN.findall(strip_accents(match.group())):
+            tokens.append(token.casefold())
+            capitalized.append(token[0].isupper())
+            spans.append(match.span())
+    return NormalizedText(tokens, capitalized), spans
+
+
+def normalize_key(text):
+    """별칭 등 짧은 문자열을 매칭 키(토큰 튜플)로 변환합니다."""
+    return tuple(normalize_text(text).tokens)
@@ -0,0 +1,254 @@
+"""
+MediaWiki API(action=query) 호출 도구
+
+여러 제목을 '|'로 묶어 한 번에 요청하고(최대 50개), 응답의 'continue' 값을 따라
+나머지 결과를 이어서 받습니다. HTML 대신 JSON 응답을 사용하므로 페이지 파싱이 필요 없습니다.
+
+- fetch_redirects: 문서별 리다이렉트 제목 (별칭 테이블용)
+- fetch_pages: 문서 위키텍스트 + 문서 링크 + 리비전 ID를 가져와 PageCache에 저장
+- fetch_latest_revids: 문서 본문 없이 최신 리비전 ID만 조회 (변경 문서 확인용)
+- fetch_entity_links: 위키데이터 항목 ID와 다른 언어판 문서 제목 (다국어 샤드용)
+
+api_url을 바꾸면 로컬 모의(mock) API 서버로도 동작합니다.
+"""
+import os
+import time
+
+import pandas as pd
+import requests
+
+from wiki_pages import PageCache, normalize_title
+
+API_URL = "https://en.wikipedia.org/w/api.php"
+API_URL_TEMPLATE = "https://{lang}.wikipedia.org/w/api.php"
+HEADERS = {
+    "User-Agent": "Digital_Humanities philosopher network research (https://github.com/IISweetHeartII/Digital_Humanities)"
+}
+MAX_TITLES_PER_REQUEST = 50  # 일반 사용자 기준 API 제한
+REQUEST_DELAY = 0.5          # 요청 간 대기 시간 (초)
+TIMEOUT = 30
+
+PHILOSOPHERS_FILE = "data/raw/philosophers_by_century.csv"
+REDIRECTS_FILE = "data/raw/redirects.csv"
+
+
+def api_url_for(lang):
+    """언어 코드('de', 'ko' 등)에 해당하는 위키피디아 API 주소"""
+    return API_URL_TEMPLATE.format(lang=lang)
+
+
+def chunked(items, size=MAX_TITLES_PER_REQUEST):
+    """리스트를 size 크기 묶음으로 나눕니다."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def query_titles(session, titles, params, api_url=API_URL):
+    """
+    제목 묶음 하나에 대해 action=query를 호출하고 'continue'가 없을 때까지 이어서 요청합니다.
+
+    Returns:
+        tuple: (페이지 dict 목록, 입력 제목 -> 최종 제목 매핑, 요청 수)
+    """
+    base_params = {"action": "query", "format": "json", "formatversion": 2, "redirects": 1, "titles": "|".join(titles)}
+    base_params.update(params)
+
+    pages = {}
+    title_map = {title: title for title in titles}
+    cont = {}
+    n_requests = 0
+    while True:
+        n_requests += 1
+        res = session.get(api_url, params={**base_params, **cont}, headers=HEADERS, timeout=TIMEOUT)
+        res.raise_for_status()
+        data = res.json()
+        query = data.get("query", {})
+
+        # 입력 제목의 정규화(밑줄, 대소문자)와 리다이렉트를 따라 최종 제목을 기록
+        for key in ("normalized", "redirects"):
+            for item in query.get(key, []):
+                for original, current in title_map.items():
+                    if current == item["from"]:
+                        title_map[original] = item["to"]
+
+        # 'continue' 응답에서는 같은 페이지의 목록 속성이 나뉘어 오므로 페이지별로 합침
+        for page in query.get("pages", []):
+            merged = pages.setdefault(page["title"], {})
+            for field, value in page.items():
+                if isinstance(value, list):
+                    merged.setdefault(field, []).extend(value)
+                else:
+                    merged[field] = value
+
+        if "continue" not in data:
+            break
+        cont = data["continue"]
+        time.sleep(REQUEST_DELAY)
+
+    return list(pages.values()), title_map, n_requests
+
+
+def fetch_redirects(titles, session=None, api_url=API_URL):
+    """
+    각 문서로 넘어오는 리다이렉트 제목 목록을 가져옵니다.
+
+    Returns:
+        dict: 입력 제목 -> 리다이렉트 제목 리스트
+    """
+    session = session or requests.Session()
+    redirects = {}
+    for batch in chunked(list(dict.fromkeys(titles))):
+        pages, title_map, _ = query_titles(session, batch, {"prop": "redirects", "rdlimit": "max", "rdnamespace": 0}, api_url)
+        by_title = {page["title"]: [r["title"] for r in page.get("redirects", [])] for page in pages}
+        for original, final in title_map.items():
+            redirects[original] = by_title.get(final, [])
+        time.sleep(REQUEST_DELAY)
+    return redirects
+
+
+def fetch_pages(titles, cache=None, session=None, api_url=API_URL, refresh=False):
+    """
+    문서 위키텍스트, 본문 링크, 리비전 ID를 50개씩 묶어 가져와 캐시에 저장합니다.
+
+    본문 전체 텍스트를 주는 prop=extracts는 요청당 문서 1개만 반환하므로,
+    요청당 50개 문서를 받을 수 있는 prop=revisions(위키텍스트)를 사용하고
+    본문 텍스트는 wiki_pages.wikitext_to_text로 만듭니다.
+
+    Args:
+        titles (list): 문서 제목 목록
+        cache (PageCache): 저장할 캐시 (기본: data/cache/pages)
+        refresh (bool): True면 캐시에 있는 문서도 다시 가져옴
+
+    Returns:
+        int: API 요청 수
+    """
+    cache = cache or PageCache()
+    session = session or requests.Session()
+    titles = [title for title in dict.fromkeys(titles) if refresh or title not in cache]
+    params = {
+        "prop": "revisions|links",
+        "rvprop": "ids|content",
+        "rvslots": "main",
+        "plnamespace": 0,
+        "pllimit": "max",
+    }
+
+    n_requests = 0
+    for n_batch, batch in enumerate(chunked(titles), start=1):
+        pages, title_map, batch_requests = query_titles(session, batch, params, api_url)
+        n_requests += batch_requests
+        by_title = {page["title"]: page for page in pages}
+        for original, final in title_map.items():
+            page = by_title.get(final)
+            if page is None or page.get("missing") or page.get("invalid") or not page.get("revisions"):
+                cache.put(original, {"title": final, "missing": True})
+                continue
+            revision = page["revisions"][-1]
+            cache.put(original, {
+                "title": page["title"],
+                "pageid": page.get("pageid"),
+                "revid": revision.get("revid"),
+                "wikitext": revision["slots"]["main"].get("content", ""),
+                "links": list(dict.fromkeys(link["title"] for link in page.get("links", []))),
+            })
+        print(f"문서 가져오기: {min(n_batch * MAX_TITLES_PER_REQUEST, len(titles))}/{len(titles)}")
+        time.sleep(REQUEST_DELAY)
+    return n_requests
+
+
+def fetch_latest_revids(titles, session=None, api_url=API_URL):
+    """
+    문서별 최신 리비전 ID를 50개씩 묶어 조회합니다 (prop=info, 본문은 받지 않음).
+
+    Returns:
+        dict: 입력 제목 -> 최신 리비전 ID (문서가 없으면 None)
+    """
+    session = session or requests.Session()
+    revids = {}
+    for batch in chunked(list(dict.fromkeys(titles))):
+        pages, title_map, _ = query_titles(session, batch, {"prop": "info"}, api_url)
+        by_title = {page["title"]: page.get("lastrevid") for page in pages if not page.get("missing")}
+        for original, final in title_map.items():
+            revids[original] = by_title.get(final)
+        time.sleep(REQUEST_DELAY)
+    return revids
+
+
+def fetch_entity_links(titles, languages, session=None, api_url=API_URL):
+    """
+    문서별 위키데이터 항목 ID(예: 'Q9312')와 다른 언어판 문서 제목을 50개씩 묶어 조회합니다
+    (prop=pageprops|langlinks). 항목 ID는 언어와 관계없는 표준 개체 ID로 사용합니다.
+
+    Args:
+        titles (list): 문서 제목 목록
+        languages (list): 가져올 언어 코드 목록
+
+    Returns:
+        dict: 입력 제목 -> {"qid": 항목 ID 또는 None, "langlinks": {언어: 제목}}
+    """
+    session = session or requests.Session()
+    languages = set(languages)
+    params = {"prop": "pageprops|langlinks", "ppprop": "wikibase_item", "lllimit": "max"}
+    entities = {}
+    for batch in chunked(list(dict.fromkeys(titles))):
+        pages, title_map, _ = query_titles(session, batch, params, api_url)
+        by_title = {page["title"]: page for page in pages if not page.get("missing")}
+        for original, final in title_map.items():
+            page = by_title.get(final, {})
+            entities[original] = {
+                "qid": page.get("pageprops", {}).get("wikibase_item"),
+                "langlinks": {
+                    link["lang"]: link["title"] for link in page.get("langlinks", []) if link["lang"] in languages
+                },
+            }
+        time.sleep(REQUEST_DELAY)
+    return entities
+
+
+def find_changed_titles(titles, cache, latest_revids):
+    """
+    캐시에 저장된 리비전 ID와 최신 리비전 ID를 비교하여 다시 가져올 문서 제목을 고릅니다.
+    캐시에 없는 문서, 수정된 문서, 삭제/이동되어 더 이상 없는 문서가 포함됩니다.
+    """
+    changed = []
+    for title in titles:
+        record = cache.get(title)
+        latest = latest_revids.get(title)
+        if record is None:
+            changed.append(title)
+        elif record.get("missing"):
+            if latest is not None:
+                changed.append(title)
+        elif record.get("revid") != latest:
+            changed.append(title)
+    return changed
+
+
+if __name__ == "__main__":
+    # 철학자 문서별 리다이렉트 목록을 수집하여 별칭 테이블용 CSV로 저장
+    encodings = ['utf-8', 'cp1252', 'latin1', 'iso-8859-1']
+    df = None
+    for encoding in encodings:
+        try:
+            df = pd.read_csv(PHILOSOPHERS_FILE, encoding=encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    if df is None:
+        print("오류: 지원되는 인코딩으로 파일을 읽을 수 없습니다")
+        exit(1)
+
+    df = df.dropna(subset=["Name"]).drop_duplicates(subset=["Name"])
+    df["Title"] = df["Wikipedia_Link"].apply(normalize_title)
+    df = df.dropna(subset=["Title"])
+    print(f"리다이렉트 수집 대상: {len(df)}개 문서 ({MAX_TITLES_PER_REQUEST}개씩 묶어서 요청)")
+
+    redirects = fetch_redirects(df["Title"].tolist())
+    rows = [
+        {"Name": name, "Redirect": redirect}
+        for name, title in zip(df["Name"], df["Title"])
+        for redirect in redirects.get(title, [])
+    ]
+    os.makedirs(os.path.dirname(REDIRECTS_FILE), exist_ok=True)
+    pd.DataFrame(rows, columns=["Name", "Redirect"]).to_csv(REDIRECTS_FILE, index=False, encoding='utf-8')
+    print(f"리다이렉트 저장 완료: {REDIRECTS_FILE} ({len(rows)}개)")
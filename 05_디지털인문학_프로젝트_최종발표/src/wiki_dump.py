@@ -0,0 +1,211 @@
+"""
+위키피디아 XML 덤프 오프라인 수집
+
+실시간 페이지 요청 대신 로컬 덤프(pages-articles*.xml.bz2 또는 샘플 .xml)에서
+철학자 문서만 골라 위키텍스트의 링크와 본문을 추출하고, 02_search_name_from_wiki.py와 같은
+추출 함수(build_extractors, 같은 MATCH_MODE)와 같은 출력 파일(mention_edges.csv, link_edges.csv)을 만듭니다.
+
+- multistream 덤프 + 색인 파일이 있으면: 색인에서 철학자 문서가 들어 있는 bz2 스트림만 골라
+  스트림 단위로 여러 프로세스가 압축 해제/파싱/매칭을 동시에 수행
+- 그 외(단일 스트림 덤프, 샘플 XML): iterparse로 순차 파싱하며 처리한 요소를 바로 비우고,
+  철학자 문서는 묶음 단위로 프로세스 풀에 넘겨 매칭 (대기 중인 묶음 수를 제한하여 메모리 일정)
+
+실행: 프로젝트 루트에서 `python src/wiki_dump.py [덤프 파일] [색인 파일]`
+"""
+import bz2
+import importlib
+import io
+import os
+import sys
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from mention_matcher import load_redirects
+from wiki_pages import TitleIndex, wikitext_links, wikitext_to_text
+
+DUMP_FILE = "data/raw/enwiki-latest-pages-articles-multistream.xml.bz2"
+INDEX_FILE = "data/raw/enwiki-latest-pages-articles-multistream-index.txt.bz2"
+
+N_WORKERS = os.cpu_count() or 1
+PAGE_BATCH_SIZE = 100          # 순차 모드에서 한 번에 프로세스에 넘기는 문서 수
+MAX_PENDING = N_WORKERS * 2    # 순차 모드에서 동시에 대기할 수 있는 묶음 수 (메모리 상한)
+STREAMS_PER_TASK = 8           # multistream 모드에서 작업 하나가 처리하는 bz2 스트림 수
+
+# 작업 프로세스별 추출 함수 (초기화 함수에서 한 번만 생성)
+_worker = {}
+
+
+def _local_name(tag):
+    """'{http://www.mediawiki.org/xml/export-0.10/}page' -> 'page'"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_pages(source):
+    """
+    XML 덤프에서 일반 문서(ns=0, 리다이렉트 제외)를 (제목, 위키텍스트)로 순차 반환합니다.
+    처리한 <page> 요소는 바로 비워 덤프 크기와 관계없이 메모리 사용량을 일정하게 유지합니다.
+    """
+    context = ET.iterparse(source, events=("start", "end"))
+    _, root = next(context)
+    for event, elem in context:
+        if event != "end" or _local_name(elem.tag) != "page":
+            continue
+        title, ns, text, is_redirect = None, None, None, False
+        for child in elem.iter():
+            name = _local_name(child.tag)
+            if name == "title":
+                title = child.text
+            elif name == "ns":
+                ns = child.text
+            elif name == "redirect":
+                is_redirect = True
+            elif name == "text":
+                text = child.text
+        if title and ns == "0" and not is_redirect:
+            yield title, text or ""
+        elem.clear()
+        root.clear()
+
+
+def open_dump(path):
+    """.bz2 덤프는 압축을 풀며 스트리밍으로 읽고, 그 외는 그대로 엽니다."""
+    return bz2.open(path, "rb") if path.endswith(".bz2") else open(path, "rb")
+
+
+def read_stream_ranges(index_path, title_index):
+    """
+    multistream 색인(오프셋:문서ID:제목)에서 철학자 문서가 들어 있는 bz2 스트림의
+    (시작, 끝) 바이트 범위 목록을 반환합니다. 끝이 None이면 파일 끝까지입니다.
+    """
+    offsets = []
+    wanted = set()
+    with bz2.open(index_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            offset, _, title = line.rstrip("\n").split(":", 2)
+            offset = int(offset)
+            if not offsets or offsets[-1] != offset:
+                offsets.append(offset)
+            if title_index.lookup(title) is not None:
+                wanted.add(offset)
+    ends = dict(zip(offsets, offsets[1:] + [None]))
+    return [(offset, ends[offset]) for offset in offsets if offset in wanted]
+
+
+def _init_worker(names, wiki_links, kinds, match_mode):
+    """작업 프로세스 초기화: 부모 프로세스의 MATCH_MODE로 02와 같은 추출 함수를 만듭니다."""
+    crawler = importlib.import_module("02_search_name_from_wiki")
+    crawler.MATCH_MODE = match_mode
+    _worker["title_index"] = TitleIndex(names, wiki_links, load_redirects())
+    _worker["extractors"] = crawler.build_extractors(names, wiki_links, kinds)
+
+
+def _match_page(source_name, wikitext):
+    """문서 하나에서 엣지 종류별 대상 철학자 목록을 구합니다 (출발 철학자 자신은 매칭 단계에서 제외)."""
+    page_text, links = wikitext_to_text(wikitext), wikitext_links(wikitext)
+    targets = {kind: extract(source_name, page_text, links) for kind, extract in _worker["extractors"].items()}
+    return source_name, targets
+
+
+def _process_pages(batch):
+    """순차 모드 작업: (철학자 이름, 위키텍스트) 묶음을 매칭"""
+    return [_match_page(source_name, wikitext) for source_name, wikitext in batch]
+
+
+def _process_streams(task):
+    """multistream 모드 작업: 덤프 파일의 bz2 스트림 범위들을 직접 읽어 압축 해제 후 파싱/매칭"""
+    dump_path, ranges = task
+    results = []
+    with open(dump_path, "rb") as f:
+        for start, end in ranges:
+            f.seek(start)
+            data = bz2.decompress(f.read() if end is None else f.read(end - start))
+            # 스트림은 <page> 조각들이므로 루트 요소로 감싸서 파싱 (마지막 스트림의 닫는 태그는 제거)
+            data = b"<mediawiki>" + data.replace(b"</mediawiki>", b"") + b"</mediawiki>"
+            for title, wikitext in iter_pages(io.BytesIO(data)):
+                source_name = _worker["title_index"].lookup(title)
+                if source_name is not None:
+                    results.append(_match_page(source_name, wikitext))
+    return results
+
+
+def ingest_multistream(dump_path, index_path, names, wiki_links, kinds, match_mode, n_workers=N_WORKERS):
+    """색인으로 필요한 스트림만 골라 병렬로 처리합니다."""
+    ranges = read_stream_ranges(index_path, TitleIndex(names, wiki_links, load_redirects()))
+    print(f"색인 확인 완료: 철학자 문서가 포함된 스트림 {len(ranges)}개")
+    tasks = [(dump_path, ranges[i:i + STREAMS_PER_TASK]) for i in range(0, len(ranges), STREAMS_PER_TASK)]
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(names, wiki_links, kinds, match_mode)) as executor:
+        for done, results in enumerate(executor.map(_process_streams, tasks), start=1):
+            yield from results
+            if done % 50 == 0 or done == len(tasks):
+                print(f"진행 중: {done}/{len(tasks)} 작업 완료")
+
+
+def ingest_sequential(dump_path, names, wiki_links, kinds, match_mode, n_workers=N_WORKERS):
+    """덤프 전체를 순차 파싱하고, 철학자 문서만 묶어서 병렬로 매칭합니다."""
+    title_index = TitleIndex(names, wiki_links, load_redirects())
+    scanned = 0
+    pending = []
+    batch = []
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(names, wiki_links, kinds, match_mode)) as executor, \
+            open_dump(dump_path) as f:
+        for title, wikitext in iter_pages(f):
+            scanned += 1
+            if scanned % 100000 == 0:
+                print(f"진행 중: 문서 {scanned}개 확인")
+            source_name = title_index.lookup(title)
+            if source_name is None:
+                continue
+            batch.append((source_name, wikitext))
+            if len(batch) >= PAGE_BATCH_SIZE:
+                pending.append(executor.submit(_process_pages, batch))
+                batch = []
+            # 대기 중인 묶음이 많으면 가장 오래된 결과부터 받아 메모리 사용량을 제한
+            while len(pending) >= MAX_PENDING:
+                yield from pending.pop(0).result()
+        if batch:
+            pending.append(executor.submit(_process_pages, batch))
+        for future in pending:
+            yield from future.result()
+    print(f"덤프 확인 완료: 문서 {scanned}개")
+
+
+def main():
+    dump_path = sys.argv[1] if len(sys.argv) > 1 else DUMP_FILE
+    index_path = sys.argv[2] if len(sys.argv) > 2 else INDEX_FILE
+    if not os.path.exists(dump_path):
+        print(f"오류: 덤프 파일이 존재하지 않습니다: {dump_path}")
+        exit(1)
+
+    # 철학자 목록 로딩, 엣지 종류, 매칭 방식(MATCH_MODE)과 결과 저장은 02_search_name_from_wiki.py와 동일하게 사용
+    crawler = importlib.import_module("02_search_name_from_wiki")
+    names, wiki_links = crawler.load_philosophers()
+    kinds = ["mention", "link"] if crawler.EDGE_MODE == "both" else [crawler.EDGE_MODE]
+
+    if os.path.exists(index_path):
+        print(f"multistream 모드: {dump_path} (색인: {index_path}, 프로세스 {N_WORKERS}개)")
+        results = ingest_multistream(dump_path, index_path, names, wiki_links, kinds, crawler.MATCH_MODE)
+    else:
+        print(f"순차 모드: {dump_path} (매칭 프로세스 {N_WORKERS}개)")
+        results = ingest_sequential(dump_path, names, wiki_links, kinds, crawler.MATCH_MODE)
+
+    page_targets = {}
+    for source_name, targets in results:
+        page_targets.setdefault(source_name, targets)
+    print(f"처리한 철학자 문서: {len(page_targets)}개 / {len(names)}명")
+
+    # 02와 같은 순서(철학자 목록 순서)로 엣지를 정리하여 저장
+    for kind in kinds:
+        mention_counts = defaultdict(int)
+        edges = []
+        for source_name in names:
+            # 대상 목록은 매칭 단계에서 자기 자신을 이미 제외함
+            for target_name in page_targets.get(source_name, {}).get(kind, []):
+                mention_counts[target_name] += 1
+                edges.append((source_name, target_name))
+        _, centrality_path, edges_path = crawler.save_results(kind, names, mention_counts, edges)
+        print(f"[{kind}] 저장 완료: {edges_path} ({len(edges)}개 연결), {centrality_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+다국어 위키피디아 샤드 수집과 다층(multilayer) 그래프 병합
+
+영어판 철학자 문서의 언어 간 링크(langlinks)와 위키데이터 항목 ID(예: 'Q9312')로
+언어별 문서 제목을 찾은 뒤, 언어마다 독립된 샤드로 처리합니다.
+
+- 샤드 = 언어 하나: 자체 문서 캐시(data/cache/pages_<언어>), 자체 매처, 자체 엣지 저장소
+  (data/processed/multilang/<언어>/) 를 가지며 샤드끼리 공유하는 상태가 없어 프로세스별로 동시에 실행
+- 매처: 띄어쓰기가 있는 언어(de, fr)는 MentionMatcher(토큰 매칭), 띄어쓰기/조사 때문에 토큰 경계가
+  맞지 않는 언어(ko, zh, ja)는 이름 전체를 하나로 묶은 정규식으로 한 번에 찾는 SubstringMatcher
+- 병합: 모든 샤드의 엣지를 표준 개체 ID(위키데이터 항목 ID)로 모아 Layer(언어) 컬럼을 붙인
+  multilayer_edges.csv와 언어별 In-Degree를 담은 multilayer_nodes.csv로 저장
+  (영어판 결과 data/processed/*_edges.csv가 있으면 'en' 층으로 함께 병합)
+
+실행: 프로젝트 루트에서 `python src/wiki_multilang.py [언어 ...]` (기본: de fr ko zh)
+"""
+import importlib
+import os
+import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from mention_matcher import MentionMatcher, build_alias_table
+from wiki_api import api_url_for, fetch_entity_links, fetch_pages
+from wiki_pages import PageCache, TitleIndex, normalize_title, wikitext_to_text
+
+LANGUAGES = ["de", "fr", "ko", "zh"]
+ENTITIES_FILE = "data/raw/philosopher_entities.csv"  # 개체 ID, 영어 이름, 언어, 문서 제목
+MULTILANG_DIR = "data/processed/multilang"
+CACHE_DIR_TEMPLATE = "data/cache/pages_{lang}"
+
+# 단어 사이 띄어쓰기가 없거나 이름 뒤에 조사가 붙는 언어 (토큰 대신 부분 문자열로 매칭)
+SUBSTRING_LANGUAGES = frozenset({"ko", "zh", "ja"})
+MIN_LOCAL_NAME_LENGTH = 2   # 부분 문자열 매칭에서 이보다 짧은 이름은 오탐이 많아 제외
+
+_DISAMBIGUATION = re.compile(r"\s*[(（][^()（）]*[)）]\s*$")  # 'Kant (Philosoph)', '康德（哲学家）'
+_NAME_PARTS = re.compile(r"[\s·・]+")                       # '이마누엘 칸트', '伊曼努尔·康德'
+
+
+def entity_id(qid, en_title):
+    """위키데이터 항목 ID가 없으면 영어판 제목으로 대신합니다."""
+    return qid or f"en:{en_title}"
+
+
+def build_entity_table(names, wiki_links, languages):
+    """
+    영어판 문서의 언어 간 링크를 조회하여 개체 테이블을 만듭니다.
+
+    Returns:
+        DataFrame: Entity_ID, Name(영어 목록 이름), Lang, Title ('en' 행 포함)
+    """
+    titles = {name: normalize_title(url) for name, url in zip(names, wiki_links)}
+    titles = {name: title for name, title in titles.items() if title}
+    entities = fetch_entity_links(list(titles.values()), languages)
+
+    rows = []
+    seen = set()
+    for name, title in titles.items():
+        entity = entities.get(title, {})
+        eid = entity_id(entity.get("qid"), title)
+        # 같은 문서를 가리키는 목록 항목이 여럿이면 처음 항목만 사용
+        if eid in seen:
+            continue
+        seen.add(eid)
+        rows.append({"Entity_ID": eid, "Name": name, "Lang": "en", "Title": title})
+        for lang, local_title in sorted(entity.get("langlinks", {}).items()):
+            rows.append({"Entity_ID": eid, "Name": name, "Lang": lang, "Title": local_title})
+    return pd.DataFrame(rows, columns=["Entity_ID", "Name", "Lang", "Title"])
+
+
+def load_entity_table(crawler, languages, refresh=False):
+    """저장된 개체 테이블을 로드하고, 없거나 요청한 언어가 빠져 있으면 새로 조회합니다."""
+    if not refresh and os.path.exists(ENTITIES_FILE):
+        df = pd.read_csv(ENTITIES_FILE, encoding="utf-8")
+        if set(languages) <= set(df["Lang"]):
+            return df
+    names, wiki_links = crawler.load_philosophers()
+    print(f"언어 간 링크 조회: {len(names)}개 문서, 언어 {', '.join(languages)}")
+    df = build_entity_table(names, wiki_links, languages)
+    os.makedirs(os.path.dirname(ENTITIES_FILE), exist_ok=True)
+    df.to_csv(ENTITIES_FILE, index=False, encoding="utf-8")
+    print(f"개체 테이블 저장 완료: {ENTITIES_FILE} ({df['Entity_ID'].nunique()}개 개체)")
+    return df
+
+
+def local_name(title):
+    """문서 제목에서 동음이의 구분용 괄호를 뗀 본문 표기 ('Kant (Philosoph)' -> 'Kant')"""
+    return _DISAMBIGUATION.sub("", title).strip()
+
+
+class SubstringMatcher:
+    """
+    띄어쓰기가 없는 언어용 매처. 모든 이름(과 성)을 긴 것부터 하나의 정규식으로 묶어
+    본문을 한 번만 훑습니다. 이름 뒤에 조사가 붙어도 ('칸트는') 찾을 수 있습니다.
+    """
+
+    def __init__(self, names):
+        """
+        Args:
+            names (list): 본문 표기 이름 목록 (목록 순서가 결과 순서)
+        """
+        self.names = list(dict.fromkeys(names))
+        aliases = {}
+        for owner, name in enumerate(self.names):
+            aliases.setdefault(name, owner)
+
+        # '이마누엘 칸트'의 '칸트'처럼 마지막 부분(성)은 다른 이름과 겹치지 않을 때만 별칭으로 사용
+        surname_owners = defaultdict(set)
+        for owner, name in enumerate(self.names):
+            parts = _NAME_PARTS.split(name)
+            if len(parts) > 1:
+                surname_owners[parts[-1]].add(owner)
+        for surname, owners in surname_owners.items():
+            if len(owners) == 1 and surname not in aliases:
+                aliases[surname] = next(iter(owners))
+
+        aliases = {alias: owner for alias, owner in aliases.items() if len(alias) >= MIN_LOCAL_NAME_LENGTH}
+        self._owner = aliases
+        ordered = sorted(aliases, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, ordered))) if ordered else None
+
+    def find_mentions(self, text):
+        """본문에서 언급된 이름 목록 (목록 순서 기준 정렬)"""
+        if self._pattern is None:
+            return []
+        found = {self._owner[match.group(0)] for match in self._pattern.finditer(text)}
+        return [self.names[owner] for owner in sorted(found)]
+
+
+def build_local_matcher(lang, names):
+    """언어에 맞는 매처를 만듭니다."""
+    if lang in SUBSTRING_LANGUAGES:
+        return SubstringMatcher(names)
+    table, _ = build_alias_table(names)
+    return MentionMatcher(table)
+
+
+def shard_paths(lang):
+    """샤드별 엣지 저장 경로 (엣지 종류 -> 경로)"""
+    shard_dir = f"{MULTILANG_DIR}/{lang}"
+    return {kind: f"{shard_dir}/{kind}_edges.csv" for kind in ("mention", "link")}
+
+
+def run_shard(lang, shard_rows, kinds):
+    """
+    언어 샤드 하나를 처리합니다: 문서 수집(캐시) -> 매칭 -> 샤드 엣지 저장.
+    다른 샤드와 공유하는 상태가 없어 별도 프로세스에서 실행됩니다.
+
+    Args:
+        lang (str): 언어 코드
+        shard_rows (list): (개체 ID, 문서 제목) 목록
+        kinds (list): 'mention', 'link'
+
+    Returns:
+        dict: 샤드 요약 (문서 수, 요청 수, 엣지 종류별 엣지 수)
+    """
+    entity_ids = [eid for eid, _ in shard_rows]
+    titles = [title for _, title in shard_rows]
+    names = [local_name(title) for title in titles]
+    name_to_entity = {}
+    for name, eid in zip(names, entity_ids):
+        name_to_entity.setdefault(name, eid)
+
+    cache = PageCache(CACHE_DIR_TEMPLATE.format(lang=lang))
+    n_requests = fetch_pages(titles, cache=cache, api_url=api_url_for(lang))
+
+    matcher = build_local_matcher(lang, names) if "mention" in kinds else None
+    title_index = TitleIndex(names, titles) if "link" in kinds else None
+
+    edges = {kind: [] for kind in kinds}
+    n_pages = 0
+    for source_id, title in shard_rows:
+        record = cache.get(title)
+        if record is None or record.get("missing"):
+            continue
+        n_pages += 1
+        targets = {}
+        if matcher is not None:
+            targets["mention"] = matcher.find_mentions(wikitext_to_text(record["wikitext"]))
+        if title_index is not None:
+            targets["link"] = title_index.link_targets(record["links"])
+        for kind, target_names in targets.items():
+            for target_id in dict.fromkeys(name_to_entity[name] for name in target_names):
+                if target_id != source_id:  # 자기 자신은 제외
+                    edges[kind].append((source_id, target_id))
+
+    paths = shard_paths(lang)
+    os.makedirs(os.path.dirname(paths["mention"]), exist_ok=True)
+    for kind, kind_edges in edges.items():
+        pd.DataFrame(kind_edges, columns=["Source", "Target"]).to_csv(paths[kind], index=False, encoding="utf-8")
+    return {"lang": lang, "pages": n_pages, "requests": n_requests, **{kind: len(e) for kind, e in edges.items()}}
+
+
+def load_english_layer(crawler, entities, kind):
+    """기존 영어판 결과(이름 기준 엣지)를 개체 ID 기준 엣지로 변환합니다. 없으면 None."""
+    edges_prefix, _ = crawler.OUTPUT_FILES[kind]
+    path = f"{crawler.PROCESSED_DIR}/{edges_prefix}.csv"
+    if not os.path.exists(path):
+        return None
+    name_to_entity = dict(zip(entities["Name"], entities["Entity_ID"]))
+    df = pd.read_csv(path)
+    df = pd.DataFrame({"Source": df["Source"].map(name_to_entity), "Target": df["Target"].map(name_to_entity)})
+    return df.dropna()
+
+
+def merge_shards(crawler, entities, languages, kinds):
+    """
+    샤드 엣지를 개체 ID 기준의 다층 그래프로 병합합니다.
+
+    Returns:
+        tuple: (엣지 DataFrame [Source, Target, Layer, Kind], 노드 DataFrame)
+    """
+    layers = []
+    for kind in kinds:
+        english = load_english_layer(crawler, entities, kind)
+        if english is not None:
+            layers.append(english.assign(Layer="en", Kind=kind))
+        for lang in languages:
+            path = shard_paths(lang)[kind]
+            if os.path.exists(path):
+                layers.append(pd.read_csv(path, encoding="utf-8").assign(Layer=lang, Kind=kind))
+    edges = pd.concat(layers, ignore_index=True) if layers else pd.DataFrame(columns=["Source", "Target", "Layer", "Kind"])
+    edges = edges.drop_duplicates()
+
+    nodes = entities.drop_duplicates(subset=["Entity_ID"])[["Entity_ID", "Name"]].set_index("Entity_ID")
+    nodes["Layers"] = entities.groupby("Entity_ID")["Lang"].nunique()
+    for (layer, kind), group in edges.groupby(["Layer", "Kind"]):
+        nodes[f"In_Degree_{kind}_{layer}"] = group["Target"].value_counts()
+    degree_columns = [column for column in nodes.columns if column.startswith("In_Degree_")]
+    nodes[degree_columns] = nodes[degree_columns].fillna(0).astype(int)
+    return edges, nodes.reset_index()
+
+
+def main():
+    languages = sys.argv[1:] or LANGUAGES
+    crawler = importlib.import_module("02_search_name_from_wiki")
+    kinds = ["mention", "link"] if crawler.EDGE_MODE == "both" else [crawler.EDGE_MODE]
+
+    # 1. 개체 테이블 (영어판 문서 -> 위키데이터 ID, 언어별 제목)
+    entities = load_entity_table(crawler, languages)
+
+    # 2. 언어별 샤드를 프로세스별로 동시에 처리 (언어마다 다른 서버라 요청 간격은 샤드 안에서만 지킴)
+    shard_rows = {
+        lang: list(zip(group["Entity_ID"], group["Title"]))
+        for lang, group in entities[entities["Lang"].isin(languages)].groupby("Lang")
+    }
+    with ProcessPoolExecutor(max_workers=max(len(shard_rows), 1)) as executor:
+        futures = [executor.submit(run_shard, lang, rows, kinds) for lang, rows in shard_rows.items()]
+        for future in futures:
+            summary = future.result()
+            counts = ", ".join(f"{kind} {summary[kind]}개" for kind in kinds)
+            print(f"[{summary['lang']}] 문서 {summary['pages']}개, API 요청 {summary['requests']}회, 엣지 {counts}")
+
+    # 3. 개체 ID 기준 다층 그래프로 병합
+    edges, nodes = merge_shards(crawler, entities, languages, kinds)
+    os.makedirs(MULTILANG_DIR, exist_ok=True)
+    edges_path = f"{MULTILANG_DIR}/multilayer_edges.csv"
+    nodes_path = f"{MULTILANG_DIR}/multilayer_nodes.csv"
+    edges.to_csv(edges_path, index=False, encoding="utf-8")
+    nodes.to_csv(nodes_path, index=False, encoding="utf-8")
+    print(f"다층 그래프 저장 완료: {edges_path} ({len(edges)}개 엣지, 층 {edges['Layer'].nunique()}개), {nodes_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+위키피디아 문서 파싱과 문서 제목 정규화
+
+- parse_page: 본문(mw-content-text)의 텍스트와 문서 링크(href)를 한 번의 파싱으로 추출
+- normalize_title: URL, '/wiki/...' 링크, 문서 제목을 같은 형태의 제목 키로 변환
+- wikitext_to_text / wikitext_links: 덤프·API로 받은 위키텍스트에서 본문과 링크 추출
+- TitleIndex: Wikipedia_Link 컬럼(과 리다이렉트)으로 만든 '제목 -> 철학자 이름' 해시 인덱스
+- PageCache: 가져온 문서(위키텍스트, 링크, 리비전 ID)를 제목별 JSON 파일로 보관하는 로컬 캐시
+"""
+import hashlib
+import json
+import os
+import re
+from urllib.parse import unquote, urlsplit
+
+from bs4 import BeautifulSoup
+
+PAGE_CACHE_DIR = "data/cache/pages"
+
+# 문서 본문이 아닌 이름공간 (링크 그래프에서 제외)
+NON_ARTICLE_NAMESPACES = frozenset({
+    'file', 'image', 'category', 'template', 'help', 'wikipedia', 'portal', 'special',
+    'talk', 'user', 'user talk', 'module', 'draft', 'mediawiki', 'wp', 'wikt', 'commons',
+})
+# 틀로 자동 생성되는 링크 묶음 (내비게이션 상자, 사이드바, 각주)
+LINK_EXCLUDE_SELECTOR = ".navbox, .vertical-navbox, .sidebar, .reflist, .references, .mw-editsection, .hatnote"
+
+_TEMPLATE = re.compile(r"\{\{[^{}]*\}\}")
+_TABLE = re.compile(r"\{\|.*?\|\}", re.S)
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_REF = re.compile(r"<ref[^>]*/>|<ref[^>]*>.*?</ref>", re.S | re.I)
+_TAG = re.compile(r"<[^>]+>")
+_LINK = re.compile(r"\[\[([^\[\]|]*)(?:\|([^\[\]]*))?\]\]")
+_EXTERNAL = re.compile(r"\[(?:https?:)?//[^\s\]]+\s?([^\]]*)\]")
+_EMPHASIS = re.compile(r"'{2,}")
+
+
+def normalize_title(link):
+    """
+    링크나 제목을 MediaWiki 제목 규칙에 맞춘 키로 변환합니다.
+    퍼센트 인코딩 해제, 밑줄 -> 공백, 앵커(#) 제거, 첫 글자 대문자. 문서가 아니면 None.
+
+    예: '/wiki/Immanuel_Kant#Ethics' -> 'Immanuel Kant'
+    """
+    if not isinstance(link, str) or not link.strip():
+        return None
+    link = link.strip()
+    if link.startswith(("http://", "https://", "//")):
+        parts = urlsplit(link)
+        if not parts.netloc.endswith("wikipedia.org"):
+            return None
+        link = parts.path
+    if link.startswith("/wiki/"):
+        link = link[len("/wiki/"):]
+    elif link.startswith("/"):
+        return None  # '/w/index.php?...' 등 편집/검색 링크
+
+    title = unquote(link.split("#", 1)[0]).replace("_", " ")
+    title = " ".join(title.split())
+    if not title:
+        return None
+    if ":" in title and title.split(":", 1)[0].strip().lower() in NON_ARTICLE_NAMESPACES:
+        return None
+    return title[0].upper() + title[1:]
+
+
+def parse_page(html):
+    """
+    HTML에서 본문 텍스트와 본문 안의 문서 링크를 추출합니다.
+
+    Returns:
+        tuple: (본문 텍스트, 본문 링크 href 리스트)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    main_content = soup.find("div", {"id": "mw-content-text"}) or soup
+    text = main_content.get_text()
+
+    excluded = {id(a) for box in main_content.select(LINK_EXCLUDE_SELECTOR) for a in box.find_all("a")}
+    hrefs = [
+        a["href"] for a in main_content.find_all("a", href=True)
+        if a["href"].startswith("/wiki/") and id(a) not in excluded
+    ]
+    return text, hrefs
+
+
+def wikitext_links(wikitext):
+    """위키텍스트의 [[문서|표시 텍스트]] 링크 대상 목록"""
+    return [match.group(1) for match in _LINK.finditer(wikitext)]
+
+
+def _replace_link(match):
+    target, label = match.group(1), match.group(2)
+    # [[File:...]], [[Category:...]] 등 문서가 아닌 링크는 본문에서 제거
+    if normalize_title(target) is None:
+        return ""
+    return label if label is not None else target
+
+
+def wikitext_to_text(wikitext):
+    """위키텍스트에서 틀, 표, 각주, 태그를 제거하고 링크는 표시 텍스트로 바꾼 본문을 반환합니다."""
+    text = _COMMENT.sub("", wikitext)
+    text = _REF.sub("", text)
+    # 중첩된 틀은 안쪽부터 반복해서 제거
+    for _ in range(10):
+        text, n_subs = _TEMPLATE.subn("", text)
+        if n_subs == 0:
+            break
+    text = _TABLE.sub("", text)
+    # 그림 설명 안의 링크처럼 중첩된 링크도 안쪽부터 처리
+    for _ in range(3):
+        text, n_subs = _LINK.subn(_replace_link, text)
+        if n_subs == 0:
+            break
+    text = _EXTERNAL.sub(r"\1", text)
+    text = _TAG.sub("", text)
+    return _EMPHASIS.sub("", text)
+
+
+class TitleIndex:
+    """정규화된 문서 제목 -> 철학자 이름 해시 인덱스"""
+
+    def __init__(self, names, wiki_links, redirects=None):
+        """
+        Args:
+            names (list): 철학자 이름 목록
+            wiki_links (list): names와 같은 순서의 Wikipedia_Link 목록
+            redirects (dict): 이름 -> 리다이렉트 제목 목록 (리다이렉트 문서로 걸린 링크도 해석)
+        """
+        self.names = list(names)
+        self._order = {name: i for i, name in enumerate(self.names)}
+        self._by_title = {}
+        for name, link in zip(self.names, wiki_links):
+            title = normalize_title(link)
+            if title:
+                self._by_title.setdefault(title, name)
+        for name, titles in (redirects or {}).items():
+            if name not in self._order:
+                continue
+            for title in titles:
+                key = normalize_title(title)
+                if key:
+                    self._by_title.setdefault(key, name)
+
+    def __len__(self):
+        return len(self._by_title)
+
+    def lookup(self, link):
+        """링크/제목에 해당하는 철학자 이름 (없으면 None)"""
+        return self._by_title.get(normalize_title(link))
+
+    def link_targets(self, hrefs, exclude=None):
+        """
+        링크 목록이 가리키는 철학자 이름 목록 (중복 제거, 목록 순서 기준 정렬)
+
+        Args:
+            exclude (str): 결과에서 뺄 이름 (보통 출발 페이지의 철학자 자신)
+        """
+        found = set(map(self.lookup, hrefs))
+        found.discard(None)
+        found.discard(exclude)
+        return sorted(found, key=self._order.__getitem__)
+
+
+class PageCache:
+    """
+    문서 제목별 JSON 파일 캐시.
+    레코드 예: {"title": ..., "revid": ..., "wikitext": ..., "links": [...]} 또는 {"title": ..., "missing": true}
+    """
+
+    def __init__(self, cache_dir=PAGE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, title):
+        key = normalize_title(title) or title
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json")
+
+    def __contains__(self, title):
+        return os.path.exists(self._path(title))
+
+    def get(self, title):
+        """캐시된 레코드 (없으면 None)"""
+        path = self._path(title)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def put(self, title, record):
+        """레코드를 저장합니다. 임시 파일에 쓴 뒤 교체하여 중단되어도 파일이 깨지지 않습니다."""
+        path = self._path(title)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
@@ -0,0 +1,122 @@
+"""
+리비전 기반 증분 재수집
+
+전체 문서를 다시 받지 않고, 캐시(data/cache/pages)에 저장된 리비전 ID와 위키피디아의 최신 리비전 ID를
+50개씩 묶어 비교한 뒤 바뀐 문서만 다시 가져와 매칭합니다. 바뀐 문서에서 나가는 엣지만 교체하고
+추가/삭제된 엣지는 data/processed/edge_deltas.csv에 누적 기록합니다.
+02의 RECORD_CONTEXTS가 켜져 있으면 언급 문맥 색인(data/processed/mention_contexts)도 바뀐 문서만 새 본문으로 교체합니다.
+비용은 전체 문서 수가 아니라 수정된 문서 수에 비례합니다 (리비전 확인 요청: 문서 50개당 1회).
+
+실행: 프로젝트 루트에서 `python src/wiki_recrawl.py` (02_search_name_from_wiki.py의 EDGE_MODE를 따름)
+"""
+import importlib
+import os
+from collections import Counter
+from datetime import datetime
+
+import pandas as pd
+
+from mention_context import MentionContextBuilder
+from wiki_api import fetch_latest_revids, fetch_pages, find_changed_titles
+from wiki_pages import PageCache, normalize_title, wikitext_to_text
+
+DELTAS_FILE = "data/processed/edge_deltas.csv"
+
+
+def load_edge_store(crawler, kind):
+    """저장된 엣지 리스트를 로드합니다. 없으면 빈 리스트."""
+    edges_prefix, _ = crawler.OUTPUT_FILES[kind]
+    path = f"{crawler.PROCESSED_DIR}/{edges_prefix}.csv"
+    if not os.path.exists(path):
+        return []
+    df = pd.read_csv(path)
+    return list(zip(df["Source"], df["Target"]))
+
+
+def apply_edge_deltas(edges, new_targets, names):
+    """
+    바뀐 문서(new_targets의 키)에서 나가는 엣지를 새 매칭 결과로 교체합니다.
+
+    Returns:
+        tuple: (갱신된 엣지 리스트, [(출발, 대상, +1/-1)] 변경 목록)
+    """
+    old_targets = {}
+    for source, target in edges:
+        if source in new_targets:
+            old_targets.setdefault(source, set()).add(target)
+
+    deltas = []
+    for source, targets in new_targets.items():
+        before = old_targets.get(source, set())
+        after = set(targets)
+        deltas += [(source, target, 1) for target in sorted(after - before)]
+        deltas += [(source, target, -1) for target in sorted(before - after)]
+
+    kept = [(source, target) for source, target in edges if source not in new_targets]
+    added = [(source, target) for source, targets in new_targets.items() for target in targets]
+    # 02와 같은 순서(철학자 목록 순서)로 정렬하여 저장 결과가 전체 재수집과 같도록 유지
+    order = {name: i for i, name in enumerate(names)}
+    updated = sorted(kept + added, key=lambda edge: order.get(edge[0], len(order)))
+    return updated, deltas
+
+
+def main():
+    crawler = importlib.import_module("02_search_name_from_wiki")
+    names, wiki_links = crawler.load_philosophers()
+    kinds = ["mention", "link"] if crawler.EDGE_MODE == "both" else [crawler.EDGE_MODE]
+
+    titles = {name: normalize_title(url) for name, url in zip(names, wiki_links)}
+    titles = {name: title for name, title in titles.items() if title}
+    cache = PageCache()
+
+    # 1. 최신 리비전 ID를 일괄 조회하여 바뀐 문서만 선택
+    latest_revids = fetch_latest_revids(list(titles.values()))
+    changed = set(find_changed_titles(list(titles.values()), cache, latest_revids))
+    changed_names = [name for name, title in titles.items() if title in changed]
+    print(f"변경된 문서: {len(changed_names)}개 / 전체 {len(titles)}개")
+    if not changed_names:
+        print("변경 사항이 없습니다.")
+        return
+
+    # 2. 바뀐 문서만 다시 가져와 매칭
+    n_requests = fetch_pages([titles[name] for name in changed_names], cache=cache, refresh=True)
+    print(f"API 요청 {n_requests}회로 변경 문서 재수집 완료")
+    contexts = None
+    if crawler.RECORD_CONTEXTS and "mention" in kinds and crawler.MATCH_MODE == "alias":
+        # 기존 색인에 이어서 쓰고, 바뀐 문서의 언급 위치만 새 본문 기준으로 교체
+        contexts = MentionContextBuilder(names, resume=True)
+    extractors = crawler.build_extractors(names, wiki_links, kinds, contexts)
+
+    new_targets = {kind: {} for kind in kinds}
+    for name in changed_names:
+        record = cache.get(titles[name])
+        page_text, hrefs = ("", []) if record.get("missing") else (wikitext_to_text(record["wikitext"]), record["links"])
+        for kind, extract in extractors.items():
+            # 자기 자신은 추출 단계에서 제외됨
+            new_targets[kind][name] = extract(name, page_text, hrefs)
+
+    # 3. 저장된 엣지에 변경분만 반영하고 변경 기록을 누적
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    delta_rows = []
+    for kind in kinds:
+        edges, deltas = apply_edge_deltas(load_edge_store(crawler, kind), new_targets[kind], names)
+        mention_counts = Counter(target for _, target in edges)
+        _, centrality_path, edges_path = crawler.save_results(kind, names, mention_counts, edges)
+        n_added = sum(1 for *_, change in deltas if change > 0)
+        print(f"[{kind}] 엣지 추가 {n_added}개, 삭제 {len(deltas) - n_added}개 -> {edges_path} (총 {len(edges)}개)")
+        delta_rows += [
+            {"Date": timestamp, "Kind": kind, "Source": source, "Target": target, "Change": change}
+            for source, target, change in deltas
+        ]
+
+    if delta_rows:
+        write_header = not os.path.exists(DELTAS_FILE)
+        pd.DataFrame(delta_rows).to_csv(DELTAS_FILE, mode="a", header=write_header, index=False, encoding="utf-8")
+        print(f"엣지 변경 기록 저장 완료: {DELTAS_FILE} ({len(delta_rows)}건)")
+    if contexts is not None:
+        print(f"언급 문맥 색인 갱신 완료: {contexts.save()}")
+        contexts.close()
+
+
+if __name__ == "__main__":
+    main()